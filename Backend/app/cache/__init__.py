@@ -0,0 +1,29 @@
+"""Caching of scraped results"""
+
+from app.cache.result_cache import PlatformResultCache, FRESH, STALE, MISS, EMPTY, FAILED
+from app.cache.sqlite_store import SQLiteCacheStore
+from app.cache.query_log import QueryLog
+from app.cache.comparison_memo import ComparisonMemo, fingerprint_products
+from app.cache.catalog import ProductCatalog, product_id, normalize_product_id
+from app.cache.suggest_index import SuggestIndex
+from app.cache.price_history import PriceHistory
+from app.cache.watch_list import WatchList
+
+__all__ = [
+    "PlatformResultCache",
+    "FRESH",
+    "STALE",
+    "MISS",
+    "EMPTY",
+    "FAILED",
+    "SQLiteCacheStore",
+    "QueryLog",
+    "ComparisonMemo",
+    "fingerprint_products",
+    "ProductCatalog",
+    "product_id",
+    "normalize_product_id",
+    "SuggestIndex",
+    "PriceHistory",
+    "WatchList",
+]
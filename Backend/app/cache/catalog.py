@@ -0,0 +1,622 @@
+# app/cache/catalog.py
+"""
+Persistent product catalog on SQLite
+Remembers every scraped product by its platform-native ID, which products
+were matched across platforms, and the comparison each query produced
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from urllib.parse import urlsplit, parse_qs
+from app.config import (
+    logger,
+    CATALOG_PATH,
+    CATALOG_FRESH_S,
+    CATALOG_QUERY_TTL_S,
+    SEARCH_INDEX_FRESH_S,
+)
+from app.cache.sqlite_store import encode_value, decode_value
+from app.core.price_utils import extract_price, is_price_valid_for_match
+from app.core.text_utils import normalize_text, canonicalize_query
+
+# Platform product ID patterns, tried in order against the link path
+PRODUCT_ID_PATTERNS = {
+    "amazon": [re.compile(r"/(?:dp|gp/product|gp/aw/d)/([A-Z0-9]{10})(?:[/?]|$)", re.IGNORECASE)],
+    "flipkart": [re.compile(r"/p/(itm[0-9a-z]+)", re.IGNORECASE)],
+    "croma": [re.compile(r"/p/(\d+)")],
+    "reliancedigital": [re.compile(r"/p/(\d+)"), re.compile(r"-(\d{6,})/?$")],
+}
+
+# Comparison entry key of each platform's product (see ScrapingOrchestrator._compare)
+COMPARISON_PLATFORMS = ("flipkart", "amazon", "croma", "reliancedigital")
+
+
+def product_id(platform: str, link: str | None) -> str | None:
+    """
+    Platform-native product ID from a product link
+    
+    Amazon ASIN (/dp/), Flipkart pid (query parameter, else the itm ID in
+    the path), Croma and Reliance Digital product codes.
+    
+    Args:
+        platform: Platform the link belongs to
+        link: Product link as scraped
+    
+    Returns:
+        str: Product ID, or None if the link carries none
+    
+    Example:
+        >>> product_id("amazon", "https://www.amazon.in/Apple-iPhone-15/dp/B0CHX1W1XY/ref=sr_1_1")
+        'B0CHX1W1XY'
+    """
+    if not link or link == "N/A":
+        return None
+    try:
+        parts = urlsplit(link)
+    except ValueError:
+        return None
+    
+    if platform == "flipkart":
+        pid = parse_qs(parts.query).get("pid")
+        if pid and pid[0]:
+            return normalize_product_id(platform, pid[0])
+    for pattern in PRODUCT_ID_PATTERNS.get(platform, []):
+        match = pattern.search(parts.path)
+        if match:
+            return normalize_product_id(platform, match.group(1))
+    return None
+
+
+def normalize_product_id(platform: str, pid: str) -> str:
+    """
+    Product ID as the catalog keys it (ASINs and Flipkart pids uppercased)
+    
+    Example:
+        >>> normalize_product_id("amazon", " b0chx1w1xy")
+        'B0CHX1W1XY'
+    """
+    pid = pid.strip()
+    if platform == "amazon" or (platform == "flipkart" and not pid.lower().startswith("itm")):
+        return pid.upper()
+    return pid
+
+
+def _search_rowid(platform: str, pid: str) -> int:
+    """Stable full-text index row ID of a product (positive 63-bit hash)"""
+    digest = hashlib.blake2b(f"{platform}:{pid}".encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") & 0x7FFFFFFFFFFFFFFF
+
+
+def fts_query(query: str) -> str | None:
+    """
+    FTS5 match expression for a user query: every token, each as a prefix
+    
+    Example:
+        >>> fts_query("Apple iPhone 15 128 GB")
+        '"iphone"* "15"* "128gb"*'
+    """
+    tokens = canonicalize_query(query)[1].split()
+    if not tokens:
+        return None
+    return " ".join('"' + token.replace('"', '""') + '"*' for token in tokens)
+
+
+class ProductCatalog:
+    """
+    Products seen by each scraper, their match links and per-query comparisons
+    
+    - products: latest scraped (or refreshed) data of each product, keyed
+      by (platform, native ID), with the time it was last seen
+    - matches: Flipkart reference product -> product matched on another
+      platform, with score and how often the match was confirmed
+    - comparisons: per (query, validate_prices), the products each
+      comparison entry was built from
+    - product_search: FTS5 index over the normalized titles of all products
+    
+    A recorded comparison can be answered again from the catalog, with
+    every product's latest price, while all of its products were seen
+    within CATALOG_FRESH_S and the query's product set is younger than
+    CATALOG_QUERY_TTL_S. Same concurrency model as SQLiteCacheStore (WAL,
+    one connection per thread).
+    """
+    
+    def __init__(self, path: str = CATALOG_PATH):
+        """Open (or create) the catalog at `path`"""
+        self.path = path
+        
+        self._local = threading.local()
+        self._conns: list[sqlite3.Connection] = []
+        self._conns_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "stale": 0, "products_seen": 0, "errors": 0}
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        conn = self._conn()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS products (
+                platform TEXT NOT NULL,
+                product_id TEXT NOT NULL,
+                product BLOB NOT NULL,
+                price INTEGER NOT NULL,
+                last_seen REAL NOT NULL,
+                PRIMARY KEY (platform, product_id)
+            ) WITHOUT ROWID
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS matches (
+                anchor_id TEXT NOT NULL,
+                platform TEXT NOT NULL,
+                product_id TEXT NOT NULL,
+                score REAL NOT NULL,
+                confirmed INTEGER NOT NULL,
+                confirmed_at REAL NOT NULL,
+                PRIMARY KEY (anchor_id, platform, product_id)
+            ) WITHOUT ROWID
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS matches_product ON matches (platform, product_id)")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS comparisons (
+                query_key TEXT NOT NULL,
+                validate_prices INTEGER NOT NULL,
+                entries TEXT NOT NULL,
+                recorded_at REAL NOT NULL,
+                PRIMARY KEY (query_key, validate_prices)
+            ) WITHOUT ROWID
+        """)
+        # Row IDs are hashes of (platform, product_id), so a re-seen product
+        # replaces its own row; prefix indexes make short prefixes cheap
+        conn.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS product_search USING fts5(
+                title,
+                platform UNINDEXED,
+                product_id UNINDEXED,
+                tokenize = 'unicode61 remove_diacritics 2',
+                prefix = '2 3'
+            )
+        """)
+        self._backfill_search(conn)
+        logger.info(f"Product catalog ready at {path}")
+    
+    def _backfill_search(self, conn: sqlite3.Connection):
+        """Index products recorded before the search index existed"""
+        if conn.execute("SELECT 1 FROM product_search LIMIT 1").fetchone() is not None:
+            return
+        rows = conn.execute("SELECT platform, product_id, product FROM products").fetchall()
+        if not rows:
+            return
+        conn.executemany(
+            "INSERT OR REPLACE INTO product_search (rowid, title, platform, product_id) VALUES (?, ?, ?, ?)",
+            [
+                (_search_rowid(platform, pid), normalize_text(decode_value(blob).get("title", "")), platform, pid)
+                for platform, pid, blob in rows
+            ]
+        )
+        logger.info(f"Indexed {len(rows)} catalog products for search")
+    
+    def _conn(self) -> sqlite3.Connection:
+        """Per-thread connection configured for concurrent multi-process use"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            self._local.conn = conn
+            with self._conns_lock:
+                self._conns.append(conn)
+        return conn
+    
+    def _count(self, name: str, amount: int = 1):
+        with self._lock:
+            self._counters[name] += amount
+    
+    def record_products(self, platform: str, products: list[dict], seen_at: float | None = None):
+        """
+        Upsert scraped products (products without an ID in their link are skipped)
+        
+        Args:
+            platform: Platform the products were scraped from
+            products: Scraped products
+            seen_at: Wall-clock time they were scraped (default: now)
+        """
+        seen_at = seen_at or time.time()
+        rows = []
+        titles = []
+        for product in products:
+            pid = product_id(platform, product.get("link"))
+            if pid:
+                rows.append((
+                    platform, pid, encode_value(product),
+                    extract_price(product.get("currentPrice")), seen_at
+                ))
+                titles.append((
+                    _search_rowid(platform, pid), normalize_text(product.get("title", "")), platform, pid
+                ))
+        if not rows:
+            return
+        conn = self._conn()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                "INSERT INTO products (platform, product_id, product, price, last_seen) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (platform, product_id) DO UPDATE SET "
+                "product = excluded.product, price = excluded.price, last_seen = excluded.last_seen "
+                "WHERE excluded.last_seen >= products.last_seen",
+                rows
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO product_search (rowid, title, platform, product_id) VALUES (?, ?, ?, ?)",
+                titles
+            )
+            conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            logger.warning(f"Catalog write failed for {platform}: {e}")
+            self._count("errors")
+            return
+        self._count("products_seen", len(rows))
+    
+    def update_product(self, platform: str, link: str, fields: dict):
+        """
+        Merge freshly read fields (e.g. from a product page refresh) into a known product
+        
+        The product only counts as seen again (last_seen, price) if the
+        fields carry a readable currentPrice.
+        
+        Args:
+            platform: Platform of the product
+            link: Product link
+            fields: Fields to overwrite (currentPrice, maxRetailPrice, inStock, ...)
+        """
+        pid = product_id(platform, link)
+        if not pid:
+            return
+        conn = self._conn()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT product FROM products WHERE platform = ? AND product_id = ?",
+                (platform, pid)
+            ).fetchone()
+            if row is not None:
+                product = {**decode_value(row[0]), **fields}
+                if extract_price(fields.get("currentPrice")):
+                    conn.execute(
+                        "UPDATE products SET product = ?, price = ?, last_seen = ? "
+                        "WHERE platform = ? AND product_id = ?",
+                        (encode_value(product), extract_price(product.get("currentPrice")),
+                         time.time(), platform, pid)
+                    )
+                else:
+                    # No price read: the old one is no fresher than before
+                    conn.execute(
+                        "UPDATE products SET product = ? WHERE platform = ? AND product_id = ?",
+                        (encode_value(product), platform, pid)
+                    )
+            conn.execute("COMMIT")
+        except (sqlite3.Error, ValueError) as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            logger.warning(f"Catalog update failed for {platform}/{pid}: {e}")
+            self._count("errors")
+    
+    def record_comparison(self, query_key: str, validate_prices: bool, results: list[dict]):
+        """
+        Remember the products behind a query's comparison and their match links
+        
+        Only comparisons whose every product has a platform ID are recorded,
+        so an answer from the catalog never silently drops an entry.
+        
+        Args:
+            query_key: Canonical query key
+            validate_prices: Flag the comparison was computed with
+            results: Comparison entries as returned by the pipeline
+        """
+        entries = []
+        for result in results:
+            entry = {}
+            for platform in COMPARISON_PLATFORMS:
+                product = result.get(platform)
+                if not product:
+                    continue
+                pid = product_id(platform, product.get("link"))
+                if pid is None:
+                    return
+                entry[platform] = [pid, result.get(f"{platform}_score")]
+            if "flipkart" not in entry:
+                return
+            entries.append(entry)
+        
+        now = time.time()
+        conn = self._conn()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for entry in entries:
+                anchor_id = entry["flipkart"][0]
+                for platform, (pid, score) in entry.items():
+                    if platform == "flipkart":
+                        continue
+                    conn.execute(
+                        "INSERT INTO matches (anchor_id, platform, product_id, score, confirmed, confirmed_at) "
+                        "VALUES (?, ?, ?, ?, 1, ?) "
+                        "ON CONFLICT (anchor_id, platform, product_id) DO UPDATE SET "
+                        "score = excluded.score, confirmed = confirmed + 1, confirmed_at = excluded.confirmed_at",
+                        (anchor_id, platform, pid, score or 0, now)
+                    )
+            conn.execute(
+                "INSERT OR REPLACE INTO comparisons (query_key, validate_prices, entries, recorded_at) "
+                "VALUES (?, ?, ?, ?)",
+                (query_key, int(validate_prices), json.dumps(entries), now)
+            )
+            conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            logger.warning(f"Catalog comparison write failed for '{query_key}': {e}")
+            self._count("errors")
+    
+    @staticmethod
+    def _select_products(conn: sqlite3.Connection, pairs: list[tuple[str, str]], columns: str) -> list[tuple]:
+        """(platform, product_id, *columns) rows for many products, a few statements in all"""
+        rows = []
+        for i in range(0, len(pairs), 250):
+            chunk = pairs[i:i + 250]
+            rows.extend(conn.execute(
+                f"SELECT platform, product_id, {columns} FROM products "
+                f"WHERE (platform, product_id) IN (VALUES {', '.join(['(?, ?)'] * len(chunk))})",
+                [value for pair in chunk for value in pair]
+            ).fetchall())
+        return rows
+    
+    def version(self, query_key: str, validate_prices: bool) -> tuple | None:
+        """
+        Version of the data answer() would rebuild a comparison from
+        
+        Changes when the comparison is re-recorded or any of its products is
+        re-seen or updated (e.g. by a product page refresh).
+        
+        Returns:
+            tuple: (recorded_at, newest last_seen of its products), or None
+                   if no comparison is recorded for the query
+        """
+        try:
+            conn = self._conn()
+            row = conn.execute(
+                "SELECT entries, recorded_at FROM comparisons WHERE query_key = ? AND validate_prices = ?",
+                (query_key, int(validate_prices))
+            ).fetchone()
+            if row is None:
+                return None
+            pairs = sorted({(p, pid) for entry in json.loads(row[0]) for p, (pid, _) in entry.items()})
+            seen = [last_seen for _, _, last_seen in self._select_products(conn, pairs, "last_seen")]
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"Catalog version read failed for '{query_key}': {e}")
+            return None
+        return row[1], max(seen, default=0.0)
+    
+    def answer(self, query_key: str, validate_prices: bool, max_age: float | None = None) -> list[dict] | None:
+        """
+        Rebuild a recorded comparison from the latest known product data
+        
+        Args:
+            query_key: Canonical query key
+            validate_prices: Flag the comparison is requested with
+            max_age: Only accept products seen within this many seconds
+                     (never more than CATALOG_FRESH_S)
+        
+        Returns:
+            list: Comparison entries (same shape as the pipeline's), or None
+                  if nothing is recorded or any product is stale
+        """
+        fresh_for = CATALOG_FRESH_S if max_age is None else min(max_age, CATALOG_FRESH_S)
+        now = time.time()
+        try:
+            conn = self._conn()
+            row = conn.execute(
+                "SELECT entries, recorded_at FROM comparisons WHERE query_key = ? AND validate_prices = ?",
+                (query_key, int(validate_prices))
+            ).fetchone()
+            if row is None:
+                self._count("misses")
+                return None
+            if now - row[1] > CATALOG_QUERY_TTL_S:
+                self._count("stale")
+                return None
+            
+            entries = json.loads(row[0])
+            wanted = sorted({(p, pid) for entry in entries for p, (pid, _) in entry.items()})
+            found = self._select_products(conn, wanted, "product, last_seen")
+            if len(found) < len(wanted) or any(now - last_seen > fresh_for for *_, last_seen in found):
+                self._count("stale")
+                return None
+            products = {(platform, pid): decode_value(blob) for platform, pid, blob, _ in found}
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"Catalog read failed for '{query_key}': {e}")
+            self._count("errors")
+            return None
+        
+        results = []
+        for entry in entries:
+            comparison = {}
+            for platform in COMPARISON_PLATFORMS:
+                pid, score = entry.get(platform, (None, None))
+                comparison[platform] = products[(platform, pid)] if pid else None
+                comparison[f"{platform}_score"] = score if pid else None
+            
+            # Prices may have moved since the comparison was recorded
+            prices = [
+                extract_price(comparison[p].get("currentPrice", "0"))
+                for p in COMPARISON_PLATFORMS if comparison[p]
+            ]
+            if validate_prices and len(prices) >= 2 and not is_price_valid_for_match(prices):
+                continue
+            results.append(comparison)
+        
+        self._count("hits")
+        return results
+    
+    def lookup(self, platform: str, pids: list[str]) -> dict[str, tuple[dict, float]]:
+        """
+        Latest copy of known products
+        
+        Args:
+            platform: Platform of the products
+            pids: Platform-native IDs
+        
+        Returns:
+            dict: {product_id: (product, last_seen)} for the products in the catalog
+        """
+        found = {}
+        try:
+            conn = self._conn()
+            for i in range(0, len(pids), 500):
+                chunk = pids[i:i + 500]
+                rows = conn.execute(
+                    f"SELECT product_id, product, last_seen FROM products "
+                    f"WHERE platform = ? AND product_id IN ({', '.join('?' * len(chunk))})",
+                    (platform, *chunk)
+                ).fetchall()
+                found.update((pid, (decode_value(blob), last_seen)) for pid, blob, last_seen in rows)
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"Catalog lookup failed for {platform}: {e}")
+        return found
+    
+    def matches_for(self, platform: str, pid: str) -> list[dict]:
+        """
+        Products matched with a product on other platforms, most confirmed first
+        
+        Args:
+            platform: Platform of the product
+            pid: Its platform-native ID
+        
+        Returns:
+            list: [{'platform', 'product_id', 'score', 'confirmed'}]
+        """
+        try:
+            conn = self._conn()
+            if platform == "flipkart":
+                rows = conn.execute(
+                    "SELECT platform, product_id, score, confirmed FROM matches "
+                    "WHERE anchor_id = ? ORDER BY confirmed DESC",
+                    (pid,)
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT 'flipkart', anchor_id, score, confirmed FROM matches "
+                    "WHERE platform = ? AND product_id = ? ORDER BY confirmed DESC",
+                    (platform, pid)
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"Catalog match lookup failed for {platform}/{pid}: {e}")
+            return []
+        return [
+            {"platform": p, "product_id": i, "score": score, "confirmed": confirmed}
+            for p, i, score, confirmed in rows
+        ]
+    
+    def search(
+        self,
+        query: str,
+        platform: str | None = None,
+        limit: int = 20,
+        offset: int = 0,
+        max_age: float | None = None
+    ) -> tuple[list[dict], int]:
+        """
+        Full-text search over every product the scrapers have returned
+        
+        Every query token must match a title word by prefix; results are
+        ranked by BM25, most recently seen first on ties, in a stable order
+        across pages. Only products seen within the freshness window are
+        returned.
+        
+        Args:
+            query: User search query
+            platform: Only products of this platform (None for all)
+            limit: Page size
+            offset: Results to skip (paging)
+            max_age: Only products seen within this many seconds
+                     (never more than SEARCH_INDEX_FRESH_S)
+        
+        Returns:
+            tuple: (page of products, each with 'platform' and 'lastSeen'
+                    wall-clock time, total number of fresh matches)
+        """
+        match = fts_query(query)
+        if match is None:
+            return [], 0
+        fresh_for = SEARCH_INDEX_FRESH_S if max_age is None else min(max_age, SEARCH_INDEX_FRESH_S)
+        
+        where = "product_search MATCH ? AND p.last_seen >= ?"
+        params = [match, time.time() - fresh_for]
+        if platform:
+            where += " AND product_search.platform = ?"
+            params.append(platform)
+        joined = (
+            "FROM product_search JOIN products p "
+            "ON p.platform = product_search.platform AND p.product_id = product_search.product_id "
+            f"WHERE {where}"
+        )
+        try:
+            conn = self._conn()
+            total = conn.execute(f"SELECT COUNT(*) {joined}", params).fetchone()[0]
+            rows = conn.execute(
+                f"SELECT p.platform, p.product, p.last_seen {joined} "
+                "ORDER BY bm25(product_search), p.last_seen DESC, p.product_id LIMIT ? OFFSET ?",
+                [*params, limit, offset]
+            ).fetchall() if total > offset else []
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"Catalog search failed for '{query}': {e}")
+            self._count("errors")
+            return [], 0
+        
+        results = [
+            {**decode_value(blob), "platform": row_platform, "lastSeen": last_seen}
+            for row_platform, blob, last_seen in rows
+        ]
+        return results, total
+    
+    def titles(self, limit: int) -> list[str]:
+        """Titles of the most recently seen products"""
+        try:
+            rows = self._conn().execute(
+                "SELECT product FROM products ORDER BY last_seen DESC LIMIT ?", (limit,)
+            ).fetchall()
+            return [decode_value(blob).get("title", "") for (blob,) in rows]
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"Catalog title scan failed: {e}")
+            return []
+    
+    def stats(self) -> dict:
+        """Answer counters and table sizes"""
+        try:
+            conn = self._conn()
+            sizes = {
+                table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ("products", "matches", "comparisons")
+            }
+        except sqlite3.Error:
+            sizes = {}
+        with self._lock:
+            return {**self._counters, **sizes, "path": self.path}
+    
+    def close(self):
+        """Close every thread's connection"""
+        with self._conns_lock:
+            conns, self._conns = self._conns, []
+        for conn in conns:
+            conn.close()
+        self._local.conn = None
+
+
+__all__ = ["ProductCatalog", "product_id", "normalize_product_id", "fts_query"]
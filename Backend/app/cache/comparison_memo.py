@@ -0,0 +1,133 @@
+# app/cache/comparison_memo.py
+"""
+Memo of computed comparisons keyed by platform result fingerprints
+Skips matching and formatting when a refresh scraped the same products again
+"""
+
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+from app.config import (
+    logger,
+    COMPARISON_MEMO_MAX_ENTRIES,
+    COMPARISON_MEMO_L2_TTL_S,
+)
+from app.core.text_utils import normalize_text
+
+
+def fingerprint_products(products: list[dict] | None) -> str:
+    """
+    Fingerprint of one platform's scraped result set
+    
+    Covers the normalized titles and prices, in order (order decides
+    which products lead the comparison).
+    
+    Args:
+        products: Scraped products, [] if none found, None if the platform failed
+    
+    Returns:
+        str: Short hex digest ("failed" / "empty" for those outcomes)
+    """
+    if products is None:
+        return "failed"
+    if not products:
+        return "empty"
+    
+    digest = hashlib.blake2b(digest_size=12)
+    for product in products:
+        digest.update(normalize_text(product.get("title", "")).encode("utf-8"))
+        digest.update(b"\x1f")
+        digest.update(str(product.get("currentPrice", "")).encode("utf-8"))
+        digest.update(b"\x1f")
+        digest.update(str(product.get("maxRetailPrice", "")).encode("utf-8"))
+        digest.update(b"\x1e")
+    return digest.hexdigest()
+
+
+class ComparisonMemo:
+    """
+    Bounded LRU of comparison results and the fingerprints they were built from
+    
+    A lookup only hits when every platform's fingerprint equals the one
+    recorded with the result. With an `l2` store (SQLiteCacheStore)
+    entries are shared by workers and survive restarts.
+    """
+    
+    def __init__(self, max_entries: int = COMPARISON_MEMO_MAX_ENTRIES, l2=None):
+        """Initialize empty memo"""
+        self.max_entries = max_entries
+        self.l2 = l2
+        
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()  # key -> (fingerprints, result)
+        self._counters = {"hits": 0, "misses": 0, "changed": 0, "stores": 0}
+    
+    @staticmethod
+    def _l2_key(key: tuple) -> str:
+        return "compare:" + ":".join(str(part) for part in key)
+    
+    def get(self, key: tuple, fingerprints: tuple[str, ...]) -> dict | None:
+        """
+        Previously computed result for `key` if built from the same fingerprints
+        
+        Args:
+            key: Comparison identity, e.g. (query, validate_prices)
+            fingerprints: Current per-platform fingerprints
+        
+        Returns:
+            dict: Deep copy of the stored result (callers may edit it), or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None and self.l2 is not None:
+            found = self.l2.get(self._l2_key(key))
+            if found is not None:
+                stored = found[0]
+                entry = (tuple(stored["fingerprints"]), stored["result"])
+                self._remember(key, entry)
+        
+        with self._lock:
+            if entry is None:
+                self._counters["misses"] += 1
+                return None
+            if entry[0] != fingerprints:
+                self._counters["changed"] += 1
+                self._counters["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._counters["hits"] += 1
+        logger.debug(f"Comparison memo hit for {key}")
+        return copy.deepcopy(entry[1])
+    
+    def _remember(self, key: tuple, entry: tuple):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def put(self, key: tuple, fingerprints: tuple[str, ...], result: dict):
+        """Record a computed result and the fingerprints it was built from (deep copied)"""
+        self._remember(key, (fingerprints, copy.deepcopy(result)))
+        with self._lock:
+            self._counters["stores"] += 1
+        if self.l2 is not None:
+            self.l2.set(
+                self._l2_key(key),
+                {"fingerprints": list(fingerprints), "result": result},
+                COMPARISON_MEMO_L2_TTL_S
+            )
+    
+    def stats(self) -> dict:
+        """Hit counters and short-circuit rate (share of comparisons reused)"""
+        with self._lock:
+            lookups = self._counters["hits"] + self._counters["misses"]
+            return {
+                **self._counters,
+                "short_circuit_rate": round(self._counters["hits"] / lookups, 3) if lookups else 0.0,
+                "entries": len(self._entries),
+            }
+
+
+__all__ = ["ComparisonMemo", "fingerprint_products"]
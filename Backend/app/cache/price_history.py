@@ -0,0 +1,502 @@
+# app/cache/price_history.py
+"""
+Columnar price history per product per platform
+Memory-mapped, append-only int32 segments, rolled up from raw to hourly to daily
+"""
+
+import asyncio
+import mmap
+import os
+import re
+import shutil
+import struct
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from app.config import (
+    logger,
+    HISTORY_DIR,
+    HISTORY_SEGMENT_POINTS,
+    HISTORY_HEARTBEAT_S,
+    HISTORY_RETENTION_S,
+    HISTORY_COMPACT_INTERVAL_S,
+    HISTORY_MAX_OPEN_SEGMENTS,
+    HISTORY_BADGE_WINDOW_S,
+)
+from app.core.price_utils import extract_price
+from app.cache.catalog import product_id
+
+try:
+    import fcntl  # serializes appends across workers (POSIX only)
+except ImportError:
+    fcntl = None
+
+# Timestamps are stored as int32 seconds since 2024-01-01 00:00 UTC (good until 2092)
+EPOCH = 1704067200
+
+# Segment file: header, then HISTORY_SEGMENT_POINTS native int32 values per column
+HEADER = struct.Struct("<4sII")  # magic, capacity, count
+MAGIC = b"PHS1"
+COLUMNS = ("t", "price", "low", "high")  # raw points have price == low == high
+
+RAW = "raw"
+HOURLY = "hourly"
+DAILY = "daily"
+TIERS = (RAW, HOURLY, DAILY)
+BUCKET_S = {HOURLY: 3600, DAILY: 86400}
+
+# Product IDs become directory names
+SAFE_ID = re.compile(r"[A-Za-z0-9_-]{1,64}")
+
+
+class Segment:
+    """
+    One memory-mapped segment file of a series tier
+    
+    Columns are fixed-capacity int32 arrays; `count` in the header is
+    bumped after the values are written, so readers never see a partial
+    point. Points are kept in timestamp order.
+    """
+    
+    def __init__(self, path: str, capacity: int | None = None):
+        """
+        Open the segment at `path`, creating it when `capacity` is given
+        
+        Raises:
+            FileExistsError: Creating a segment another writer already created
+            ValueError: The file is not a segment
+        """
+        if capacity is not None:
+            with open(path, "xb") as f:
+                f.write(HEADER.pack(MAGIC, capacity, 0))
+                f.truncate(HEADER.size + 4 * capacity * len(COLUMNS))
+        self.path = path
+        self._file = open(path, "r+b")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0)
+        except (ValueError, OSError):
+            self._file.close()
+            raise
+        magic, self.capacity, _ = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or len(self._map) < HEADER.size + 4 * self.capacity * len(COLUMNS):
+            self.close()
+            raise ValueError(f"Not a price history segment: {path}")
+        
+        self._ints = memoryview(self._map)[HEADER.size:].cast("i")
+        self._columns = [
+            self._ints[i * self.capacity:(i + 1) * self.capacity]
+            for i in range(len(COLUMNS))
+        ]
+    
+    @property
+    def count(self) -> int:
+        return HEADER.unpack_from(self._map, 0)[2]
+    
+    def last(self) -> tuple | None:
+        """Newest point (t, price, low, high), or None if empty"""
+        count = self.count
+        if not count:
+            return None
+        return tuple(column[count - 1] for column in self._columns)
+    
+    def append(self, point: tuple) -> bool:
+        """
+        Append a point newer than the last one (older points are dropped)
+        
+        Returns:
+            bool: False if the segment is full
+        """
+        if fcntl is not None:
+            fcntl.flock(self._file, fcntl.LOCK_EX)
+        try:
+            count = self.count
+            if count >= self.capacity:
+                return False
+            if count and point[0] <= self._columns[0][count - 1]:
+                return True
+            for column, value in zip(self._columns, point):
+                column[count] = value
+            struct.pack_into("<I", self._map, 8, count + 1)
+            return True
+        finally:
+            if fcntl is not None:
+                fcntl.flock(self._file, fcntl.LOCK_UN)
+    
+    def rows(self, start: int, end: int) -> list[tuple]:
+        """Points with start <= t <= end, read only from that slice of each column"""
+        count = self.count
+        times = self._columns[0][:count]
+        lo = bisect_left(times, start)
+        hi = bisect_right(times, end)
+        if lo >= hi:
+            return []
+        return list(zip(*(column[lo:hi].tolist() for column in self._columns)))
+    
+    def close(self):
+        """Release the mapping and the file"""
+        for view in getattr(self, "_columns", []):
+            view.release()
+        if getattr(self, "_ints", None) is not None:
+            self._ints.release()
+        self._map.close()
+        self._file.close()
+
+
+class PriceHistory:
+    """
+    Price points per (platform, product ID), stored under HISTORY_DIR
+    
+    Layout: <platform>/<product id>/<tier>/<first t>.seg, tiers raw,
+    hourly and daily. Reading a range lists one series directory and
+    maps only the segments that overlap it.
+    
+    - Every scrape appends a raw point per product; an unchanged price
+      is recorded at most every HISTORY_HEARTBEAT_S
+    - A compaction pass every HISTORY_COMPACT_INTERVAL_S rolls complete
+      hours into the hourly tier and complete days into the daily tier
+      (close, low, high), then drops segments past HISTORY_RETENTION_S
+    """
+    
+    def __init__(self, root: str = HISTORY_DIR):
+        """Initialize store at `root` (created on first write)"""
+        self.root = root
+        
+        self._lock = threading.RLock()
+        self._open: OrderedDict = OrderedDict()  # path -> Segment, least recently used first
+        self._listings: dict[str, list[str]] = {}  # tier directory -> segment names (appends only)
+        self._task: asyncio.Task | None = None
+        self._counters = {
+            "recorded": 0,
+            "unchanged": 0,
+            "rolled_up": 0,
+            "segments_created": 0,
+            "segments_dropped": 0,
+            "compactions": 0,
+            "errors": 0,
+        }
+        self._last_compaction: dict = {}
+    
+    def _tier_dir(self, platform: str, pid: str, tier: str) -> str:
+        return os.path.join(self.root, platform, pid, tier)
+    
+    @staticmethod
+    def _list(directory: str) -> list[str]:
+        try:
+            return sorted(name for name in os.listdir(directory) if name.endswith(".seg"))
+        except FileNotFoundError:
+            return []
+    
+    def _segment(self, path: str) -> Segment:
+        """Open segment from the LRU, mapping it if needed"""
+        segment = self._open.pop(path, None)
+        if segment is None:
+            segment = Segment(path)
+        self._open[path] = segment
+        while len(self._open) > HISTORY_MAX_OPEN_SEGMENTS:
+            self._open.popitem(last=False)[1].close()
+        return segment
+    
+    def _forget(self, path: str):
+        """Close a segment that is about to be deleted"""
+        segment = self._open.pop(path, None)
+        if segment is not None:
+            segment.close()
+    
+    def _append(self, directory: str, point: tuple, heartbeat: bool = False) -> bool:
+        """Append a point to the tier stored in `directory` (False if skipped as unchanged)"""
+        names = self._listings.get(directory)
+        if names is None:
+            names = self._listings[directory] = self._list(directory)
+        
+        if names:
+            segment = self._segment(os.path.join(directory, names[-1]))
+            last = segment.last()
+            if heartbeat and last and last[1] == point[1] and point[0] - last[0] < HISTORY_HEARTBEAT_S:
+                return False
+            if segment.append(point):
+                return True
+            # Full: another worker may have started the next segment already
+            names = self._listings[directory] = self._list(directory)
+            if names and names[-1] != os.path.basename(segment.path):
+                if self._segment(os.path.join(directory, names[-1])).append(point):
+                    return True
+        
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{point[0]:010d}.seg")
+        try:
+            self._open[path] = Segment(path, capacity=HISTORY_SEGMENT_POINTS)
+            self._counters["segments_created"] += 1
+        except FileExistsError:
+            pass
+        self._listings[directory] = self._list(directory)
+        self._segment(path).append(point)
+        return True
+    
+    def record(self, platform: str, products: list[dict], at: float | None = None):
+        """
+        Append the current price of scraped products
+        
+        Args:
+            platform: Platform the products were scraped from
+            products: Scraped products (link and currentPrice are used)
+            at: Observation time (default: now)
+        """
+        t = int(at if at is not None else time.time()) - EPOCH
+        with self._lock:
+            for product in products:
+                pid = product_id(platform, product.get("link"))
+                price = extract_price(product.get("currentPrice"))
+                if not pid or not price or not SAFE_ID.fullmatch(pid):
+                    continue
+                try:
+                    recorded = self._append(self._tier_dir(platform, pid, RAW), (t, price, price, price), heartbeat=True)
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Price history write failed for {platform}/{pid}: {e}")
+                    self._counters["errors"] += 1
+                    continue
+                self._counters["recorded" if recorded else "unchanged"] += 1
+    
+    def _read_tier(self, directory: str, start: int, end: int) -> list[tuple]:
+        """Points of one tier with start <= t <= end (internal time)"""
+        names = self._list(directory)
+        firsts = [int(name[:-4]) for name in names]
+        rows = []
+        for i, name in enumerate(names):
+            if firsts[i] > end:
+                break
+            if i + 1 < len(names) and firsts[i + 1] <= start:
+                continue  # every point of this segment is older than the next one's first
+            try:
+                rows.extend(self._segment(os.path.join(directory, name)).rows(start, end))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping unreadable price history segment {name}: {e}")
+        return rows
+    
+    def _read(self, platform: str, pid: str, tier: str, start: int, end: int) -> list[tuple]:
+        """Tier points, continued with finer tiers past the last complete bucket"""
+        rows = self._read_tier(self._tier_dir(platform, pid, tier), start, end)
+        if tier == RAW:
+            return rows
+        covered = rows[-1][0] + BUCKET_S[tier] if rows else start
+        finer = TIERS[TIERS.index(tier) - 1]
+        return rows + self._read(platform, pid, finer, max(start, covered), end)
+    
+    @staticmethod
+    def resolution_for(start: float, now: float | None = None) -> str:
+        """Finest tier still retained at `start`"""
+        age = (now if now is not None else time.time()) - start
+        for tier in TIERS:
+            if age <= HISTORY_RETENTION_S[tier]:
+                return tier
+        return DAILY
+    
+    def history(
+        self,
+        platform: str,
+        pid: str,
+        start: float,
+        end: float | None = None,
+        resolution: str | None = None
+    ) -> dict:
+        """
+        Price series of one product in a time range
+        
+        Args:
+            platform: Platform of the product
+            pid: Platform product ID (catalog.product_id)
+            start: Range start (epoch seconds)
+            end: Range end (default: now)
+            resolution: "raw", "hourly" or "daily" (default: finest retained at `start`)
+        
+        Returns:
+            dict: {'resolution': str, 'series': {'t': [...], 'price': [...],
+                   'low': [...], 'high': [...]}}, columns aligned by index
+        
+        Example:
+            >>> store.history("amazon", "B0CHX1W1XY", time.time() - 86400)["series"]["price"][:3]
+            [69900, 69900, 67999]
+        """
+        end = end if end is not None else time.time()
+        resolution = resolution or self.resolution_for(start)
+        rows = []
+        if SAFE_ID.fullmatch(pid):
+            with self._lock:
+                rows = self._read(platform, pid, resolution, int(start) - EPOCH, int(end) - EPOCH)
+        
+        columns = list(zip(*rows)) if rows else [()] * len(COLUMNS)
+        series = {name: list(values) for name, values in zip(COLUMNS, columns)}
+        series["t"] = [t + EPOCH for t in series["t"]]
+        return {"resolution": resolution, "series": series}
+    
+    def summary(self, platform: str, pid: str, window_s: float = HISTORY_BADGE_WINDOW_S) -> dict | None:
+        """
+        Current, lowest and highest price over a window ("lowest in 30 days")
+        
+        Returns:
+            dict: {'current', 'lowest', 'lowest_at', 'highest', 'is_lowest',
+                   'window_days'}, or None without history
+        """
+        series = self.history(platform, pid, time.time() - window_s)["series"]
+        if not series["t"]:
+            return None
+        lowest_index = min(range(len(series["low"])), key=series["low"].__getitem__)
+        current = series["price"][-1]
+        return {
+            "current": current,
+            "lowest": series["low"][lowest_index],
+            "lowest_at": series["t"][lowest_index],
+            "highest": max(series["high"]),
+            "is_lowest": current <= series["low"][lowest_index],
+            "window_days": round(window_s / 86400, 1),
+        }
+    
+    def _rollup(self, series_dir: str, source: str, target: str, now: int) -> int:
+        """Fold complete buckets of `source` not yet in `target`; returns buckets added"""
+        size = BUCKET_S[target]
+        target_dir = os.path.join(series_dir, target)
+        names = self._list(target_dir)
+        last = self._segment(os.path.join(target_dir, names[-1])).last() if names else None
+        start = last[0] + size if last else 0
+        end = now // size * size  # only buckets that are over
+        if end <= start:
+            return 0
+        
+        buckets: dict[int, list] = {}
+        for t, price, low, high in self._read_tier(os.path.join(series_dir, source), start, end - 1):
+            bucket = buckets.get(t // size * size)
+            if bucket is None:
+                buckets[t // size * size] = [price, low, high]
+            else:
+                bucket[0] = price
+                bucket[1] = min(bucket[1], low)
+                bucket[2] = max(bucket[2], high)
+        for t, (price, low, high) in buckets.items():
+            self._append(target_dir, (t, price, low, high))
+        return len(buckets)
+    
+    def _drop_expired(self, tier_dir: str, cutoff: int) -> int:
+        """Delete segments whose points are all older than `cutoff`; returns segments dropped"""
+        names = self._list(tier_dir)
+        dropped = 0
+        # The newest segment stays: other workers may be appending to it
+        for i, name in enumerate(names[:-1]):
+            if int(names[i + 1][:-4]) > cutoff:
+                break
+            path = os.path.join(tier_dir, name)
+            self._forget(path)
+            os.remove(path)
+            dropped += 1
+        if dropped:
+            self._listings.pop(tier_dir, None)
+        return dropped
+    
+    def _expired_series(self, series_dir: str, now: int) -> bool:
+        """Whether no tier of a series has a point within its retention"""
+        for tier in TIERS:
+            names = self._list(os.path.join(series_dir, tier))
+            last = self._segment(os.path.join(series_dir, tier, names[-1])).last() if names else None
+            if last is not None and last[0] >= now - HISTORY_RETENTION_S[tier]:
+                return False
+        return True
+    
+    def _forget_series(self, series_dir: str):
+        """Close and forget everything cached for a series about to be deleted"""
+        prefix = series_dir + os.sep
+        for path in [path for path in self._open if path.startswith(prefix)]:
+            self._forget(path)
+        self._listings = {
+            directory: names for directory, names in self._listings.items()
+            if not directory.startswith(prefix)
+        }
+    
+    def compact(self, now: float | None = None) -> dict:
+        """
+        Roll up and expire every series
+        
+        Returns:
+            dict: {'series': int, 'rolled_up': int, 'segments_dropped': int}
+        """
+        now = int(now if now is not None else time.time()) - EPOCH
+        outcome = {"series": 0, "rolled_up": 0, "segments_dropped": 0}
+        try:
+            platforms = [entry.path for entry in os.scandir(self.root) if entry.is_dir()]
+        except FileNotFoundError:
+            platforms = []
+        
+        for platform_dir in platforms:
+            for entry in os.scandir(platform_dir):
+                if not entry.is_dir():
+                    continue
+                with self._lock:
+                    try:
+                        outcome["rolled_up"] += self._rollup(entry.path, RAW, HOURLY, now)
+                        outcome["rolled_up"] += self._rollup(entry.path, HOURLY, DAILY, now)
+                        for tier in TIERS:
+                            outcome["segments_dropped"] += self._drop_expired(
+                                os.path.join(entry.path, tier), now - HISTORY_RETENTION_S[tier]
+                            )
+                        if self._expired_series(entry.path, now):
+                            self._forget_series(entry.path)
+                            shutil.rmtree(entry.path, ignore_errors=True)
+                    except (OSError, ValueError) as e:
+                        logger.warning(f"Price history compaction failed for {entry.path}: {e}")
+                        self._counters["errors"] += 1
+                outcome["series"] += 1
+        
+        with self._lock:
+            self._counters["compactions"] += 1
+            self._counters["rolled_up"] += outcome["rolled_up"]
+            self._counters["segments_dropped"] += outcome["segments_dropped"]
+            self._last_compaction = {"at": time.time(), **outcome}
+        if outcome["rolled_up"] or outcome["segments_dropped"]:
+            logger.info(
+                f"Price history compacted: {outcome['rolled_up']} buckets rolled up, "
+                f"{outcome['segments_dropped']} segments dropped across {outcome['series']} series"
+            )
+        return outcome
+    
+    async def _run(self):
+        """Periodic compaction loop"""
+        while True:
+            await asyncio.sleep(HISTORY_COMPACT_INTERVAL_S)
+            try:
+                await asyncio.to_thread(self.compact)
+            except Exception as e:
+                logger.error(f"Price history compaction failed: {e}")
+    
+    def start(self):
+        """Start the background compaction loop"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        """Stop the compaction loop and unmap open segments"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.close()
+    
+    def close(self):
+        """Unmap every open segment"""
+        with self._lock:
+            while self._open:
+                self._open.popitem()[1].close()
+            self._listings.clear()
+    
+    def stats(self) -> dict:
+        """Write/compaction counters and open segments"""
+        with self._lock:
+            return {
+                **self._counters,
+                "open_segments": len(self._open),
+                "last_compaction": self._last_compaction,
+                "path": self.root,
+            }
+
+
+__all__ = ["PriceHistory", "Segment"]
@@ -0,0 +1,185 @@
+# app/cache/query_log.py
+"""
+Append-only log of served queries
+Lets a freshly started server find out which queries to warm up first
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from collections import Counter
+from app.config import (
+    logger,
+    QUERY_LOG_PATH,
+    QUERY_LOG_FLUSH_S,
+    QUERY_LOG_MAX_BYTES,
+)
+from app.core.text_utils import clean_query, canonicalize_query
+
+
+class QueryLog:
+    """
+    Records served queries as JSON lines: {"t": time, "key": ..., "q": ..., "n": count}
+    
+    - Hits are counted in memory and appended in batches every
+      QUERY_LOG_FLUSH_S, one line per canonical key
+    - Beyond QUERY_LOG_MAX_BYTES the file is compacted to one line per
+      key (latest time, summed count) and atomically replaced
+    - Each worker appends whole lines in append mode, so several
+      processes can share the file (lines appended by another worker
+      during a compaction may be lost; the log is only a warm-up hint)
+    """
+    
+    def __init__(self, path: str = QUERY_LOG_PATH, max_bytes: int = QUERY_LOG_MAX_BYTES):
+        """Initialize log at `path` (created on first flush)"""
+        self.path = path
+        self.max_bytes = max_bytes
+        
+        self._lock = threading.Lock()
+        self._pending: dict[str, list] = {}  # canonical key -> [query as first typed, count]
+        self._task: asyncio.Task | None = None
+        self._counters = {"recorded": 0, "flushes": 0, "compactions": 0, "errors": 0}
+    
+    def record(self, query: str):
+        """Count one served query"""
+        key = canonicalize_query(query)[0]
+        if not key:
+            return
+        with self._lock:
+            entry = self._pending.setdefault(key, [clean_query(query), 0])
+            entry[1] += 1
+            self._counters["recorded"] += 1
+    
+    def flush(self):
+        """Append pending counts to the log"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        
+        now = time.time()
+        lines = "".join(
+            json.dumps({"t": now, "key": key, "q": query, "n": count}, ensure_ascii=False) + "\n"
+            for key, (query, count) in pending.items()
+        )
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, "ab+") as f:
+                # Start on a fresh line if a crash left a partial one behind
+                end = f.seek(0, os.SEEK_END)
+                if end:
+                    f.seek(end - 1)
+                    if f.read(1) != b"\n":
+                        lines = "\n" + lines
+                f.write(lines.encode("utf-8"))
+            self._counters["flushes"] += 1
+            if os.path.getsize(self.path) > self.max_bytes:
+                self.compact()
+        except OSError as e:
+            logger.warning(f"Query log flush failed: {e}")
+            self._counters["errors"] += 1
+    
+    def _read(self) -> list[dict]:
+        """All well-formed records in the log"""
+        records = []
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # torn write from a crash
+                    if isinstance(record, dict) and "key" in record and "q" in record:
+                        records.append(record)
+        except FileNotFoundError:
+            pass
+        return records
+    
+    def compact(self):
+        """Rewrite the log as one line per key"""
+        merged: dict[str, dict] = {}
+        for record in self._read():
+            entry = merged.setdefault(record["key"], {**record, "n": 0})
+            entry["n"] += record.get("n", 1)
+            entry["t"] = max(entry.get("t", 0), record.get("t", 0))
+            entry["q"] = record["q"]
+        
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for record in merged.values():
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, self.path)
+        self._counters["compactions"] += 1
+        logger.info(f"Query log compacted to {len(merged)} queries")
+    
+    def query_counts(self, window_s: float, limit: int | None = None) -> list[tuple[str, int]]:
+        """
+        Times each query was served within the last `window_s` seconds
+        
+        Args:
+            window_s: Only count records newer than this
+            limit: Maximum number of queries (None for all)
+        
+        Returns:
+            list: (query, count) pairs, most served first
+        """
+        since = time.time() - window_s
+        counts: Counter = Counter()
+        queries: dict[str, str] = {}
+        for record in self._read():
+            if record.get("t", 0) >= since:
+                counts[record["key"]] += record.get("n", 1)
+                queries[record["key"]] = record["q"]
+        return [(queries[key], count) for key, count in counts.most_common(limit)]
+    
+    def top_queries(self, limit: int, window_s: float) -> list[str]:
+        """
+        Most served queries recorded within the last `window_s` seconds
+        
+        Args:
+            limit: Maximum number of queries
+            window_s: Only count records newer than this
+        
+        Returns:
+            list: Queries, most served first
+        """
+        return [query for query, _ in self.query_counts(window_s, limit)]
+    
+    async def _run(self):
+        """Periodic flush loop"""
+        while True:
+            await asyncio.sleep(QUERY_LOG_FLUSH_S)
+            await asyncio.to_thread(self.flush)
+    
+    def start(self):
+        """Start the background flush loop"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        """Stop the flush loop and write what is still pending"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await asyncio.to_thread(self.flush)
+    
+    def stats(self) -> dict:
+        """Recording counters and log size"""
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            size = 0
+        with self._lock:
+            pending = len(self._pending)
+        return {**self._counters, "pending": pending, "bytes": size, "path": self.path}
+
+
+__all__ = ["QueryLog"]
@@ -0,0 +1,415 @@
+# app/cache/result_cache.py
+"""
+Per-platform cache of scraped product lists
+Lets later requests reuse platform results scraped for earlier ones
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from app.core.text_utils import canonicalize_query
+from app.config import (
+    logger,
+    RESULT_CACHE_TTL_S,
+    RESULT_CACHE_PLATFORM_TTLS,
+    RESULT_CACHE_STALE_GRACE_S,
+    RESULT_CACHE_MAX_BYTES,
+    RESULT_CACHE_MAX_ENTRIES,
+    NEGATIVE_CACHE_EMPTY_TTL_S,
+    NEGATIVE_CACHE_FAILED_TTL_S,
+    NEGATIVE_CACHE_MAX_ENTRIES,
+    SCRAPER_MAX_PRODUCTS,
+)
+
+# Lookup states
+FRESH = "fresh"
+STALE = "stale"
+MISS = "miss"
+EMPTY = "empty"  # negative entry: platform answered with no products
+FAILED = "failed"  # negative entry: platform errored or timed out
+
+
+class PlatformResultCache:
+    """
+    Bounded LRU cache of scraper output keyed by (platform, canonical query key, max_products)
+    
+    - Per-platform TTLs: an entry is fresh for its platform's TTL
+    - Stale-while-revalidate: for RESULT_CACHE_STALE_GRACE_S after that it
+      may still be served while one background refresh runs
+    - Memory accounting: each entry is charged its serialized size, and
+      least recently used entries are evicted beyond the byte/entry caps
+    
+    Written by every finished scrape, including stragglers that complete
+    after their request already returned, so the next identical request
+    finds those platforms ready.
+    
+    Negative entries remember, for a short per-outcome TTL, that a platform
+    found nothing (EMPTY) or failed (FAILED) for a query, so repeated misses
+    are answered without scraping. They are only consulted when no usable
+    product list is cached; a failure never displaces good data, and an
+    empty answer only replaces a list that is past its TTL.
+    
+    With an `l2` store (SQLiteCacheStore) writes go through to it and L1
+    misses are filled from it, so entries survive restarts and are shared
+    by all workers on the host.
+    """
+
+    def __init__(
+        self,
+        ttls: dict[str, float] = RESULT_CACHE_PLATFORM_TTLS,
+        default_ttl: float = RESULT_CACHE_TTL_S,
+        stale_grace: float = RESULT_CACHE_STALE_GRACE_S,
+        max_bytes: int = RESULT_CACHE_MAX_BYTES,
+        max_entries: int = RESULT_CACHE_MAX_ENTRIES,
+        l2=None
+    ):
+        """Initialize empty cache with per-platform TTLs, size bounds and optional L2 store"""
+        self.ttls = ttls
+        self.default_ttl = default_ttl
+        self.stale_grace = stale_grace
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.l2 = l2
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()  # key -> (stored_at, products, size)
+        self._bytes = 0
+        self._refreshing: set = set()
+        self._negative: OrderedDict = OrderedDict()  # key -> (stored_at, EMPTY | FAILED)
+        self._negative_ttls = {EMPTY: NEGATIVE_CACHE_EMPTY_TTL_S, FAILED: NEGATIVE_CACHE_FAILED_TTL_S}
+        self._counters = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "refreshes": 0,
+            "evictions": 0,
+            "l2_hits": 0,
+        }
+        self._negative_counters = {
+            outcome: {"hits": 0, "stores": 0, "ignored": 0} for outcome in (EMPTY, FAILED)
+        }
+
+    @staticmethod
+    def _key(platform: str, query: str, max_products: int) -> tuple[str, str, int]:
+        return platform, canonicalize_query(query)[0], max_products
+
+    @staticmethod
+    def _l2_key(key: tuple[str, str, int]) -> str:
+        platform, query, max_products = key
+        return f"scrape:{platform}:{max_products}:{query}"
+
+    def _fill_from_l2(self, key: tuple[str, str, int]) -> bool:
+        """Copy an L2 entry into L1, keeping its original age"""
+        found = self.l2.get(self._l2_key(key))
+        if found is None:
+            return False
+
+        products, stored_wall = found
+        stored_at = time.monotonic() - max(time.time() - stored_wall, 0.0)
+        self._insert(key, products, stored_at)
+        with self._lock:
+            self._counters["l2_hits"] += 1
+        return True
+
+    def _insert(self, key: tuple[str, str, int], products: list[dict], stored_at: float):
+        """Put an entry into L1, evicting LRU entries if over budget"""
+        size = len(json.dumps(products, ensure_ascii=False, separators=(",", ":")))
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[2]
+
+            self._entries[key] = (stored_at, products, size)
+            self._bytes += size
+
+            while self._entries and (
+                self._bytes > self.max_bytes or len(self._entries) > self.max_entries
+            ):
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._counters["evictions"] += 1
+
+    def ttl_for(self, platform: str) -> float:
+        """Freshness lifetime of a platform's entries in seconds"""
+        return self.ttls.get(platform, self.default_ttl)
+
+    def lookup(
+        self,
+        platform: str,
+        query: str,
+        max_products: int = SCRAPER_MAX_PRODUCTS,
+        max_age: float | None = None
+    ) -> tuple[list[dict] | None, str, float | None]:
+        """
+        Look up cached products for a platform/query
+        
+        Args:
+            platform: Platform name
+            query: Search query
+            max_products: Number of products the scrape was asked for
+            max_age: Client's freshness requirement in seconds; when given,
+                     entries older than this are a miss (never served stale)
+        
+        Returns:
+            tuple: (products or None, "fresh" | "stale" | "empty" | "failed" | "miss",
+                    age in seconds or None) - "empty" comes with [], "failed" with None
+        """
+        key = self._key(platform, query, max_products)
+        ttl = self.ttl_for(platform)
+
+        if self.l2 is not None:
+            with self._lock:
+                in_l1 = key in self._entries
+            # Disk read happens outside the lock
+            if not in_l1:
+                self._fill_from_l2(key)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return self._miss_locked(key, max_age, None)
+
+            stored_at, products, size = entry
+            age = time.monotonic() - stored_at
+
+            if age > ttl + self.stale_grace:
+                # Past the grace window: drop it
+                del self._entries[key]
+                self._bytes -= size
+                return self._miss_locked(key, max_age, None)
+
+            fresh_for = ttl if max_age is None else max_age
+            if age <= fresh_for:
+                state = FRESH
+                self._counters["hits"] += 1
+            elif max_age is None:
+                state = STALE
+                self._counters["stale_hits"] += 1
+            else:
+                return self._miss_locked(key, max_age, age)
+
+            self._entries.move_to_end(key)
+            return products, state, age
+
+    def age(self, platform: str, query: str, max_products: int = SCRAPER_MAX_PRODUCTS) -> float | None:
+        """Age in seconds of a usable entry without counting a lookup, or None"""
+        key = self._key(platform, query, max_products)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None and self.l2 is not None and self._fill_from_l2(key):
+            with self._lock:
+                entry = self._entries.get(key)
+        if entry is None:
+            return None
+        age = time.monotonic() - entry[0]
+        return age if age <= self.ttl_for(platform) + self.stale_grace else None
+
+    def peek(self, platform: str, query: str, max_products: int = SCRAPER_MAX_PRODUCTS) -> list[dict] | None:
+        """
+        Products of a usable (fresh or stale) entry, or None
+        
+        A snapshot for bookkeeping, not an answer: no lookup is counted,
+        the LRU order is left alone and an L2 entry is not copied into L1.
+        """
+        key = self._key(platform, query, max_products)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None:
+            stored_at, products, _ = entry
+            age = time.monotonic() - stored_at
+        elif self.l2 is not None:
+            found = self.l2.get(self._l2_key(key))
+            if found is None:
+                return None
+            products, stored_wall = found
+            age = max(time.time() - stored_wall, 0.0)
+        else:
+            return None
+        return products if age <= self.ttl_for(platform) + self.stale_grace else None
+
+    def negative(self, platform: str, query: str, max_products: int = SCRAPER_MAX_PRODUCTS) -> str | None:
+        """Outcome of a live negative entry (EMPTY or FAILED) without counting a lookup, or None"""
+        key = self._key(platform, query, max_products)
+        with self._lock:
+            negative = self._negative.get(key)
+        if negative is None:
+            return None
+        stored_at, outcome = negative
+        return outcome if time.monotonic() - stored_at <= self._negative_ttls[outcome] else None
+
+    def validator(
+        self,
+        platform: str,
+        query: str,
+        max_products: int = SCRAPER_MAX_PRODUCTS
+    ) -> tuple[float, float, float] | None:
+        """
+        Version of the fresh data a lookup would return, without counting a lookup
+        
+        Returns:
+            tuple: (stamp, seconds it stays fresh, age in seconds), or None
+                   if the platform/query has no fresh entry in memory; the
+                   stamp changes whenever the entry is replaced
+        """
+        key = self._key(platform, query, max_products)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                age = now - entry[0]
+                remaining = self.ttl_for(platform) - age
+                # A stale list is served ahead of any negative entry
+                return (entry[0], remaining, age) if remaining > 0 else None
+            negative = self._negative.get(key)
+            if negative is not None:
+                age = now - negative[0]
+                remaining = self._negative_ttls[negative[1]] - age
+                if remaining > 0:
+                    return negative[0], remaining, age
+        return None
+
+    def _miss_locked(self, key: tuple, max_age: float | None, age: float | None) -> tuple:
+        """No usable product list: answer from a live negative entry or count a miss"""
+        negative = self._negative.get(key)
+        if negative is not None:
+            stored_at, outcome = negative
+            negative_age = time.monotonic() - stored_at
+            if negative_age > self._negative_ttls[outcome]:
+                del self._negative[key]
+            elif max_age is None or negative_age <= max_age:
+                self._negative_counters[outcome]["hits"] += 1
+                return ([] if outcome == EMPTY else None), outcome, negative_age
+
+        self._counters["misses"] += 1
+        return None, MISS, age
+
+    def set_negative(
+        self,
+        platform: str,
+        query: str,
+        outcome: str,
+        max_products: int = SCRAPER_MAX_PRODUCTS
+    ):
+        """
+        Remember that a platform found nothing (EMPTY) or failed (FAILED) for a query
+        
+        An EMPTY result replaces a stale product list (it is the platform's
+        current answer) but is dropped while a fresh list is cached: one
+        empty page next to a fresh list is more likely a glitch than a sell-out.
+        A FAILED one always leaves the list in place. May read and delete
+        L2 entries; call it off the event loop.
+        """
+        key = self._key(platform, query, max_products)
+        if outcome == EMPTY and self.l2 is not None:
+            with self._lock:
+                in_l1 = key in self._entries
+            if not in_l1:
+                # A list another worker stored counts as well
+                self._fill_from_l2(key)
+
+        replaced = False
+        with self._lock:
+            if outcome == EMPTY:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    if time.monotonic() - entry[0] <= self.ttl_for(platform):
+                        self._negative_counters[outcome]["ignored"] += 1
+                        logger.debug(f"Kept fresh {platform} results over an empty answer for: {query}")
+                        return
+                    del self._entries[key]
+                    self._bytes -= entry[2]
+                    replaced = True
+            self._negative.pop(key, None)
+            self._negative[key] = (time.monotonic(), outcome)
+            self._negative_counters[outcome]["stores"] += 1
+            while len(self._negative) > NEGATIVE_CACHE_MAX_ENTRIES:
+                self._negative.popitem(last=False)
+
+        if replaced and self.l2 is not None:
+            # Otherwise the next L1 miss would refill the outdated list from disk
+            self.l2.delete(self._l2_key(key))
+        logger.debug(f"Negative-cached {platform} ({outcome}) for: {query}")
+
+    def get(self, platform: str, query: str, max_products: int = SCRAPER_MAX_PRODUCTS) -> list[dict] | None:
+        """Get fresh cached products or None"""
+        products, state, _ = self.lookup(platform, query, max_products)
+        return products if state == FRESH else None
+
+    def set(
+        self,
+        platform: str,
+        query: str,
+        products: list[dict],
+        max_products: int = SCRAPER_MAX_PRODUCTS
+    ):
+        """Store products scraped for a platform/query (written through to L2)"""
+        if not products:
+            self.set_negative(platform, query, EMPTY, max_products)
+            return
+
+        key = self._key(platform, query, max_products)
+        with self._lock:
+            self._negative.pop(key, None)
+        self._insert(key, products, time.monotonic())
+
+        if self.l2 is not None:
+            # Keep it on disk for as long as it may be served stale
+            self.l2.set(self._l2_key(key), products, self.ttl_for(platform) + self.stale_grace)
+
+        logger.debug(f"Cached {len(products)} {platform} products for: {query}")
+
+    def begin_refresh(self, platform: str, query: str, max_products: int = SCRAPER_MAX_PRODUCTS) -> bool:
+        """
+        Claim the background refresh of a stale entry
+        
+        Returns:
+            bool: True if the caller should refresh, False if one is already running
+        """
+        key = self._key(platform, query, max_products)
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            self._counters["refreshes"] += 1
+            return True
+
+    def end_refresh(self, platform: str, query: str, max_products: int = SCRAPER_MAX_PRODUCTS):
+        """Release a refresh claimed with begin_refresh()"""
+        with self._lock:
+            self._refreshing.discard(self._key(platform, query, max_products))
+
+    def clear(self):
+        """Drop all in-memory entries (L2 keeps its own expiry)"""
+        with self._lock:
+            self._entries.clear()
+            self._negative.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        """Hit/miss/stale counters, memory usage and L2 store stats"""
+        l2 = self.l2.stats() if self.l2 is not None else None
+        with self._lock:
+            lookups = self._counters["hits"] + self._counters["stale_hits"] + self._counters["misses"]
+            return {
+                **self._counters,
+                "hit_rate": round(
+                    (self._counters["hits"] + self._counters["stale_hits"]) / lookups, 3
+                ) if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "refreshing": len(self._refreshing),
+                "negative": {
+                    "entries": len(self._negative),
+                    **{
+                        outcome: {**counters, "ttl_s": self._negative_ttls[outcome]}
+                        for outcome, counters in self._negative_counters.items()
+                    },
+                },
+                "l2": l2,
+            }
+
+
+__all__ = ["PlatformResultCache", "FRESH", "STALE", "MISS", "EMPTY", "FAILED"]
@@ -0,0 +1,253 @@
+# app/cache/sqlite_store.py
+"""
+Durable second-level cache on SQLite
+Shared by all uvicorn workers on a host and kept across restarts
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from app.config import (
+    logger,
+    L2_CACHE_PATH,
+    L2_CACHE_MAX_BYTES,
+    L2_CACHE_EVICT_EVERY,
+)
+
+# Smoothing factor for the read latency moving average
+EWMA_ALPHA = 0.1
+
+
+def encode_value(value) -> bytes:
+    """Serialize a JSON-compatible value compactly (minified JSON + zlib)"""
+    raw = json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return zlib.compress(raw, 6)
+
+
+def decode_value(blob: bytes):
+    """Inverse of encode_value()"""
+    return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+
+class SQLiteCacheStore:
+    """
+    Key/value store with TTL expiry and size-bounded eviction
+    
+    - WAL journal: readers never block the writer, so several processes
+      can share one file; busy_timeout absorbs short write contention
+    - One connection per thread (sqlite3 connections are not shareable)
+    - Expired rows are ignored on read and purged during eviction passes;
+      beyond max_bytes the least recently accessed rows go first
+    
+    Timestamps are wall-clock (time.time) since they are shared between
+    processes and survive restarts.
+    """
+    
+    def __init__(
+        self,
+        path: str = L2_CACHE_PATH,
+        max_bytes: int = L2_CACHE_MAX_BYTES,
+        evict_every: int = L2_CACHE_EVICT_EVERY
+    ):
+        """Open (or create) the store at `path`"""
+        self.path = path
+        self.max_bytes = max_bytes
+        self.evict_every = evict_every
+        
+        self._local = threading.local()
+        self._conns: list[sqlite3.Connection] = []
+        self._conns_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._counters = {"hits": 0, "misses": 0, "writes": 0, "evicted": 0, "errors": 0}
+        self._avg_read_ms = 0.0
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        conn = self._conn()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS cache (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                stored_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                size INTEGER NOT NULL
+            ) WITHOUT ROWID
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS cache_accessed ON cache (accessed_at)")
+        conn.execute("CREATE INDEX IF NOT EXISTS cache_expires ON cache (expires_at)")
+        logger.info(f"L2 cache store ready at {path}")
+    
+    def _conn(self) -> sqlite3.Connection:
+        """Per-thread connection configured for concurrent multi-process use"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # check_same_thread=False only so close() can reach every thread's
+            # connection; each connection is still used by its own thread
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            self._local.conn = conn
+            with self._conns_lock:
+                self._conns.append(conn)
+        return conn
+    
+    def _count(self, name: str, amount: int = 1):
+        with self._lock:
+            self._counters[name] += amount
+    
+    def get(self, key: str) -> tuple[object, float] | None:
+        """
+        Read a live entry
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            tuple: (value, stored_at wall-clock time) or None if missing/expired
+        """
+        started = time.perf_counter()
+        now = time.time()
+        try:
+            conn = self._conn()
+            row = conn.execute(
+                "SELECT value, stored_at, accessed_at FROM cache WHERE key = ? AND expires_at > ?",
+                (key, now)
+            ).fetchone()
+            if row is None:
+                self._count("misses")
+                return None
+            
+            blob, stored_at, accessed_at = row
+            # Touch at most once a minute to keep reads mostly write-free
+            if now - accessed_at > 60:
+                conn.execute("UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key))
+            value = decode_value(blob)
+        except (sqlite3.Error, zlib.error, ValueError) as e:
+            logger.warning(f"L2 cache read failed for {key}: {e}")
+            self._count("errors")
+            return None
+        
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._lock:
+            self._counters["hits"] += 1
+            if self._counters["hits"] == 1:
+                self._avg_read_ms = elapsed_ms
+            else:
+                self._avg_read_ms += EWMA_ALPHA * (elapsed_ms - self._avg_read_ms)
+        return value, stored_at
+    
+    def set(self, key: str, value, ttl: float, stored_at: float | None = None):
+        """
+        Write an entry that expires `ttl` seconds after it was stored
+        
+        Args:
+            key: Cache key
+            value: JSON-compatible value
+            ttl: Retention in seconds
+            stored_at: Wall-clock time the data was produced (default: now)
+        """
+        now = time.time()
+        stored_at = stored_at or now
+        try:
+            blob = encode_value(value)
+            self._conn().execute(
+                "INSERT OR REPLACE INTO cache (key, value, stored_at, expires_at, accessed_at, size) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, blob, stored_at, stored_at + ttl, now, len(blob))
+            )
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"L2 cache write failed for {key}: {e}")
+            self._count("errors")
+            return
+        
+        with self._lock:
+            self._counters["writes"] += 1
+            self._writes += 1
+            due = self._writes % self.evict_every == 0
+        if due:
+            self.evict()
+    
+    def delete(self, key: str):
+        """Remove an entry"""
+        try:
+            self._conn().execute("DELETE FROM cache WHERE key = ?", (key,))
+        except sqlite3.Error as e:
+            logger.warning(f"L2 cache delete failed for {key}: {e}")
+    
+    def evict(self) -> int:
+        """
+        Purge expired rows, then least recently accessed rows beyond max_bytes
+        
+        Returns:
+            int: Number of rows removed
+        """
+        conn = self._conn()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            removed = conn.execute("DELETE FROM cache WHERE expires_at <= ?", (time.time(),)).rowcount
+            
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM cache").fetchone()[0]
+            if total > self.max_bytes:
+                # Oldest-accessed rows go first, up to the one whose running
+                # total of sizes covers the excess
+                row = conn.execute(
+                    "SELECT accessed_at FROM ("
+                    "  SELECT accessed_at, SUM(size) OVER ("
+                    "    ORDER BY accessed_at ROWS UNBOUNDED PRECEDING"
+                    "  ) AS freed FROM cache"
+                    ") WHERE freed >= ? LIMIT 1",
+                    (total - self.max_bytes,)
+                ).fetchone()
+                if row is not None:
+                    removed += conn.execute(
+                        "DELETE FROM cache WHERE accessed_at <= ?", (row[0],)
+                    ).rowcount
+            conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            logger.warning(f"L2 cache eviction failed: {e}")
+            self._count("errors")
+            return 0
+        
+        if removed:
+            self._count("evicted", removed)
+            logger.debug(f"L2 cache evicted {removed} rows")
+        return removed
+    
+    def stats(self) -> dict:
+        """Counters, read latency and on-disk size"""
+        try:
+            entries, size = self._conn().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache"
+            ).fetchone()
+        except sqlite3.Error:
+            entries, size = None, None
+        with self._lock:
+            return {
+                **self._counters,
+                "avg_read_ms": round(self._avg_read_ms, 3),
+                "entries": entries,
+                "bytes": size,
+                "max_bytes": self.max_bytes,
+                "path": self.path,
+            }
+    
+    def close(self):
+        """Close every thread's connection"""
+        with self._conns_lock:
+            conns, self._conns = self._conns, []
+        for conn in conns:
+            conn.close()
+        self._local.conn = None
+
+
+__all__ = ["SQLiteCacheStore", "encode_value", "decode_value"]
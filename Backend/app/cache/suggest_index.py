@@ -0,0 +1,268 @@
+# app/cache/suggest_index.py
+"""
+In-memory prefix index for search suggestions
+Autocompletes from served queries and known product titles, weighted by popularity
+"""
+
+import threading
+import time
+from typing import Callable
+from bisect import bisect_left, insort
+from app.config import (
+    logger,
+    SUGGEST_MAX_RESULTS,
+    SUGGEST_SCAN_LIMIT,
+    SUGGEST_SUFFIX_WORDS,
+    SUGGEST_PRODUCT_WEIGHT,
+    SUGGEST_TOP_PREFIX_LEN,
+    SUGGEST_TOP_K,
+    SUGGEST_MAX_ENTRIES,
+)
+from app.core.text_utils import normalize_text, canonicalize_query
+
+# Smoothing factor for the lookup latency moving average
+EWMA_ALPHA = 0.1
+
+# How far past SUGGEST_MAX_ENTRIES the index may grow before it is compacted
+EVICT_SLACK = 0.25
+
+QUERY = "query"
+PRODUCT = "product"
+
+
+class SuggestIndex:
+    """
+    Sorted array of normalized phrases, searched by prefix with bisect
+    
+    - Phrases are canonical queries (display form) and product titles;
+      each is also indexed from its 2nd..SUGGEST_SUFFIX_WORDS+1-th word, so
+      "pro max" finds "iphone 15 pro max"
+    - Weights: +1 per served query, +SUGGEST_PRODUCT_WEIGHT per product
+      sighting; queries win ties over product titles
+    - Updates insert into the sorted array in place (insort), so the index
+      grows incrementally as products are scraped; once it holds
+      SUGGEST_MAX_ENTRIES * (1 + EVICT_SLACK) entries it is rebuilt from
+      the SUGGEST_MAX_ENTRIES best-ranked ones
+    - Prefixes of up to SUGGEST_TOP_PREFIX_LEN characters, which match too
+      many phrases to rank per keystroke, keep a ranked top list that is
+      maintained on every update (weights only grow, so it stays exact);
+      longer prefixes examine at most SUGGEST_SCAN_LIMIT index rows
+    """
+    
+    def __init__(self):
+        """Initialize empty index"""
+        self._lock = threading.Lock()
+        self._keys: list[tuple[str, int]] = []  # (normalized phrase or suffix, entry id), sorted
+        self._entries: list[list] = []  # entry id -> [display text, kind, weight, short prefixes, identity, phrase]
+        self._ids: dict[tuple[str, str], int] = {}  # (kind, identity) -> entry id
+        self._top: dict[str, list[int]] = {}  # short prefix -> entry ids, best first
+        self._bulk = False  # while bulk-loading, keys and top lists are built once at the end
+        self._recorded: dict[tuple[str, str], list] | None = None  # updates made while build() loads
+        self._counters = {"lookups": 0, "updates": 0, "evicted": 0}
+        self._avg_lookup_ms = 0.0
+        self._built_at: float | None = None
+    
+    @staticmethod
+    def _index_keys(phrase: str) -> list[str]:
+        """Phrase plus its suffixes starting at the following words"""
+        words = phrase.split()
+        return [' '.join(words[i:]) for i in range(min(len(words), SUGGEST_SUFFIX_WORDS + 1))]
+    
+    def _rank(self, entry_id: int) -> tuple:
+        entry = self._entries[entry_id]
+        return entry[2], entry[1] == QUERY
+    
+    def _promote_locked(self, entry_id: int):
+        """Move an entry whose weight grew into/up the top lists of its short prefixes"""
+        rank = self._rank(entry_id)
+        for prefix in self._entries[entry_id][3]:
+            top = self._top.setdefault(prefix, [])
+            if entry_id in top:
+                top.remove(entry_id)
+            elif len(top) >= SUGGEST_TOP_K and self._rank(top[-1]) >= rank:
+                continue
+            position = 0
+            while position < len(top) and self._rank(top[position]) >= rank:
+                position += 1
+            top.insert(position, entry_id)
+            del top[SUGGEST_TOP_K:]
+    
+    def _add_locked(self, kind: str, identity: str, phrase: str, display: str, weight: float):
+        """Add weight to an entry, creating and indexing it under `phrase` if new"""
+        entry_id = self._ids.get((kind, identity))
+        if entry_id is None:
+            keys = self._index_keys(phrase)
+            prefixes = {key[:length] for key in keys for length in range(1, SUGGEST_TOP_PREFIX_LEN + 1)}
+            entry_id = len(self._entries)
+            self._entries.append([display, kind, 0.0, prefixes, identity, phrase])
+            self._ids[(kind, identity)] = entry_id
+            for key in keys:
+                if self._bulk:
+                    self._keys.append((key, entry_id))
+                else:
+                    insort(self._keys, (key, entry_id))
+        self._entries[entry_id][2] += weight
+        if not self._bulk:
+            self._promote_locked(entry_id)
+        if self._recorded is not None:
+            self._recorded.setdefault((kind, identity), [phrase, display, 0.0])[2] += weight
+    
+    def _finish_bulk(self):
+        """Sort the keys and rank the top lists of a bulk-loaded index"""
+        self._bulk = False
+        self._keys.sort()
+        for entry_id, entry in enumerate(self._entries):
+            for prefix in entry[3]:
+                self._top.setdefault(prefix, []).append(entry_id)
+        for top in self._top.values():
+            top.sort(key=self._rank, reverse=True)
+            del top[SUGGEST_TOP_K:]
+    
+    def _evict_locked(self):
+        """Rebuild from the best-ranked entries once the index outgrows its cap"""
+        if len(self._entries) <= SUGGEST_MAX_ENTRIES * (1 + EVICT_SLACK):
+            return
+        kept = sorted(range(len(self._entries)), key=self._rank, reverse=True)[:SUGGEST_MAX_ENTRIES]
+        fresh = SuggestIndex()
+        fresh._bulk = True
+        for entry_id in kept:
+            display, kind, weight, _, identity, phrase = self._entries[entry_id]
+            fresh._add_locked(kind, identity, phrase, display, weight)
+        fresh._finish_bulk()
+        self._counters["evicted"] += len(self._entries) - len(kept)
+        self._keys, self._entries, self._ids, self._top = (
+            fresh._keys, fresh._entries, fresh._ids, fresh._top
+        )
+    
+    def record_query(self, query: str, weight: float = 1.0):
+        """Count a served query"""
+        key, display = canonicalize_query(query)
+        if not key:
+            return
+        with self._lock:
+            # Spellings of one canonical query share an entry, shown as first seen
+            self._add_locked(QUERY, key, display, display, weight)
+            self._counters["updates"] += 1
+            self._evict_locked()
+    
+    def add_products(self, products: list[dict]):
+        """Index the titles of freshly scraped products"""
+        with self._lock:
+            for product in products:
+                title = product.get("title")
+                phrase = normalize_text(title) if title and title != "N/A" else ""
+                if phrase:
+                    self._add_locked(PRODUCT, phrase, phrase, title, SUGGEST_PRODUCT_WEIGHT)
+            self._counters["updates"] += 1
+            self._evict_locked()
+    
+    def build(self, load: Callable[[], tuple[list[tuple[str, int]], list[str]]]):
+        """
+        Bulk-load a startup snapshot, keeping what was recorded while it loaded
+        
+        Only updates made after the load starts are replayed on top of the
+        snapshot; earlier ones are already in it and would count twice.
+        
+        Args:
+            load: Returns the snapshot as ((query, times served) pairs,
+                known product titles); called without the lock held
+        """
+        with self._lock:
+            self._recorded = {}
+        try:
+            queries, titles = load()
+        except Exception:
+            with self._lock:
+                self._recorded = None
+            raise
+        
+        fresh = SuggestIndex()
+        fresh._bulk = True
+        for query, count in queries:
+            fresh.record_query(query, weight=count)
+        fresh.add_products([{"title": title} for title in titles])
+        fresh._finish_bulk()
+        
+        with self._lock:
+            recorded, self._recorded = self._recorded, None
+            self._keys, self._entries, self._ids, self._top = (
+                fresh._keys, fresh._entries, fresh._ids, fresh._top
+            )
+            for (kind, identity), (phrase, display, weight) in recorded.items():
+                self._add_locked(kind, identity, phrase, display, weight)
+            self._evict_locked()
+            self._built_at = time.time()
+        logger.info(f"Suggestion index built: {len(queries)} queries, {len(titles)} product titles")
+    
+    def suggest(self, prefix: str, limit: int = SUGGEST_MAX_RESULTS) -> list[dict]:
+        """
+        Most popular phrases starting with `prefix` (at any of their first words)
+        
+        Args:
+            prefix: What the user has typed so far
+            limit: Maximum suggestions
+        
+        Returns:
+            list: [{'text': str, 'kind': 'query' | 'product', 'weight': float}]
+        
+        Example:
+            >>> index.suggest("iphone 15 p")
+            [{'text': 'iphone 15 pro', 'kind': 'query', 'weight': 42.0}, ...]
+        """
+        started = time.perf_counter()
+        # Keep a trailing space: "iphone " should not complete to "iphones"
+        needle = normalize_text(prefix) + (" " if prefix[-1:].isspace() else "")
+        if not needle.strip():
+            return []
+        
+        with self._lock:
+            if len(needle) <= SUGGEST_TOP_PREFIX_LEN:
+                ranked = [self._entries[entry_id] for entry_id in self._top.get(needle, [])]
+            else:
+                found: dict[int, list] = {}
+                position = bisect_left(self._keys, (needle, -1))
+                end = min(position + SUGGEST_SCAN_LIMIT, len(self._keys))
+                while position < end:
+                    key, entry_id = self._keys[position]
+                    if not key.startswith(needle):
+                        break
+                    found[entry_id] = self._entries[entry_id]
+                    position += 1
+                ranked = sorted(
+                    found.values(),
+                    key=lambda entry: (entry[2], entry[1] == QUERY),
+                    reverse=True
+                )
+            
+            results = []
+            shown = set()
+            for display, kind, weight, *_ in ranked:
+                if display.lower() in shown:
+                    continue
+                shown.add(display.lower())
+                results.append({"text": display, "kind": kind, "weight": round(weight, 2)})
+                if len(results) >= limit:
+                    break
+            
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self._counters["lookups"] += 1
+            if self._counters["lookups"] == 1:
+                self._avg_lookup_ms = elapsed_ms
+            else:
+                self._avg_lookup_ms += EWMA_ALPHA * (elapsed_ms - self._avg_lookup_ms)
+        return results
+    
+    def stats(self) -> dict:
+        """Index size, update/lookup counters and lookup latency"""
+        with self._lock:
+            return {
+                **self._counters,
+                "entries": len(self._entries),
+                "index_rows": len(self._keys),
+                "top_prefixes": len(self._top),
+                "avg_lookup_ms": round(self._avg_lookup_ms, 4),
+                "built_at": self._built_at,
+            }
+
+
+__all__ = ["SuggestIndex"]
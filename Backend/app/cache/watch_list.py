@@ -0,0 +1,214 @@
+# app/cache/watch_list.py
+"""
+Durable list of watched products
+What the price-watch scheduler re-checks, and the last price each watch saw
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from app.config import logger, WATCH_DB_PATH
+
+WATCH_COLUMNS = (
+    "id", "platform", "url", "product_id", "target_price", "interval_s",
+    "last_price", "in_stock", "title", "last_checked", "next_check",
+    "failures", "created_at",
+)
+
+
+class WatchList:
+    """
+    SQLite table of watches, indexed by next check time
+    
+    Several watches may point at the same product (one per target price;
+    registering a product and target again updates the existing watch);
+    the scheduler fetches each product once and diffs every watch on it.
+    Same concurrency model as SQLiteCacheStore (WAL, one connection per
+    thread).
+    """
+    
+    def __init__(self, path: str = WATCH_DB_PATH):
+        """Open (or create) the watch list at `path`"""
+        self.path = path
+        self._local = threading.local()
+        self._conns: list[sqlite3.Connection] = []
+        self._conns_lock = threading.Lock()
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        conn = self._conn()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS watches (
+                id INTEGER PRIMARY KEY,
+                platform TEXT NOT NULL,
+                url TEXT NOT NULL,
+                product_id TEXT NOT NULL,
+                target_price INTEGER,
+                interval_s REAL NOT NULL,
+                last_price INTEGER,
+                in_stock INTEGER,
+                title TEXT,
+                last_checked REAL,
+                next_check REAL NOT NULL,
+                failures INTEGER NOT NULL DEFAULT 0,
+                created_at REAL NOT NULL
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS watches_due ON watches (next_check)")
+        # Lists written before watches were unique keep their oldest duplicate
+        conn.execute(
+            "DELETE FROM watches WHERE id NOT IN "
+            "(SELECT MIN(id) FROM watches GROUP BY platform, product_id, IFNULL(target_price, 0))"
+        )
+        conn.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS watches_unique "
+            "ON watches (platform, product_id, IFNULL(target_price, 0))"
+        )
+        logger.info(f"Watch list ready at {path}")
+    
+    def _conn(self) -> sqlite3.Connection:
+        """Per-thread connection configured for concurrent multi-process use"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            self._local.conn = conn
+            with self._conns_lock:
+                self._conns.append(conn)
+        return conn
+    
+    @staticmethod
+    def _row(row: tuple) -> dict:
+        watch = dict(zip(WATCH_COLUMNS, row))
+        if watch["in_stock"] is not None:
+            watch["in_stock"] = bool(watch["in_stock"])
+        return watch
+    
+    def add(
+        self,
+        platform: str,
+        url: str,
+        pid: str,
+        interval_s: float,
+        target_price: int | None = None,
+        first_check: float | None = None
+    ) -> dict:
+        """
+        Register a watch, or update the cadence of the same (platform, product, target) one
+        
+        Args:
+            platform: Platform of the product
+            url: Product link
+            pid: Platform product ID (catalog.product_id)
+            interval_s: Re-check cadence
+            target_price: Notify once the price falls to this (optional)
+            first_check: When to check first (default: now)
+        
+        Returns:
+            dict: The stored watch
+        """
+        now = time.time()
+        row = self._conn().execute(
+            "INSERT INTO watches (platform, url, product_id, target_price, interval_s, next_check, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (platform, product_id, IFNULL(target_price, 0)) "
+            "DO UPDATE SET interval_s = excluded.interval_s RETURNING id",
+            (platform, url, pid, target_price, interval_s, first_check or now, now)
+        ).fetchone()
+        return self.get(row[0])
+    
+    def get(self, watch_id: int) -> dict | None:
+        """Watch by ID, or None"""
+        row = self._conn().execute(
+            f"SELECT {', '.join(WATCH_COLUMNS)} FROM watches WHERE id = ?", (watch_id,)
+        ).fetchone()
+        return self._row(row) if row else None
+    
+    def remove(self, watch_id: int) -> bool:
+        """Delete a watch; False if it did not exist"""
+        return self._conn().execute("DELETE FROM watches WHERE id = ?", (watch_id,)).rowcount > 0
+    
+    def page(self, limit: int = 50, offset: int = 0) -> tuple[list[dict], int]:
+        """
+        Page of watches, newest first
+        
+        Returns:
+            tuple: (watches, total number of watches)
+        """
+        conn = self._conn()
+        rows = conn.execute(
+            f"SELECT {', '.join(WATCH_COLUMNS)} FROM watches ORDER BY id DESC LIMIT ? OFFSET ?",
+            (limit, offset)
+        ).fetchall()
+        total = conn.execute("SELECT COUNT(*) FROM watches").fetchone()[0]
+        return [self._row(row) for row in rows], total
+    
+    def due(self, now: float, limit: int) -> list[dict]:
+        """Watches whose next check time has come, most overdue first"""
+        try:
+            rows = self._conn().execute(
+                f"SELECT {', '.join(WATCH_COLUMNS)} FROM watches "
+                "WHERE next_check <= ? ORDER BY next_check LIMIT ?",
+                (now, limit)
+            ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"Watch list scan failed: {e}")
+            return []
+        return [self._row(row) for row in rows]
+    
+    def record_checks(self, checked: list[tuple], failed: list[tuple]):
+        """
+        Store the outcome of a scheduler cycle in one transaction
+        
+        Args:
+            checked: (watch id, price, in stock, title, checked at, next check)
+            failed: (watch id, next check) for watches whose product could not be read
+        """
+        conn = self._conn()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                "UPDATE watches SET last_price = ?, in_stock = COALESCE(?, in_stock), title = COALESCE(?, title), "
+                "last_checked = ?, next_check = ?, failures = 0 WHERE id = ?",
+                [(price, in_stock, title, at, next_check, watch_id)
+                 for watch_id, price, in_stock, title, at, next_check in checked]
+            )
+            conn.executemany(
+                "UPDATE watches SET next_check = ?, failures = failures + 1 WHERE id = ?",
+                [(next_check, watch_id) for watch_id, next_check in failed]
+            )
+            conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            logger.warning(f"Watch list update failed: {e}")
+    
+    def stats(self, now: float | None = None) -> dict:
+        """Number of watches, distinct products and watches due"""
+        try:
+            conn = self._conn()
+            total, products = conn.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT platform || ':' || product_id) FROM watches"
+            ).fetchone()
+            due = conn.execute(
+                "SELECT COUNT(*) FROM watches WHERE next_check <= ?", (now or time.time(),)
+            ).fetchone()[0]
+        except sqlite3.Error:
+            return {"path": self.path}
+        return {"watches": total, "products": products, "due": due, "path": self.path}
+    
+    def close(self):
+        """Close every thread's connection"""
+        with self._conns_lock:
+            conns, self._conns = self._conns, []
+        for conn in conns:
+            conn.close()
+        self._local.conn = None
+
+
+__all__ = ["WatchList"]
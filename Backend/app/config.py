@@ -5,6 +5,7 @@ Handles logging, constants, and global settings
 """
 
 import logging
+from pathlib import Path
 from typing import Final
 
 # ✅ LOGGING SETUP
@@ -18,18 +19,267 @@ logger = logging.getLogger(__name__)
 # CONSTANTS & SETTINGS
 # ============================================
 
+# Local state (caches, logs, indexes) lives under Backend/data
+DATA_DIR: Final[Path] = Path(__file__).resolve().parent.parent / "data"
+
 # Thread Pool Configuration
-MAX_WORKERS: Final[int] = 6  # Optimized for parallel scraping (was 4)
+MAX_WORKERS: Final[int] = 6  # Initial scraper capacity; autoscaler moves it within bounds
+SCRAPER_TIMEOUT_S: Final[float] = 30  # Max seconds to wait for a single scraper
+SCRAPER_DURATION_SEED_S: Final[float] = 12  # Initial guess for avg scrape time (refined by EWMA)
+SCRAPER_MAX_PRODUCTS: Final[int] = 5  # Products requested from each platform per search
+
+# Autoscaling (scraper slots = concurrent browsers)
+AUTOSCALE_MIN_WORKERS: Final[int] = 2
+AUTOSCALE_MAX_WORKERS: Final[int] = 16  # Thread pool is sized to this bound
+AUTOSCALE_INTERVAL_S: Final[float] = 5  # Seconds between scaling decisions
+AUTOSCALE_UP_WAIT_S: Final[float] = 2  # Queue wait that signals scale-up
+AUTOSCALE_UP_UTILIZATION: Final[float] = 0.9  # Utilization that signals scale-up
+AUTOSCALE_DOWN_UTILIZATION: Final[float] = 0.3  # Utilization that signals scale-down
+AUTOSCALE_UP_TICKS: Final[int] = 2  # Consecutive signals before scaling up
+AUTOSCALE_DOWN_TICKS: Final[int] = 12  # Consecutive signals before scaling down (~1 min)
+AUTOSCALE_COOLDOWN_S: Final[float] = 30  # Minimum time between changes
+AUTOSCALE_STEP_UP: Final[int] = 2  # Slots added per scale-up (scale-down removes 1)
+AUTOSCALE_BROWSER_MEMORY_MB: Final[int] = 350  # Approx. memory per headless browser
+AUTOSCALE_MIN_FREE_MEMORY_MB: Final[int] = 512  # Headroom kept free on the host
+
+# Client Deadlines (/api/compare?deadline_ms= or X-Deadline-Ms header)
+DEADLINE_HEADER: Final[str] = "X-Deadline-Ms"
+MIN_DEADLINE_MS: Final[int] = 500  # Below this no platform can answer
+MAX_DEADLINE_MS: Final[int] = 30000  # Never wait longer than a full scrape
+
+# Quorum Mode (return early, stragglers complete into the result cache)
+QUORUM_ANCHOR_PLATFORM: Final[str] = "flipkart"  # Reference platform the matcher needs
+QUORUM_SOFT_DEADLINE_S: Final[float] = 6  # Answer by then even without a quorum
+
+# Progressive Comparison (/api/compare/stream, Server-Sent Events)
+STREAM_HEARTBEAT_S: Final[float] = 10  # Keep-alive comment while no platform has finished
+
+# Batch Comparison (POST /api/compare/batch, NDJSON in completion order)
+COMPARE_BATCH_MAX_QUERIES: Final[int] = 500  # Queries per request
+COMPARE_BATCH_CONCURRENCY: Final[int] = 4  # Distinct queries compared at once, across all batch jobs
+COMPARE_BATCH_QUERY_CHARS: Final[tuple[int, int]] = (2, 100)  # Query length bounds, as for /api/compare
+
+# Result Cache (per-platform scraped product lists)
+RESULT_CACHE_TTL_S: Final[float] = 300  # Default freshness lifetime
+RESULT_CACHE_PLATFORM_TTLS: Final[dict[str, float]] = {
+    "flipkart": 300,
+    "amazon": 300,  # Marketplace prices move often
+    "croma": 900,
+    "reliancedigital": 900,  # Retailer catalog prices change rarely
+}
+RESULT_CACHE_STALE_GRACE_S: Final[float] = 600  # Serve stale + refresh in background for this long
+RESULT_CACHE_MAX_BYTES: Final[int] = 32 * 1024 * 1024  # Serialized size budget
+RESULT_CACHE_MAX_ENTRIES: Final[int] = 20000
+
+# Negative Cache (remember platforms that found nothing or failed for a query)
+NEGATIVE_CACHE_EMPTY_TTL_S: Final[float] = 120  # "no results" is a real answer, keep it longer
+NEGATIVE_CACHE_FAILED_TTL_S: Final[float] = 30  # failures are often transient, retry soon
+NEGATIVE_CACHE_MAX_ENTRIES: Final[int] = 20000
+
+# Comparison Memo (reuse matching/formatting when platform results are unchanged)
+COMPARISON_MEMO_MAX_ENTRIES: Final[int] = 2000
+COMPARISON_MEMO_L2_TTL_S: Final[float] = 3600  # Retention of memo entries in the L2 store
+
+# L2 Cache (SQLite WAL file shared by all workers, survives restarts)
+L2_CACHE_ENABLED: Final[bool] = True
+L2_CACHE_PATH: Final[str] = str(DATA_DIR / "cache.sqlite3")
+L2_CACHE_MAX_BYTES: Final[int] = 256 * 1024 * 1024  # Compressed payload budget
+L2_CACHE_EVICT_EVERY: Final[int] = 200  # Run an eviction pass every N writes
+
+# Product Catalog (products by platform-native ID, cross-platform match links)
+CATALOG_ENABLED: Final[bool] = True
+CATALOG_PATH: Final[str] = str(DATA_DIR / "catalog.sqlite3")
+CATALOG_FRESH_S: Final[float] = 300  # Answer from the catalog while all its products were seen this recently
+CATALOG_QUERY_TTL_S: Final[float] = 6 * 3600  # Trust the set of products recorded for a query this long
+SEARCH_INDEX_FRESH_S: Final[float] = 900  # /api/search serves catalog products seen this recently
+
+# Price History (per-product columnar series under DATA_DIR/history, /api/history)
+HISTORY_ENABLED: Final[bool] = True
+HISTORY_DIR: Final[str] = str(DATA_DIR / "history")
+HISTORY_SEGMENT_POINTS: Final[int] = 512  # Points per segment file (16 bytes each)
+HISTORY_HEARTBEAT_S: Final[float] = 3600  # Record an unchanged price at most this often
+HISTORY_RETENTION_S: Final[dict[str, float]] = {
+    "raw": 7 * 24 * 3600,  # Every recorded scrape
+    "hourly": 90 * 24 * 3600,  # Close/low/high per hour
+    "daily": 2 * 365 * 24 * 3600,  # Close/low/high per day
+}
+HISTORY_COMPACT_INTERVAL_S: Final[float] = 3600  # Roll-up and retention pass
+HISTORY_MAX_OPEN_SEGMENTS: Final[int] = 512  # Segment files kept mapped (least recent unmapped)
+HISTORY_BADGE_WINDOW_S: Final[float] = 30 * 24 * 3600  # "Lowest in 30 days"
+HISTORY_MAX_DAYS: Final[int] = 730  # Longest range /api/history returns
+
+# Price Watches (re-check watched products, notify on drops)
+WATCH_ENABLED: Final[bool] = True
+WATCH_DB_PATH: Final[str] = str(DATA_DIR / "watches.sqlite3")
+WATCH_DEFAULT_INTERVAL_S: Final[float] = 6 * 3600  # Re-check cadence unless the watch asks otherwise
+WATCH_MIN_INTERVAL_S: Final[float] = 3600  # Shortest cadence a watch may ask for
+WATCH_TICK_S: Final[float] = 60  # Time between scheduler cycles
+WATCH_JITTER: Final[float] = 0.1  # +/- fraction applied to cadences and ticks
+WATCH_RETRY_S: Final[float] = 900  # Next try after a product could not be read
+WATCH_MAX_DUE_PER_CYCLE: Final[int] = 2000  # Due watches examined per cycle
+WATCH_CATALOG_FRESH_S: Final[float] = 1800  # A catalog copy this recent counts as a re-check
+WATCH_PAGE_LOADS_PER_HOUR: Final[int] = 240  # Scrape budget: product page loads per hour
+WATCH_PAGE_LOAD_BURST: Final[int] = 20  # Most page loads a single cycle may spend
+WATCH_BATCH_SIZE: Final[int] = 10  # Product pages loaded per browser launch
+WATCH_CONCURRENCY: Final[int] = 2  # Batches in flight
+WATCH_MIN_DROP_PERCENT: Final[float] = 1  # Smaller drops are not notified
+WATCH_NOTIFY_PATH: Final[str] = str(DATA_DIR / "notifications.jsonl")  # Local notification sink
+WATCH_WEBHOOK_URL: Final[str | None] = None  # POST notifications here instead of the file
+WATCH_WEBHOOK_TIMEOUT_S: Final[float] = 5
+
+# Live Price Updates (/api/live WebSocket subscriptions, one refresh fanned out to every subscriber)
+LIVE_ENABLED: Final[bool] = True
+LIVE_REFRESH_S: Final[float] = 60  # How often subscribed comparisons are checked for a due refresh
+LIVE_PRODUCT_FRESH_S: Final[float] = 900  # Subscribed products not seen for this long get a page load
+LIVE_PAGE_LOADS_PER_CYCLE: Final[int] = 20  # Scrape budget for product subscriptions per cycle
+LIVE_MAX_SUBSCRIBERS: Final[int] = 2000  # Open WebSockets (more are refused)
+LIVE_MAX_TOPICS: Final[int] = 20  # Subscriptions per WebSocket
+LIVE_QUEUE_SIZE: Final[int] = 100  # Messages buffered per subscriber (oldest dropped beyond)
+LIVE_MAX_TRACKED_PRICES: Final[int] = 50000  # Last known prices kept to diff against
+
+# Search Suggestions (/api/suggest, in-memory prefix index)
+SUGGEST_MAX_RESULTS: Final[int] = 8  # Default number of suggestions
+SUGGEST_SCAN_LIMIT: Final[int] = 1000  # Index rows examined per lookup at most
+SUGGEST_TOP_PREFIX_LEN: Final[int] = 3  # Prefixes up to this length keep a ranked top list
+SUGGEST_TOP_K: Final[int] = 40  # Entries kept per short-prefix top list
+SUGGEST_SUFFIX_WORDS: Final[int] = 3  # Also match from the 2nd..4th word ("pro max" -> "iphone 15 pro max")
+SUGGEST_PRODUCT_WEIGHT: Final[float] = 0.2  # Weight per product sighting (a served query adds 1)
+SUGGEST_MAX_PRODUCTS: Final[int] = 50000  # Catalog titles loaded at startup (most recently seen)
+SUGGEST_QUERY_WINDOW_S: Final[float] = 30 * 24 * 3600  # Served queries loaded at startup
+SUGGEST_MAX_ENTRIES: Final[int] = 100000  # Phrases kept; the lowest-weighted are evicted beyond this
+
+# Trending Pre-warm (re-scrape hot queries before their cache entries expire)
+PREWARM_ENABLED: Final[bool] = True
+PREWARM_SEED_QUERIES: Final[list[str]] = [  # Frontend TrendingSearches.jsx
+    "iPhone 15",
+    "MacBook Pro",
+    "Sony Headphones",
+    "Samsung TV",
+]
+PREWARM_TOP_N: Final[int] = 20  # Hottest served queries kept warm besides the seeds
+PREWARM_MIN_HITS: Final[float] = 3  # Decayed hit count a query needs to be kept warm
+PREWARM_HIT_DECAY: Final[float] = 0.95  # Hit counts are multiplied by this every cycle
+PREWARM_INTERVAL_S: Final[float] = 45  # Base time between cycles
+PREWARM_JITTER: Final[float] = 0.2  # +/- fraction applied to intervals and refresh points
+PREWARM_REFRESH_AT: Final[float] = 0.8  # Refresh once an entry reaches this fraction of its TTL
+PREWARM_CONCURRENCY: Final[int] = 2  # Max pre-warm scrapes in flight
+
+# Speculative Prefetch (warm the cache for the top suggestion while the user types)
+PREFETCH_ENABLED: Final[bool] = True
+PREFETCH_MIN_PREFIX_LEN: Final[int] = 3  # Shorter prefixes say too little about the query
+PREFETCH_MIN_CONFIDENCE: Final[float] = 0.5  # Share of the suggestions' weight the top one must hold
+PREFETCH_MIN_WEIGHT: Final[float] = 3  # Times the top suggestion must have been served
+PREFETCH_CLIENT_RATE_PER_MIN: Final[float] = 4  # Prefetches a client earns per minute
+PREFETCH_CLIENT_BURST: Final[int] = 2  # Prefetches a client may use at once
+PREFETCH_MAX_CLIENTS: Final[int] = 10000  # Client rate limit buckets kept (least recent dropped)
+PREFETCH_MAX_IN_FLIGHT: Final[int] = 2  # Queries being prefetched at once
+PREFETCH_HIT_WINDOW_S: Final[float] = 120  # A compare this soon after a prefetch counts as a hit
+
+# HTTP Caching (ETag / Last-Modified / Cache-Control on /api/compare and /api/search)
+HTTP_CACHE_MAX_AGE_CAP_S: Final[int] = 300  # Upper bound for Cache-Control max-age
+HTTP_CACHE_STALE_WHILE_REVALIDATE_S: Final[int] = 60  # Offered to browsers/CDNs on cacheable answers
+HTTP_VALIDATOR_MEMO_SIZE: Final[int] = 5000  # Requests whose ETag/data version is remembered
+
+# Query Log & Startup Warm-up (replay recently served queries after a deploy)
+QUERY_LOG_ENABLED: Final[bool] = True
+QUERY_LOG_PATH: Final[str] = str(DATA_DIR / "query_log.jsonl")
+QUERY_LOG_FLUSH_S: Final[float] = 10  # Pending counts are appended this often
+QUERY_LOG_MAX_BYTES: Final[int] = 8 * 1024 * 1024  # Compact to one line per query beyond this
+WARMUP_TOP_N: Final[int] = 50  # Queries replayed on startup
+WARMUP_WINDOW_S: Final[float] = 3 * 24 * 3600  # Only replay queries served this recently
+WARMUP_CONCURRENCY: Final[int] = 3  # Max warm-up scrapes in flight
+WARMUP_READY_FRACTION: Final[float] = 0.8  # /ready reports ready once this share is warm
+WARMUP_MAX_WAIT_S: Final[float] = 300  # ...or after this long, whatever the progress
+
+# Priority Scheduling (shares scraper slots between classes of work)
+PRIORITY_WEIGHTS: Final[dict[str, int]] = {
+    "interactive": 8,  # /api/compare, /api/search
+    "batch": 3,  # bulk jobs
+    "background": 1,  # refresh / pre-warm
+}
+SCHEDULER_RESERVED_INTERACTIVE_SLOTS: Final[int] = 2  # Slots only interactive work may use
+SCHEDULER_STARVATION_AFTER_S: Final[float] = 20  # Serve any waiter queued longer than this
+
+# Admission Control (load shedding)
+# mode "reject"  -> 429 + Retry-After once estimated queue wait exceeds target
+# mode "degrade" -> admit with a short scraper timeout (partial answer) until
+#                   wait exceeds target * ADMISSION_DEGRADE_HARD_FACTOR, then reject
+ADMISSION_ROUTE_POLICIES: Final[dict[str, dict]] = {
+    "/api/compare": {"mode": "degrade", "target_wait_s": 8.0, "max_in_flight": 12, "jobs": 4},
+    "/api/compare/stream": {"mode": "degrade", "target_wait_s": 8.0, "max_in_flight": 12, "jobs": 4},
+    "/api/compare/batch": {"mode": "reject", "target_wait_s": 15.0, "max_in_flight": 4, "jobs": 4},
+    "/api/search": {"mode": "reject", "target_wait_s": 5.0, "max_in_flight": 6, "jobs": 1},
+    "/api/product": {"mode": "reject", "target_wait_s": 5.0, "max_in_flight": 6, "jobs": 4},
+    "/api/product/refresh": {"mode": "reject", "target_wait_s": 5.0, "max_in_flight": 6, "jobs": 1},
+}
+ADMISSION_DEGRADE_HARD_FACTOR: Final[float] = 2.0
+ADMISSION_RETRY_AFTER_MAX_S: Final[int] = 60
+DEGRADED_SCRAPER_TIMEOUT_S: Final[float] = 8  # Per-scraper timeout for degraded requests
 
 # Fuzzy Matching Thresholds
 SIMILARITY_THRESHOLD: Final[float] = 50  # Minimum match score (0-100)
 MAX_PRICE_DIFF_PERCENT: Final[float] = 35  # Max acceptable price variance
+MATCH_FEATURE_CACHE_SIZE: Final[int] = 20000  # Titles whose match features are memoized
+MATCH_SCORE_CACHE_SIZE: Final[int] = 100000  # Title pairs whose similarity score is memoized
 
 # Query Boosting Parameters
 QUERY_EXACT_MATCH_BOOST: Final[float] = 15  # Boost for exact phrase match
 QUERY_TOKEN_MATCH_BOOST: Final[float] = 8  # Boost for all tokens present
 MIN_FILTERED_PRODUCTS: Final[int] = 3  # Fallback if too few filtered
 
+# Query Canonicalization (app.core.text_utils.canonicalize_query)
+QUERY_UNITS: Final[list[str]] = [
+    "gb", "tb", "mb", "mah", "mp", "hz", "w", "inch", "cm", "mm", "ghz", "l", "kg", "g"
+]
+QUERY_UNIT_ALIASES: Final[dict[str, str]] = {
+    "inches": "inch",
+    '"': "inch",
+    "litre": "l",
+    "liter": "l",
+    "ltr": "l",
+}
+QUERY_BRAND_ALIASES: Final[dict[str, str]] = {  # spelling -> canonical brand/line
+    "one plus": "oneplus",
+    "1+": "oneplus",
+    "hewlett packard": "hp",
+    "mi": "xiaomi",
+    "i phone": "iphone",
+    "mac book": "macbook",
+    "air pods": "airpods",
+    "play station": "playstation",
+    "lg electronics": "lg",
+}
+QUERY_IMPLIED_BRANDS: Final[dict[str, str]] = {  # product line -> brand it implies
+    "iphone": "apple",
+    "ipad": "apple",
+    "macbook": "apple",
+    "airpods": "apple",
+    "galaxy": "samsung",
+    "pixel": "google",
+    "redmi": "xiaomi",
+    "thinkpad": "lenovo",
+    "playstation": "sony",
+}
+QUERY_STOP_WORDS: Final[set[str]] = {
+    "the", "for", "of", "in", "buy", "online", "price", "prices",
+    "best", "cheapest", "india",
+}
+QUERY_ORDER_SENSITIVE_WORDS: Final[set[str]] = {  # keep token order if present
+    "to", "vs", "versus", "from", "without", "not",
+}
+NORMALIZE_CACHE_SIZE: Final[int] = 50000  # Queries and titles whose normalized text is memoized
+
+# Product Page Refresh
+# A detail page load re-reads price, MRP, availability and rating of one
+# known product; links are only followed to the platform's own hosts
+PRODUCT_REFRESH_TIMEOUT_S: Final[float] = 15  # Max seconds for one detail page refresh
+PRODUCT_HOSTS: Final[dict[str, set[str]]] = {
+    "flipkart": {"www.flipkart.com", "flipkart.com", "dl.flipkart.com"},
+    "amazon": {"www.amazon.in", "amazon.in"},
+    "croma": {"www.croma.com", "croma.com"},
+    "reliancedigital": {"www.reliancedigital.in", "reliancedigital.in"},
+}
+
 # Platform names
 PLATFORMS: Final[list[str]] = [
     "flipkart",
@@ -43,11 +293,146 @@ PLATFORMS: Final[list[str]] = [
 # ============================================
 __all__ = [
     "logger",
+    "DATA_DIR",
     "MAX_WORKERS",
+    "SCRAPER_TIMEOUT_S",
+    "AUTOSCALE_MIN_WORKERS",
+    "AUTOSCALE_MAX_WORKERS",
+    "AUTOSCALE_INTERVAL_S",
+    "AUTOSCALE_UP_WAIT_S",
+    "AUTOSCALE_UP_UTILIZATION",
+    "AUTOSCALE_DOWN_UTILIZATION",
+    "AUTOSCALE_UP_TICKS",
+    "AUTOSCALE_DOWN_TICKS",
+    "AUTOSCALE_COOLDOWN_S",
+    "AUTOSCALE_STEP_UP",
+    "AUTOSCALE_BROWSER_MEMORY_MB",
+    "AUTOSCALE_MIN_FREE_MEMORY_MB",
+    "SCRAPER_DURATION_SEED_S",
+    "SCRAPER_MAX_PRODUCTS",
+    "DEADLINE_HEADER",
+    "MIN_DEADLINE_MS",
+    "MAX_DEADLINE_MS",
+    "QUORUM_ANCHOR_PLATFORM",
+    "QUORUM_SOFT_DEADLINE_S",
+    "STREAM_HEARTBEAT_S",
+    "COMPARE_BATCH_MAX_QUERIES",
+    "COMPARE_BATCH_CONCURRENCY",
+    "COMPARE_BATCH_QUERY_CHARS",
+    "RESULT_CACHE_TTL_S",
+    "RESULT_CACHE_PLATFORM_TTLS",
+    "RESULT_CACHE_STALE_GRACE_S",
+    "RESULT_CACHE_MAX_BYTES",
+    "RESULT_CACHE_MAX_ENTRIES",
+    "NEGATIVE_CACHE_EMPTY_TTL_S",
+    "NEGATIVE_CACHE_FAILED_TTL_S",
+    "NEGATIVE_CACHE_MAX_ENTRIES",
+    "COMPARISON_MEMO_MAX_ENTRIES",
+    "COMPARISON_MEMO_L2_TTL_S",
+    "L2_CACHE_ENABLED",
+    "L2_CACHE_PATH",
+    "L2_CACHE_MAX_BYTES",
+    "L2_CACHE_EVICT_EVERY",
+    "CATALOG_ENABLED",
+    "CATALOG_PATH",
+    "CATALOG_FRESH_S",
+    "CATALOG_QUERY_TTL_S",
+    "SEARCH_INDEX_FRESH_S",
+    "HISTORY_ENABLED",
+    "HISTORY_DIR",
+    "HISTORY_SEGMENT_POINTS",
+    "HISTORY_HEARTBEAT_S",
+    "HISTORY_RETENTION_S",
+    "HISTORY_COMPACT_INTERVAL_S",
+    "HISTORY_MAX_OPEN_SEGMENTS",
+    "HISTORY_BADGE_WINDOW_S",
+    "HISTORY_MAX_DAYS",
+    "WATCH_ENABLED",
+    "WATCH_DB_PATH",
+    "WATCH_DEFAULT_INTERVAL_S",
+    "WATCH_MIN_INTERVAL_S",
+    "WATCH_TICK_S",
+    "WATCH_JITTER",
+    "WATCH_RETRY_S",
+    "WATCH_MAX_DUE_PER_CYCLE",
+    "WATCH_CATALOG_FRESH_S",
+    "WATCH_PAGE_LOADS_PER_HOUR",
+    "WATCH_PAGE_LOAD_BURST",
+    "WATCH_BATCH_SIZE",
+    "WATCH_CONCURRENCY",
+    "WATCH_MIN_DROP_PERCENT",
+    "WATCH_NOTIFY_PATH",
+    "WATCH_WEBHOOK_URL",
+    "WATCH_WEBHOOK_TIMEOUT_S",
+    "LIVE_ENABLED",
+    "LIVE_REFRESH_S",
+    "LIVE_PRODUCT_FRESH_S",
+    "LIVE_PAGE_LOADS_PER_CYCLE",
+    "LIVE_MAX_SUBSCRIBERS",
+    "LIVE_MAX_TOPICS",
+    "LIVE_QUEUE_SIZE",
+    "LIVE_MAX_TRACKED_PRICES",
+    "SUGGEST_MAX_RESULTS",
+    "SUGGEST_SCAN_LIMIT",
+    "SUGGEST_TOP_PREFIX_LEN",
+    "SUGGEST_TOP_K",
+    "SUGGEST_SUFFIX_WORDS",
+    "SUGGEST_PRODUCT_WEIGHT",
+    "SUGGEST_MAX_PRODUCTS",
+    "SUGGEST_QUERY_WINDOW_S",
+    "SUGGEST_MAX_ENTRIES",
+    "PREWARM_ENABLED",
+    "PREWARM_SEED_QUERIES",
+    "PREWARM_TOP_N",
+    "PREWARM_MIN_HITS",
+    "PREWARM_HIT_DECAY",
+    "PREWARM_INTERVAL_S",
+    "PREWARM_JITTER",
+    "PREWARM_REFRESH_AT",
+    "PREWARM_CONCURRENCY",
+    "PREFETCH_ENABLED",
+    "PREFETCH_MIN_PREFIX_LEN",
+    "PREFETCH_MIN_CONFIDENCE",
+    "PREFETCH_MIN_WEIGHT",
+    "PREFETCH_CLIENT_RATE_PER_MIN",
+    "PREFETCH_CLIENT_BURST",
+    "PREFETCH_MAX_CLIENTS",
+    "PREFETCH_MAX_IN_FLIGHT",
+    "PREFETCH_HIT_WINDOW_S",
+    "HTTP_CACHE_MAX_AGE_CAP_S",
+    "HTTP_CACHE_STALE_WHILE_REVALIDATE_S",
+    "HTTP_VALIDATOR_MEMO_SIZE",
+    "QUERY_LOG_ENABLED",
+    "QUERY_LOG_PATH",
+    "QUERY_LOG_FLUSH_S",
+    "QUERY_LOG_MAX_BYTES",
+    "WARMUP_TOP_N",
+    "WARMUP_WINDOW_S",
+    "WARMUP_CONCURRENCY",
+    "WARMUP_READY_FRACTION",
+    "WARMUP_MAX_WAIT_S",
+    "PRIORITY_WEIGHTS",
+    "SCHEDULER_RESERVED_INTERACTIVE_SLOTS",
+    "SCHEDULER_STARVATION_AFTER_S",
+    "ADMISSION_ROUTE_POLICIES",
+    "ADMISSION_DEGRADE_HARD_FACTOR",
+    "ADMISSION_RETRY_AFTER_MAX_S",
+    "DEGRADED_SCRAPER_TIMEOUT_S",
     "SIMILARITY_THRESHOLD",
     "MAX_PRICE_DIFF_PERCENT",
+    "MATCH_FEATURE_CACHE_SIZE",
+    "MATCH_SCORE_CACHE_SIZE",
     "QUERY_EXACT_MATCH_BOOST",
     "QUERY_TOKEN_MATCH_BOOST",
     "MIN_FILTERED_PRODUCTS",
+    "QUERY_UNITS",
+    "QUERY_UNIT_ALIASES",
+    "QUERY_BRAND_ALIASES",
+    "QUERY_IMPLIED_BRANDS",
+    "QUERY_STOP_WORDS",
+    "QUERY_ORDER_SENSITIVE_WORDS",
+    "NORMALIZE_CACHE_SIZE",
+    "PRODUCT_REFRESH_TIMEOUT_S",
+    "PRODUCT_HOSTS",
     "PLATFORMS",
 ]
\ No newline at end of file
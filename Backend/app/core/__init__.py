@@ -2,8 +2,20 @@
 """Core utilities for data processing, matching, and formatting"""
 
 from app.core.price_utils import extract_price, is_price_valid_for_match, calculate_savings
-from app.core.text_utils import extract_product_model, boost_score_with_query, soft_filter_by_query
-from app.core.matcher import find_best_match, match_products_across_platforms
+from app.core.text_utils import (
+    normalize_text,
+    clean_query,
+    canonicalize_query,
+    extract_product_model,
+    boost_score_with_query,
+    soft_filter_by_query,
+)
+from app.core.matcher import (
+    find_best_match,
+    MatchSession,
+    match_products_across_platforms,
+    match_cache_stats,
+)
 from app.core.formatter import format_product, build_comparison_result, build_bulk_comparison
 
 __all__ = [
@@ -12,12 +24,17 @@ __all__ = [
     "is_price_valid_for_match",
     "calculate_savings",
     # Text utilities
+    "normalize_text",
+    "clean_query",
+    "canonicalize_query",
     "extract_product_model",
     "boost_score_with_query",
     "soft_filter_by_query",
     # Matching
     "find_best_match",
+    "MatchSession",
     "match_products_across_platforms",
+    "match_cache_stats",
     # Formatting
     "format_product",
     "build_comparison_result",
@@ -4,9 +4,72 @@ Product matching and fuzzy search logic
 Handles cross-platform product matching using fuzzy algorithms
 """
 
-from rapidfuzz import process, fuzz
-from app.config import logger, SIMILARITY_THRESHOLD
-from app.core.text_utils import extract_product_model, boost_score_with_query
+from functools import lru_cache
+from rapidfuzz import fuzz
+from app.config import (
+    logger,
+    SIMILARITY_THRESHOLD,
+    MATCH_FEATURE_CACHE_SIZE,
+    MATCH_SCORE_CACHE_SIZE,
+)
+from app.core.text_utils import normalize_text, extract_product_model, boost_score_with_query, soft_filter_by_query
+
+
+# ============================================
+# MEMOIZED FEATURES & SCORES
+# ============================================
+# Popular products appear under many queries, so the same titles and
+# title pairs are matched over and over. token_sort_ratio(a, b) equals
+# ratio(sorted tokens of a, sorted tokens of b); both halves are cached.
+
+@lru_cache(maxsize=MATCH_FEATURE_CACHE_SIZE)
+def title_features(title: str) -> tuple[str, str]:
+    """
+    Match features of a title: (token-sorted title, token-sorted product model)
+    
+    Example:
+        >>> title_features("Dell XPS 13 (2023) i7")
+        ("(2023) 13 Dell XPS i7", "13 dell i7 xps")
+    """
+    model = extract_product_model(title)
+    return " ".join(sorted(title.split())), " ".join(sorted(model.split()))
+
+
+@lru_cache(maxsize=MATCH_SCORE_CACHE_SIZE)
+def _sorted_ratio(a: str, b: str) -> float:
+    return fuzz.ratio(a, b)
+
+
+def pair_score(a: str, b: str) -> float:
+    """Similarity (0-100) of two token-sorted strings, memoized for either order"""
+    return _sorted_ratio(a, b) if a <= b else _sorted_ratio(b, a)
+
+
+def _best_candidate(reference: str, candidates: list[str]) -> tuple[int | None, float]:
+    """Index and score of the best scoring candidate (first one on ties)"""
+    best_idx, best_score = None, -1.0
+    for idx, candidate in enumerate(candidates):
+        score = pair_score(reference, candidate)
+        if score > best_score:
+            best_idx, best_score = idx, score
+    return best_idx, best_score
+
+
+def match_cache_stats() -> dict:
+    """Hit rates and sizes of the feature, pair score and text normalization caches"""
+    stats = {}
+    caches = (("features", title_features), ("pair_scores", _sorted_ratio), ("normalized_text", normalize_text))
+    for name, cached in caches:
+        info = cached.cache_info()
+        lookups = info.hits + info.misses
+        stats[name] = {
+            "hits": info.hits,
+            "misses": info.misses,
+            "hit_rate": round(info.hits / lookups, 3) if lookups else 0.0,
+            "size": info.currsize,
+            "max_size": info.maxsize,
+        }
+    return stats
 
 
 def find_best_match(
@@ -27,10 +90,10 @@ def find_best_match(
         products_list: List of product dicts with 'title' key
         threshold: Minimum score to accept match (0-100)
         user_query: Optional query for score boosting
-        
+    
     Returns:
         dict: {"product": {...}, "score": float} or None if no match
-        
+    
     Example:
         >>> fk_product = {"title": "Dell XPS 13 Core i7"}
         >>> amz_products = [{"title": "Dell XPS 13 (i7) 2022"}]
@@ -42,45 +105,25 @@ def find_best_match(
         logger.debug("No products to match against")
         return None
     
-    titles = [p.get("title", "") for p in products_list]
+    ref_title, ref_model = title_features(reference_title)
+    features = [title_features(p.get("title", "")) for p in products_list]
     
     # STRATEGY 1: Full title matching with token sort
     logger.debug(f"Attempting full title match for: {reference_title[:50]}...")
-    best_match = process.extractOne(
-        reference_title,
-        titles,
-        scorer=fuzz.token_sort_ratio
-    )
+    idx, best_score = _best_candidate(ref_title, [f[0] for f in features])
     
     # If poor match, try model-based matching
-    use_model = False
-    if not best_match or best_match[1] < threshold:
-        logger.debug(f"Full match score {best_match[1] if best_match else 'N/A'} < {threshold}, trying model matching...")
-        
-        ref_model = extract_product_model(reference_title)
-        models = [extract_product_model(t) for t in titles]
-        
-        best_match = process.extractOne(
-            ref_model,
-            models,
-            scorer=fuzz.token_sort_ratio
-        )
-        use_model = True
+    if best_score < threshold:
+        logger.debug(f"Full match score {best_score} < {threshold}, trying model matching...")
+        idx, best_score = _best_candidate(ref_model, [f[1] for f in features])
     
     # No acceptable match found
-    if not best_match or best_match[1] < threshold:
+    if idx is None or best_score < threshold:
         logger.debug(f"No match found above threshold {threshold}")
         return None
     
-    # Get the matched product
-    if use_model:
-        models = [extract_product_model(t) for t in titles]
-        idx = models.index(best_match[0])
-    else:
-        idx = titles.index(best_match[0])
-    
     product = products_list[idx]
-    score = float(best_match[1])
+    score = float(best_score)
     
     # Boost score if close to user query
     if user_query:
@@ -96,6 +139,100 @@ def find_best_match(
     }
 
 
+# Anchor platform every match row starts from, and the row keys of the others
+ANCHOR_PLATFORM = "flipkart"
+MATCH_KEYS: dict[str, str] = {"amazon": "amazon", "croma": "croma", "reliancedigital": "reliance"}
+
+
+class MatchSession:
+    """
+    Incremental cross-platform matching for one query
+    
+    Created with the anchor (Flipkart) products, one row each; every
+    other platform's products are folded in when they arrive. Adding a
+    platform matches only that platform against the rows, so a platform
+    that arrives late costs its own matching work instead of a full
+    recompute. Adding a platform again (e.g. refreshed products)
+    replaces its matches.
+    
+    Once every platform is added, matches() equals
+    match_products_across_platforms() over the same products.
+    
+    Example:
+        >>> session = MatchSession(flipkart_products, user_query="iphone 15")
+        >>> session.add_platform("croma", croma_products)
+        [0, 2]
+        >>> session.row(0)["croma"]["title"]
+        'Apple iPhone 15 (128GB, Black)'
+    """
+    
+    def __init__(self, anchor_products: list[dict], user_query: str | None = None):
+        """
+        Start a session from the anchor platform's products
+        
+        Args:
+            anchor_products: Reference products (Flipkart), one row each
+            user_query: Optional query for filtering and score boosting
+        """
+        self.user_query = user_query
+        self.platforms: set[str] = set()
+        self._rows = []
+        for product in anchor_products:
+            row = {ANCHOR_PLATFORM: product, f"{ANCHOR_PLATFORM}_score": 100}
+            for key in MATCH_KEYS.values():
+                row[key] = None
+                row[f"{key}_score"] = 0
+            self._rows.append(row)
+    
+    def __len__(self) -> int:
+        return len(self._rows)
+    
+    def add_platform(self, platform: str, products: list[dict] | None) -> list[int]:
+        """
+        Match one platform's products against every row
+        
+        Args:
+            platform: amazon, croma or reliancedigital
+            products: The platform's products (None or [] clears its matches)
+        
+        Returns:
+            list: Indices of the rows whose match on `platform` changed
+        
+        Raises:
+            ValueError: If `platform` is the anchor or unknown
+        """
+        key = MATCH_KEYS.get(platform)
+        if key is None:
+            raise ValueError(f"Cannot add '{platform}' to a match session")
+        
+        # Soft filter by query for better matching (same for every row, so done once)
+        candidates = soft_filter_by_query(products or [], self.user_query or "")
+        changed = []
+        for idx, row in enumerate(self._rows):
+            match = find_best_match(
+                row[ANCHOR_PLATFORM].get("title", ""),
+                candidates,
+                user_query=self.user_query
+            )
+            product, score = (match["product"], match["score"]) if match else (None, 0)
+            if row[key] != product or row[f"{key}_score"] != score:
+                row[key] = product
+                row[f"{key}_score"] = score
+                changed.append(idx)
+        
+        self.platforms.add(platform)
+        logger.debug(f"Matched {platform}: {len(changed)} of {len(self._rows)} rows changed")
+        return changed
+    
+    def row(self, idx: int) -> dict:
+        """Match row `idx` (same keys as match_products_across_platforms results)"""
+        return dict(self._rows[idx])
+    
+    def matches(self) -> list[dict]:
+        """Every match row, in anchor product order"""
+        return [dict(row) for row in self._rows]
+
+
 def match_products_across_platforms(
     flipkart_products: list[dict],
     amazon_products: list[dict],
@@ -115,56 +252,22 @@ def match_products_across_platforms(
         croma_products: Products to match from Croma
         reliance_products: Products to match from Reliance
         user_query: Optional query for better matching
-        
+    
     Returns:
         list: Comparison results with matches from all platforms
     """
-    from app.core.text_utils import soft_filter_by_query
-    
-    results = []
-    
-    for fk_product in flipkart_products:
-        # Soft filter each platform's products by query for better matching
-        amz_filtered = soft_filter_by_query(amazon_products, user_query or "")
-        croma_filtered = soft_filter_by_query(croma_products, user_query or "")
-        reliance_filtered = soft_filter_by_query(reliance_products, user_query or "")
-        
-        # Find best match on each platform
-        amz_match = find_best_match(
-            fk_product.get("title", ""),
-            amz_filtered,
-            user_query=user_query
-        )
-        
-        croma_match = find_best_match(
-            fk_product.get("title", ""),
-            croma_filtered,
-            user_query=user_query
-        )
-        
-        reliance_match = find_best_match(
-            fk_product.get("title", ""),
-            reliance_filtered,
-            user_query=user_query
-        )
-        
-        result = {
-            "flipkart": fk_product,
-            "flipkart_score": 100,
-            "amazon": amz_match["product"] if amz_match else None,
-            "amazon_score": amz_match["score"] if amz_match else 0,
-            "croma": croma_match["product"] if croma_match else None,
-            "croma_score": croma_match["score"] if croma_match else 0,
-            "reliance": reliance_match["product"] if reliance_match else None,
-            "reliance_score": reliance_match["score"] if reliance_match else 0,
-        }
-        
-        results.append(result)
-    
-    return results
+    session = MatchSession(flipkart_products, user_query)
+    session.add_platform("amazon", amazon_products)
+    session.add_platform("croma", croma_products)
+    session.add_platform("reliancedigital", reliance_products)
+    return session.matches()
 
 
 __all__ = [
+    "title_features",
+    "pair_score",
+    "match_cache_stats",
     "find_best_match",
+    "MatchSession",
     "match_products_across_platforms"
 ]
\ No newline at end of file
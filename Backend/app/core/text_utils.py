@@ -5,12 +5,113 @@ Handles title normalization and query-aware matching
 """
 
 import re
+import unicodedata
+from functools import lru_cache
 from app.config import (
     logger,
     QUERY_EXACT_MATCH_BOOST,
-    QUERY_TOKEN_MATCH_BOOST
+    QUERY_TOKEN_MATCH_BOOST,
+    QUERY_UNITS,
+    QUERY_UNIT_ALIASES,
+    QUERY_BRAND_ALIASES,
+    QUERY_IMPLIED_BRANDS,
+    QUERY_STOP_WORDS,
+    QUERY_ORDER_SENSITIVE_WORDS,
+    NORMALIZE_CACHE_SIZE,
 )
 
+# Canonicalization patterns, longest alternatives first so "mah" wins over "m..."
+_UNIT_FORMS = sorted([*QUERY_UNITS, *QUERY_UNIT_ALIASES], key=len, reverse=True)
+_UNIT_RE = re.compile(
+    r'(\d+(?:\.\d+)?)\s*(' + '|'.join(re.escape(u) for u in _UNIT_FORMS) + r')(?![a-z0-9])'
+)
+_ALIAS_RE = re.compile(
+    r'(?<![\w])(' + '|'.join(
+        re.escape(a) for a in sorted(QUERY_BRAND_ALIASES, key=len, reverse=True)
+    ) + r')(?![\w])'
+)
+_PUNCT_RE = re.compile(r'[^\w\s.+]|_|(?<!\d)\.|\.(?!\d)')
+_GLUED_MODEL_RE = re.compile(r'\b([a-z]{4,})(\d{1,4})\b')
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def normalize_text(text: str) -> str:
+    """
+    Normalize a query or product title for comparison
+    
+    Lowercases, applies brand alias spellings, joins numbers to their
+    units ("128 GB" -> "128gb"), strips punctuation and splits product
+    lines glued to their number ("iPhone15" -> "iphone 15"). Memoized:
+    the same titles are normalized on every search that returns them.
+    
+    Args:
+        text: Raw query or title
+    
+    Returns:
+        str: Normalized, single-spaced text
+    
+    Example:
+        >>> normalize_text("Apple iPhone15 (128 GB) - Black")
+        "apple iphone 15 128gb black"
+    """
+    text = unicodedata.normalize("NFKC", text).lower()
+    text = _ALIAS_RE.sub(lambda m: QUERY_BRAND_ALIASES[m.group(1)], text)
+    text = _UNIT_RE.sub(
+        lambda m: f" {m.group(1)}{QUERY_UNIT_ALIASES.get(m.group(2), m.group(2))} ", text
+    )
+    text = _PUNCT_RE.sub(' ', text)
+    text = _GLUED_MODEL_RE.sub(r'\1 \2', text)
+    return ' '.join(text.split())
+
+
+def clean_query(query: str) -> str:
+    """
+    Search query as sent to the scrapers
+    
+    Only Unicode-normalized and single-spaced: brand names, units and word
+    order stay as the user typed them, since they change what each
+    platform's search returns. Cache and dedup keys come from
+    canonicalize_query() instead.
+    
+    Example:
+        >>> clean_query("  Samsung Galaxy  S24 ")
+        "Samsung Galaxy S24"
+    """
+    return ' '.join(unicodedata.normalize("NFKC", query).split())
+
+
+def canonicalize_query(query: str) -> tuple[str, str]:
+    """
+    Canonical form of a search query for cache keys, dedup and matching
+    
+    On top of normalize_text(), drops stop words and brand names implied
+    by a product line ("apple iphone" -> "iphone"). The key also sorts
+    tokens unless the query contains order-sensitive words ("usb c to a").
+    
+    Args:
+        query: User search query
+    
+    Returns:
+        tuple: (key, display) - key is stable across equivalent spellings,
+               display is the cleaned query in the user's word order
+               (canonicalize_query(display) yields the same key)
+    
+    Example:
+        >>> canonicalize_query("Apple iPhone15 128 GB")
+        ("128gb 15 iphone", "iphone 15 128gb")
+    """
+    tokens = normalize_text(query).split()
+    
+    implied = {QUERY_IMPLIED_BRANDS[t] for t in tokens if t in QUERY_IMPLIED_BRANDS}
+    kept = [t for t in tokens if t not in QUERY_STOP_WORDS and t not in implied]
+    if kept:
+        tokens = kept
+    
+    display = ' '.join(tokens)
+    if QUERY_ORDER_SENSITIVE_WORDS.intersection(tokens):
+        return display, display
+    return ' '.join(sorted(tokens)), display
+
 
 def extract_product_model(title: str) -> str:
     """
@@ -21,10 +122,10 @@ def extract_product_model(title: str) -> str:
     
     Args:
         title: Full product title
-        
+    
     Returns:
         str: Cleaned product model
-        
+    
     Example:
         >>> extract_product_model("Dell XPS 13 (2023) - Intel i7 16GB RAM")
         "dell xps 13 intel"
@@ -63,16 +164,16 @@ def boost_score_with_query(
         raw_title: Product title from platform
         user_query: User's search query
         base_score: Base fuzzy match score (0-100)
-        
+    
     Returns:
         float: Boosted score (capped at 100)
-        
+    
     Example:
         >>> boost_score_with_query("MacBook Pro M2 2022", "MacBook Pro M2", 85)
         93  # +8 boost for token match
     """
-    t = raw_title.lower()
-    q = user_query.lower().strip()
+    t = normalize_text(raw_title)
+    q = normalize_text(user_query)
     
     if not q:
         return base_score
@@ -109,10 +210,10 @@ def soft_filter_by_query(
         products: List of product dicts with 'title' key
         user_query: User's search query
         keep_if_missing: Minimum products to keep before fallback
-        
+    
     Returns:
         list: Filtered products or original if too few matches
-        
+    
     Example:
         >>> products = [
         ...     {"title": "Dell XPS 13 Core i7"},
@@ -122,7 +223,7 @@ def soft_filter_by_query(
         >>> soft_filter_by_query(products, "Dell XPS")
         [{"title": "Dell XPS 13 Core i7"}]
     """
-    q = user_query.lower().strip()
+    q = normalize_text(user_query)
     
     if not q:
         return products
@@ -130,7 +231,7 @@ def soft_filter_by_query(
     tokens = [t for t in q.split() if t]
     
     def is_relevant(title: str) -> bool:
-        t = title.lower()
+        t = normalize_text(title)
         return all(tok in t for tok in tokens)
     
     filtered = [p for p in products if is_relevant(p.get("title", ""))]
@@ -148,6 +249,9 @@ def soft_filter_by_query(
 
 
 __all__ = [
+    "normalize_text",
+    "clean_query",
+    "canonicalize_query",
     "extract_product_model",
     "boost_score_with_query",
     "soft_filter_by_query"
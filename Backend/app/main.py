@@ -11,7 +11,7 @@ from app.config import logger
 from app.middleware.cors_config import setup_middlewares
 
 # Import all routers
-from app.routes import comparison, health
+from app.routes import comparison, health, watch, live
 
 # ============================================
 # APP INITIALIZATION
@@ -27,7 +27,11 @@ app = FastAPI(
 # MIDDLEWARE SETUP
 # ============================================
 
-setup_middlewares(app)
+setup_middlewares(app, executor=comparison.orchestrator.executor)
+
+# Expose the shared orchestrator to routes that report on it (e.g. /status)
+app.state.orchestrator = comparison.orchestrator
+app.state.http_validators = comparison.validators
 
 # ============================================
 # ROUTE REGISTRATION
@@ -39,6 +43,12 @@ app.include_router(health.router)
 # Comparison routes
 app.include_router(comparison.router)
 
+# Price-watch routes
+app.include_router(watch.router)
+
+# Live price update routes (WebSocket)
+app.include_router(live.router)
+
 # ============================================
 # ROOT ENDPOINT
 # ============================================
@@ -63,6 +73,7 @@ async def root():
 async def startup_event():
     """Initialize resources on startup"""
     logger.info("🚀 Mayabu API starting up...")
+    comparison.orchestrator.start()
     logger.info("✅ All systems initialized")
 
 
@@ -70,6 +81,8 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup resources on shutdown"""
     logger.info("🛑 Mayabu API shutting down...")
+    await comparison.orchestrator.stop()
+    comparison.orchestrator.shutdown()
     logger.info("✅ Cleanup completed")
 
 
@@ -88,7 +101,18 @@ Endpoints:
 - GET  /health              - Health check
 - GET  /status              - Detailed status
 - GET  /api/compare         - Compare prices across platforms
+- GET  /api/compare/stream  - Same comparison as Server-Sent Events, per platform
+- POST /api/compare/batch   - Many comparisons in one request, NDJSON
 - GET  /api/search          - Search products on specific platform
+- GET  /api/product         - Refresh one comparison from product pages
+- GET  /api/suggest         - Autocomplete search suggestions
+- GET  /api/product/refresh - Refresh one product by its link
+- GET  /api/history         - Price history of one product
+- POST /api/watch           - Watch a product for price drops
+- GET  /api/watch           - List watches
+- GET  /api/watch/{id}      - One watch and its last price
+- DELETE /api/watch/{id}    - Stop watching a product
+- WS   /api/live            - Live price updates for subscribed comparisons/products
 
 Examples:
     curl http://localhost:8000/health
@@ -2,5 +2,15 @@
 """Middleware and configuration"""
 
 from app.middleware.cors_config import setup_cors_middleware, setup_middlewares
+from app.middleware.admission import AdmissionController, setup_admission_middleware
+from app.middleware.http_cache import ValidatorMemo, content_etag, etag_matches
 
-__all__ = ["setup_cors_middleware", "setup_middlewares"]
\ No newline at end of file
+__all__ = [
+    "setup_cors_middleware",
+    "setup_middlewares",
+    "AdmissionController",
+    "setup_admission_middleware",
+    "ValidatorMemo",
+    "content_etag",
+    "etag_matches",
+]
\ No newline at end of file
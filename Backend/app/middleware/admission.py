@@ -0,0 +1,208 @@
+# app/middleware/admission.py
+"""
+Admission control and load shedding
+Bounds concurrent work per route based on scraper capacity and queue wait
+"""
+
+import math
+import threading
+import weakref
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+from app.config import (
+    logger,
+    ADMISSION_ROUTE_POLICIES,
+    ADMISSION_DEGRADE_HARD_FACTOR,
+    ADMISSION_RETRY_AFTER_MAX_S,
+)
+
+
+class AdmissionController:
+    """
+    Decides whether a request is admitted, degraded or rejected
+    
+    Uses the executor's estimated queue wait for the jobs a request would
+    submit, plus a per-route cap on in-flight requests. Routes without a
+    policy are always admitted.
+    """
+    
+    def __init__(self, executor, policies: dict[str, dict] = ADMISSION_ROUTE_POLICIES):
+        """
+        Args:
+            executor: ScraperExecutor providing estimate_queue_wait() and stats()
+            policies: {path: {"mode", "target_wait_s", "max_in_flight", "jobs"}}
+        """
+        self.executor = executor
+        self.policies = policies
+        self._lock = threading.Lock()
+        self._in_flight = {path: 0 for path in policies}
+        self._counters = {
+            path: {"admitted": 0, "degraded": 0, "rejected": 0}
+            for path in policies
+        }
+    
+    def evaluate(self, path: str) -> tuple[str, float]:
+        """
+        Evaluate a request against its route policy
+        
+        Args:
+            path: Request URL path
+        
+        Returns:
+            tuple: (decision, estimated_wait_s) where decision is
+                   "admit", "degrade" or "reject"
+        """
+        policy = self.policies.get(path)
+        if not policy:
+            return "admit", 0.0
+        
+        wait = self.executor.estimate_queue_wait(policy.get("jobs", 1))
+        target = policy["target_wait_s"]
+        
+        with self._lock:
+            in_flight = self._in_flight[path]
+        
+        if in_flight >= policy["max_in_flight"]:
+            return "reject", max(wait, target)
+        
+        if wait <= target:
+            return "admit", wait
+        
+        if policy["mode"] == "degrade" and wait <= target * ADMISSION_DEGRADE_HARD_FACTOR:
+            return "degrade", wait
+        
+        return "reject", wait
+    
+    def enter(self, path: str, decision: str):
+        """Record an admitted (or degraded) request as in flight"""
+        with self._lock:
+            self._in_flight[path] += 1
+            self._counters[path]["degraded" if decision == "degrade" else "admitted"] += 1
+    
+    def leave(self, path: str):
+        """Record an in-flight request as finished"""
+        with self._lock:
+            self._in_flight[path] -= 1
+    
+    def reject(self, path: str):
+        """Record a shed request"""
+        with self._lock:
+            self._counters[path]["rejected"] += 1
+    
+    def stats(self) -> dict:
+        """Snapshot of per-route admission counters and executor capacity"""
+        with self._lock:
+            routes = {
+                path: {
+                    "mode": self.policies[path]["mode"],
+                    "in_flight": self._in_flight[path],
+                    **self._counters[path],
+                }
+                for path in self.policies
+            }
+        return {
+            "routes": routes,
+            "capacity": self.executor.stats(),
+        }
+
+
+class AdmissionMiddleware(BaseHTTPMiddleware):
+    """
+    Sheds load before a request reaches its route
+    
+    Rejected requests get 429 with a Retry-After hint. Degraded requests
+    continue with request.state.degraded = True so the route can answer
+    with a cheaper, partial result. A request stays in flight until its
+    body has been sent: streamed routes do their work after the headers.
+    """
+    
+    def __init__(self, app, controller: AdmissionController):
+        super().__init__(app)
+        self.controller = controller
+    
+    async def dispatch(self, request: Request, call_next):
+        path = request.url.path
+        if path not in self.controller.policies:
+            return await call_next(request)
+        
+        decision, wait = self.controller.evaluate(path)
+        
+        if decision == "reject":
+            self.controller.reject(path)
+            retry_after = min(max(1, math.ceil(wait)), ADMISSION_RETRY_AFTER_MAX_S)
+            logger.warning(
+                f"Shedding {path}: estimated queue wait {wait:.1f}s, retry after {retry_after}s"
+            )
+            return JSONResponse(
+                status_code=429,
+                headers={"Retry-After": str(retry_after)},
+                content={
+                    "success": False,
+                    "results": [],
+                    "count": 0,
+                    "error": "Server busy, please retry shortly"
+                }
+            )
+        
+        request.state.degraded = decision == "degrade"
+        if request.state.degraded:
+            logger.info(f"Degrading {path}: estimated queue wait {wait:.1f}s")
+        
+        self.controller.enter(path, decision)
+        try:
+            response = await call_next(request)
+        except BaseException:
+            self.controller.leave(path)
+            raise
+        self._leave_after_body(response, path)
+        return response
+    
+    def _leave_after_body(self, response, path: str):
+        """Record the request as finished once its body is sent or dropped"""
+        left = False
+        
+        def leave():
+            nonlocal left
+            if not left:
+                left = True
+                self.controller.leave(path)
+        
+        body = response.body_iterator
+        
+        async def body_then_leave():
+            try:
+                async for chunk in body:
+                    yield chunk
+            finally:
+                leave()
+        
+        response.body_iterator = body_then_leave()
+        # A body never started (client gone first) never reaches its finally
+        weakref.finalize(response.body_iterator, leave)
+
+
+def setup_admission_middleware(app: FastAPI, executor) -> AdmissionController:
+    """
+    Configure admission control for FastAPI app
+    
+    The controller is also stored on app.state.admission for /status.
+    
+    Args:
+        app: FastAPI application instance
+        executor: ScraperExecutor whose capacity backs admission decisions
+    
+    Returns:
+        AdmissionController: The installed controller
+    """
+    logger.info("Setting up admission control middleware...")
+    
+    controller = AdmissionController(executor)
+    app.state.admission = controller
+    app.add_middleware(AdmissionMiddleware, controller=controller)
+    
+    logger.info(f"Admission control configured for {list(controller.policies)}")
+    return controller
+
+
+__all__ = ["AdmissionController", "AdmissionMiddleware", "setup_admission_middleware"]
@@ -7,6 +7,7 @@ Sets up cross-origin resource sharing and request handling
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.config import logger
+from app.middleware.admission import setup_admission_middleware
 
 
 def setup_cors_middleware(app: FastAPI):
@@ -32,7 +33,7 @@ def setup_cors_middleware(app: FastAPI):
     logger.info("CORS middleware configured")
 
 
-def setup_middlewares(app: FastAPI):
+def setup_middlewares(app: FastAPI, executor=None):
     """
     Setup all middlewares for the application
     
@@ -41,9 +42,15 @@ def setup_middlewares(app: FastAPI):
     
     Args:
         app: FastAPI application instance
+        executor: ScraperExecutor backing admission control (optional)
     """
     logger.info("Setting up application middlewares...")
     
+    # Starlette wraps the last-added middleware outermost, so admission is
+    # added before CORS to keep 429 responses readable by the browser
+    if executor is not None:
+        setup_admission_middleware(app, executor)
+    
     # CORS MUST be first
     setup_cors_middleware(app)
     
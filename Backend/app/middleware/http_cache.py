@@ -0,0 +1,140 @@
+# app/middleware/http_cache.py
+"""
+HTTP cache validators for API responses
+ETag / Last-Modified / Cache-Control headers and 304 answers
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from email.utils import formatdate
+from fastapi.responses import Response
+from app.config import (
+    HTTP_CACHE_MAX_AGE_CAP_S,
+    HTTP_CACHE_STALE_WHILE_REVALIDATE_S,
+    HTTP_VALIDATOR_MEMO_SIZE,
+)
+
+
+def content_etag(content) -> str:
+    """
+    Weak ETag over the meaningful part of a response
+    
+    Weak because fields such as per-platform status may differ between
+    two responses that carry the same data.
+    
+    Args:
+        content: JSON-compatible value (e.g. results list plus query)
+    
+    Returns:
+        str: ETag header value, e.g. 'W/"3f2a..."'
+    """
+    raw = json.dumps(content, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return f'W/"{hashlib.blake2b(raw.encode("utf-8"), digest_size=12).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an If-None-Match header matches `etag` (weak comparison)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    wanted = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == wanted
+        for candidate in if_none_match.split(",")
+    )
+
+
+def cache_headers(etag: str, age: float, fresh_for: float) -> dict:
+    """
+    Validator and freshness headers for a response
+    
+    Args:
+        etag: ETag of the response
+        age: Seconds since the newest data in the response was scraped
+        fresh_for: Seconds the data stays fresh (0 for partial/uncached answers)
+    
+    Returns:
+        dict: ETag, Last-Modified and Cache-Control headers
+    """
+    max_age = int(min(max(fresh_for, 0), HTTP_CACHE_MAX_AGE_CAP_S))
+    if max_age:
+        cache_control = (
+            f"public, max-age={max_age}, "
+            f"stale-while-revalidate={HTTP_CACHE_STALE_WHILE_REVALIDATE_S}"
+        )
+    else:
+        cache_control = "no-cache"
+    return {
+        "ETag": etag,
+        "Last-Modified": formatdate(time.time() - age, usegmt=True),
+        "Cache-Control": cache_control,
+    }
+
+
+def not_modified(headers: dict) -> Response:
+    """Empty 304 answer carrying the validators"""
+    return Response(status_code=304, headers=headers)
+
+
+def json_response(payload: dict, headers: dict) -> Response:
+    """Serialize `payload` once into a JSON response with `headers`"""
+    body = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+class ValidatorMemo:
+    """
+    Remembers the ETag served for a request and the data version behind it
+    
+    When a client revalidates and the cached data is still the same
+    version, the route can answer 304 straight away, without scraping,
+    matching or serializing anything.
+    """
+    
+    def __init__(self, max_entries: int = HTTP_VALIDATOR_MEMO_SIZE):
+        """Initialize empty memo holding up to `max_entries` requests"""
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()  # request key -> (stamps, etag)
+        self._counters = {"fast_304": 0, "full_304": 0, "full_200": 0}
+    
+    def get(self, key: tuple, stamps: tuple) -> str | None:
+        """ETag remembered for `key` if it was computed from `stamps`"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != stamps:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+    
+    def put(self, key: tuple, stamps: tuple, etag: str):
+        """Remember the ETag computed for `key` from data version `stamps`"""
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (stamps, etag)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def count(self, outcome: str):
+        """Record how a request was answered (fast_304, full_304 or full_200)"""
+        with self._lock:
+            self._counters[outcome] += 1
+    
+    def stats(self) -> dict:
+        """Answer counters and memo size"""
+        with self._lock:
+            return {**self._counters, "entries": len(self._entries)}
+
+
+__all__ = [
+    "content_etag",
+    "etag_matches",
+    "cache_headers",
+    "not_modified",
+    "json_response",
+    "ValidatorMemo",
+]
@@ -1,6 +1,6 @@
 # app/routes/__init__.py
 """API routes and endpoints"""
 
-from app.routes import comparison, health
+from app.routes import comparison, health, watch, live
 
-__all__ = ["comparison", "health"]
\ No newline at end of file
+__all__ = ["comparison", "health", "watch", "live"]
\ No newline at end of file
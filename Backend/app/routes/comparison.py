@@ -4,9 +4,35 @@ Price comparison routes and logic
 Main endpoint for comparing products across platforms
 """
 
-from fastapi import APIRouter, Query
-from app.config import logger
+import asyncio
+import json
+import time
+from fastapi import APIRouter, Body, Header, Query, Request
+from fastapi.responses import StreamingResponse
+from app.config import (
+    logger,
+    DEGRADED_SCRAPER_TIMEOUT_S,
+    DEADLINE_HEADER,
+    MIN_DEADLINE_MS,
+    MAX_DEADLINE_MS,
+    PLATFORMS,
+    SEARCH_INDEX_FRESH_S,
+    SUGGEST_MAX_RESULTS,
+    PREFETCH_ENABLED,
+    HISTORY_MAX_DAYS,
+    STREAM_HEARTBEAT_S,
+    COMPARE_BATCH_MAX_QUERIES,
+)
 from app.scrapers_bridge.orchestrator import ScrapingOrchestrator
+from app.core.text_utils import canonicalize_query
+from app.middleware.http_cache import (
+    ValidatorMemo,
+    content_etag,
+    etag_matches,
+    cache_headers,
+    not_modified,
+    json_response,
+)
 
 # Create router
 router = APIRouter(prefix="/api", tags=["comparison"])
@@ -14,9 +40,97 @@ router = APIRouter(prefix="/api", tags=["comparison"])
 # Initialize orchestrator (singleton-like, could be moved to app startup)
 orchestrator = ScrapingOrchestrator()
 
+# ETags served per request and the cached data version they were computed from
+validators = ValidatorMemo()
+
+
+def _conditional_response(
+    request: Request,
+    payload: dict,
+    content,
+    version: dict | None,
+    memo_key: tuple,
+    memoize: bool = True
+):
+    """
+    Answer with cache validators: 304 if the client's copy matches, else the JSON body
+    
+    Args:
+        request: Incoming request (for If-None-Match)
+        payload: Full response body
+        content: Part of the body the ETag is computed over
+        version: orchestrator.data_version() of the data behind a complete
+                 answer, or None for partial/uncacheable answers
+        memo_key: Request identity for the validator memo
+        memoize: Remember the ETag for early revalidation; False when the
+                 data may have changed while the body was being built
+    """
+    etag = content_etag(content)
+    if version is not None:
+        if memoize:
+            validators.put(memo_key, version["stamps"], etag)
+        headers = cache_headers(etag, version["age"], version["fresh_for"])
+    else:
+        headers = cache_headers(etag, 0, 0)
+    
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        validators.count("full_304")
+        return not_modified(headers)
+    validators.count("full_200")
+    return json_response(payload, headers)
+
+
+def _revalidate_early(request: Request, memo_key: tuple, version: dict | None):
+    """
+    304 for a client whose copy is still current, decided from cache versions alone
+    
+    Args:
+        request: Incoming request (for If-None-Match)
+        memo_key: Request identity for the validator memo
+        version: orchestrator.data_version() of the data the request would be answered from
+    
+    Returns:
+        Response or None if the request has to be answered in full
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match or version is None:
+        return None
+    etag = validators.get(memo_key, version["stamps"])
+    if etag is None or not etag_matches(if_none_match, etag):
+        return None
+    validators.count("fast_304")
+    return not_modified(cache_headers(etag, version["age"], version["fresh_for"]))
+
+
+def _deadline(
+    request: Request,
+    deadline_ms: int | None,
+    deadline_header: int | None
+) -> tuple[float | None, bool]:
+    """
+    Absolute deadline of a request, and whether admission control degraded it
+    
+    The client's time budget (query parameter wins over header) is clamped
+    to sane bounds. Requests admitted under load are degraded: they get at
+    most DEGRADED_SCRAPER_TIMEOUT_S and answer with whatever platforms
+    finish within it.
+    
+    Returns:
+        tuple: (time.monotonic() deadline or None, degraded)
+    """
+    budget_ms = deadline_ms or deadline_header
+    if budget_ms is not None:
+        budget_ms = min(max(budget_ms, MIN_DEADLINE_MS), MAX_DEADLINE_MS)
+    degraded = getattr(request.state, "degraded", False)
+    if degraded:
+        budget_ms = min(budget_ms or MAX_DEADLINE_MS, int(DEGRADED_SCRAPER_TIMEOUT_S * 1000))
+    deadline = time.monotonic() + budget_ms / 1000 if budget_ms else None
+    return deadline, degraded
+
 
 @router.get("/compare")
 async def compare_products(
+    request: Request,
     query: str = Query(
         ...,
         min_length=2,
@@ -32,6 +146,32 @@ async def compare_products(
         ge=1,
         le=50,
         description="Maximum results to return"
+    ),
+    deadline_ms: int | None = Query(
+        None,
+        ge=MIN_DEADLINE_MS,
+        le=MAX_DEADLINE_MS,
+        description="Answer within this many milliseconds with whatever platforms finished"
+    ),
+    quorum: int | None = Query(
+        None,
+        ge=1,
+        le=len(PLATFORMS),
+        description="Return once this many platforms (incl. Flipkart) answered, e.g. 3"
+    ),
+    max_age: int | None = Query(
+        None,
+        ge=0,
+        description="Only reuse cached platform results younger than this many seconds"
+    ),
+    fresh: bool = Query(
+        False,
+        description="Bypass cached platform results and scrape every platform"
+    ),
+    deadline_header: int | None = Header(
+        None,
+        alias=DEADLINE_HEADER,
+        description="Same as deadline_ms, for clients that prefer a header"
     )
 ) -> dict:
     """
@@ -44,6 +184,14 @@ async def compare_products(
     - query: Product search term (required)
     - validate_prices: Check price variance (default: true)
     - limit: Max results to return (default: 10, max: 50)
+    - deadline_ms: Time budget in ms (or X-Deadline-Ms header); platforms
+      still scraping when it expires are cut off
+    - quorum: Return as soon as this many platforms (the anchor platform
+      included) have answered or a soft deadline passes; the rest finish
+      in the background so the next identical request is complete
+    - max_age: Max acceptable age in seconds of cached platform results
+      (without it, stale results may be served while refreshing)
+    - fresh: Force a live scrape of every platform (default: false)
     
     Returns:
     - success: Whether comparison succeeded
@@ -51,6 +199,16 @@ async def compare_products(
     - results: List of price comparisons
     - count: Number of results
     - error: Error message if failed
+    - degraded: True if admission control shortened scraper timeouts under load
+    - platform_status: Per-platform outcome (ok, empty, cached, stale,
+      cached_empty, cached_failed, failed, cut_off, catalog)
+    - cut_off: Platforms that did not finish before the deadline or quorum
+    - complete: True if every platform contributed to this answer
+    
+    Responses carry ETag, Last-Modified and Cache-Control (max-age = how long
+    the underlying platform data stays fresh; no-cache for partial answers).
+    A matching If-None-Match gets 304; when all platforms are cached and
+    unchanged this is decided before any scraping or matching.
     
     Example:
     ```
@@ -78,22 +236,300 @@ async def compare_products(
     """
     logger.info(f"Compare endpoint called: query='{query}', limit={limit}")
     
+    deadline, degraded = _deadline(request, deadline_ms, deadline_header)
+    
+    memo_key = ("compare", canonicalize_query(query)[0], validate_prices, limit)
+    # Version of the data before the comparison runs: if a refresh lands
+    # while it runs, the body no longer matches the newest stamps
+    version_before = await orchestrator.data_version(query, validate_prices=validate_prices)
+    if not fresh and max_age is None:
+        early = _revalidate_early(request, memo_key, version_before)
+        if early is not None:
+            # Still demand: trending, suggestions and prefetch count it
+            orchestrator.record_served(query)
+            return early
+    
     # Get comparison results from orchestrator
     result = await orchestrator.compare_prices(
         query=query,
-        validate_prices=validate_prices
+        validate_prices=validate_prices,
+        deadline=deadline,
+        quorum=quorum,
+        max_age=max_age,
+        fresh=fresh
     )
+    result["degraded"] = degraded
     
     # Apply limit
     if result["results"]:
         result["results"] = result["results"][:limit]
         result["count"] = len(result["results"])
     
-    return result
+    cacheable = result["complete"] and not degraded
+    version = await orchestrator.data_version(query, validate_prices=validate_prices) if cacheable else None
+    unchanged = version is not None and version_before is not None and version["stamps"] == version_before["stamps"]
+    return _conditional_response(
+        request,
+        result,
+        content=[result["canonical_query"], result["success"], result["results"], result["error"]],
+        version=version,
+        memo_key=memo_key,
+        memoize=unchanged
+    )
+
+
+def _sse(event: str, data: dict) -> str:
+    """One Server-Sent Events message"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, separators=(',', ':'))}\n\n"
+
+
+@router.get("/compare/stream")
+async def compare_products_stream(
+    request: Request,
+    query: str = Query(
+        ...,
+        min_length=2,
+        max_length=100,
+        description="Product search query"
+    ),
+    validate_prices: bool = Query(
+        True,
+        description="Whether to validate price variance"
+    ),
+    limit: int = Query(
+        10,
+        ge=1,
+        le=50,
+        description="Maximum comparisons per matches event"
+    ),
+    deadline_ms: int | None = Query(
+        None,
+        ge=MIN_DEADLINE_MS,
+        le=MAX_DEADLINE_MS,
+        description="End the stream after this many milliseconds"
+    ),
+    max_age: int | None = Query(
+        None,
+        ge=0,
+        description="Only reuse cached platform results younger than this many seconds"
+    ),
+    fresh: bool = Query(
+        False,
+        description="Bypass cached platform results and scrape every platform"
+    ),
+    deadline_header: int | None = Header(
+        None,
+        alias=DEADLINE_HEADER,
+        description="Same as deadline_ms, for clients that prefer a header"
+    )
+):
+    """
+    Compare product prices across all platforms, streamed as they finish
+    
+    Same comparison as /api/compare, sent as Server-Sent Events
+    (text/event-stream) so the first results show up as soon as the
+    fastest platforms are in instead of after the slowest one.
+    
+    Query Parameters:
+    - query: Product search term (required)
+    - validate_prices: Check price variance (default: true)
+    - limit: Max comparisons per matches event (default: 10, max: 50)
+    - deadline_ms: Time budget in ms (or X-Deadline-Ms header); platforms
+      still scraping then are reported cut off and the stream ends
+    - max_age: Max acceptable age in seconds of cached platform results
+    - fresh: Force a live scrape of every platform (default: false)
+    
+    Events:
+    - platform: {platform, status, count, products}, once per platform as
+      it finishes (cached platforms first)
+    - matches: {results, count, platforms}, the comparisons so far; sent
+      again with every platform that adds products once Flipkart (the
+      matching reference) is in - each replaces the previous one
+    - done: {success, query, canonical_query, count, error, degraded,
+      platform_status, cut_off, complete}, then the stream closes
+    
+    A comment line is sent every 10 s while nothing else is, so proxies
+    keep the connection open. Clients should close their EventSource on
+    "done" (it would reconnect otherwise).
+    
+    Example:
+    ```
+    GET /api/compare/stream?query=MacBook+Pro+M2&limit=5
+    
+    event: platform
+    data: {"platform":"croma","status":"ok","count":12,"products":[...]}
+    
+    event: platform
+    data: {"platform":"flipkart","status":"cached","count":20,"products":[...]}
+    
+    event: matches
+    data: {"results":[...],"count":5,"platforms":["flipkart","croma"]}
+    
+    ...
+    
+    event: done
+    data: {"success":true,"count":9,"complete":true,...}
+    ```
+    """
+    logger.info(f"Compare stream called: query='{query}', limit={limit}")
+    
+    deadline, degraded = _deadline(request, deadline_ms, deadline_header)
+    
+    stream = orchestrator.compare_stream(
+        query=query,
+        validate_prices=validate_prices,
+        deadline=deadline,
+        max_age=max_age,
+        fresh=fresh
+    )
+    
+    async def events():
+        next_event = None
+        try:
+            while True:
+                if next_event is None:
+                    next_event = asyncio.ensure_future(anext(stream))
+                done, _ = await asyncio.wait({next_event}, timeout=STREAM_HEARTBEAT_S)
+                if not done:
+                    yield ": keep-alive\n\n"
+                    continue
+                try:
+                    event, data = next_event.result()
+                except StopAsyncIteration:
+                    break
+                next_event = None
+                
+                if event == "matches":
+                    data = {**data, "results": data["results"][:limit], "count": min(data["count"], limit)}
+                elif event == "done":
+                    data = {**data, "count": min(data["count"], limit), "degraded": degraded}
+                yield _sse(event, data)
+        finally:
+            # Client gone or stream over: stop the generator (its scrapes carry on into the cache)
+            if next_event is not None and not next_event.done():
+                next_event.cancel()
+                await asyncio.gather(next_event, return_exceptions=True)
+            await stream.aclose()
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.post("/compare/batch")
+async def compare_products_batch(
+    queries: list[str] = Body(
+        ...,
+        embed=True,
+        min_length=1,
+        max_length=COMPARE_BATCH_MAX_QUERIES,
+        description="Product search queries (2-100 characters each; duplicates allowed)"
+    ),
+    validate_prices: bool = Query(
+        True,
+        description="Whether to validate price variance"
+    ),
+    limit: int = Query(
+        10,
+        ge=1,
+        le=50,
+        description="Maximum results per query"
+    ),
+    max_age: int | None = Query(
+        None,
+        ge=0,
+        description="Only reuse cached platform results younger than this many seconds"
+    ),
+    fresh: bool = Query(
+        False,
+        description="Bypass cached platform results and scrape every platform"
+    )
+):
+    """
+    Compare many queries in one request, streamed back as NDJSON
+    
+    For bulk jobs (hundreds of SKUs) instead of looping over /api/compare.
+    Spellings of the same query (case, spacing, units) are compared once.
+    Queries run at batch priority with bounded concurrency, so interactive
+    users keep their share of the scrapers; cached and catalog answers
+    come back immediately, the rest as their scrapes finish.
+    
+    Body:
+    - queries: List of search terms (required, max 500)
+    
+    Query Parameters:
+    - validate_prices: Check price variance (default: true)
+    - limit: Max results per query (default: 10, max: 50)
+    - max_age: Max acceptable age in seconds of cached platform results
+    - fresh: Force a live scrape of every platform (default: false)
+    
+    Returns (application/x-ndjson, one JSON object per line):
+    - One "item" line per distinct query, in completion order:
+      {type, inputs (positions in `queries`), queries (as sent), status,
+      plus the /api/compare fields: success, query, canonical_query,
+      results, count, error, platform_status, cut_off, complete}
+    - status: "ok" (products matched), "no_results" (every platform
+      answered, nothing matched), "failed" (nothing matched and some
+      platform failed or was cut off) or "invalid" (not 2-100
+      characters, or empty once normalized)
+    
+    At most 4 batch requests run at once (429 beyond that, for the whole
+    time their lines are streaming); their distinct queries share 4
+    comparison slots.
+    - A final "summary" line: {type, queries, distinct, ok, no_results,
+      failed, invalid, elapsed_ms}
+    
+    Example:
+    ```
+    POST /api/compare/batch?limit=3
+    {"queries": ["iPhone 15 128GB", "iphone 15 128 gb", "Pixel 8"]}
+    
+    {"type":"item","inputs":[2],"queries":["Pixel 8"],"status":"ok","count":3,...}
+    {"type":"item","inputs":[0,1],"queries":["iPhone 15 128GB","iphone 15 128 gb"],"status":"ok",...}
+    {"type":"summary","queries":3,"distinct":2,"ok":2,"no_results":0,"failed":0,"invalid":0,"elapsed_ms":8410}
+    ```
+    """
+    logger.info(f"Batch compare endpoint called: {len(queries)} queries")
+    started = time.monotonic()
+    
+    def line(payload: dict) -> str:
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":")) + "\n"
+    
+    async def lines():
+        counts = {"ok": 0, "no_results": 0, "failed": 0, "invalid": 0}
+        distinct = 0
+        async for item in orchestrator.compare_batch(
+            queries,
+            validate_prices=validate_prices,
+            max_age=max_age,
+            fresh=fresh
+        ):
+            counts[item["status"]] += 1
+            distinct += item["status"] != "invalid"
+            yield line({
+                **item,
+                "type": "item",
+                "queries": [queries[position] for position in item["inputs"]],
+                "results": item["results"][:limit],
+                "count": min(item["count"], limit),
+            })
+        
+        yield line({
+            "type": "summary",
+            "queries": len(queries),
+            "distinct": distinct,
+            **counts,
+            "elapsed_ms": int((time.monotonic() - started) * 1000),
+        })
+    
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
 
 
 @router.get("/search")
 async def search_products(
+    request: Request,
     query: str = Query(
         ...,
         min_length=2,
@@ -109,43 +545,56 @@ async def search_products(
         ge=1,
         le=100,
         description="Maximum results to return"
+    ),
+    page: int = Query(
+        1,
+        ge=1,
+        le=50,
+        description="Page of results (1-based, `limit` results per page)"
+    ),
+    max_age: int | None = Query(
+        None,
+        ge=0,
+        description="Only serve indexed products seen within this many seconds"
     )
 ) -> dict:
     """
     Search for products on a specific platform
     
     Returns products from a single platform without comparison.
-    Useful for browsing or detailed product searches.
+    Useful for browsing or detailed product searches. Answered from the
+    full-text index of every product the scrapers have returned, when it
+    has fresh matches (ranked, every word matched by prefix, paged);
+    otherwise the platform is searched live (cache first) and the scraped
+    products join the index. Same ETag / 304 handling as /api/compare.
     
     Query Parameters:
     - query: Product search term (required)
     - platform: Which platform to search (default: flipkart)
     - limit: Max results to return (default: 20, max: 100)
+    - page: Results page (default: 1)
+    - max_age: Max age in seconds of indexed products (default: 900)
     
     Returns:
     - success: Whether search succeeded
     - query: Original search query
     - platform: Platform searched
-    - results: List of products
-    - count: Number of results
+    - results: List of products, each with lastSeen (when it was scraped,
+      unix time)
+    - count: Number of results on this page
+    - total: Number of matching products
+    - page: Page returned
+    - source: "index" or "live"
     - error: Error message if failed
     
     Example:
     ```
-    GET /api/search?query=iPhone&platform=amazon&limit=10
+    GET /api/search?query=iPhone&platform=amazon&limit=10&page=2
     ```
     """
-    logger.info(f"Search endpoint called: query='{query}', platform='{platform}'")
+    logger.info(f"Search endpoint called: query='{query}', platform='{platform}', page={page}")
     
-    # Map platform name to scraper
-    scrapers = {
-        "flipkart": orchestrator.scrapers.get("flipkart"),
-        "amazon": orchestrator.scrapers.get("amazon"),
-        "croma": orchestrator.scrapers.get("croma"),
-        "reliancedigital": orchestrator.scrapers.get("reliancedigital"),
-    }
-    
-    if platform not in scrapers or not scrapers[platform]:
+    if platform not in orchestrator.scrapers:
         return {
             "success": False,
             "query": query,
@@ -155,25 +604,84 @@ async def search_products(
             "error": f"Platform '{platform}' not supported"
         }
     
+    offset = (page - 1) * limit
+    display = canonicalize_query(query)[1]
+    
     try:
-        # Get products from selected platform
-        scraper_func = scrapers[platform]
-        products = scraper_func(query)
+        # Full-text index first: no browser at all for products seen recently
+        hits, total = await orchestrator.search_catalog(query, platform, limit, offset, max_age)
+        if total:
+            oldest = min((hit["lastSeen"] for hit in hits), default=time.time())
+            age = max(time.time() - oldest, 0)
+            result = {
+                "success": True,
+                "query": query,
+                "platform": platform,
+                "results": hits,
+                "count": len(hits),
+                "total": total,
+                "page": page,
+                "source": "index",
+                "error": None
+            }
+            return _conditional_response(
+                request,
+                result,
+                content=[display, platform, page, total, hits],
+                version={
+                    "stamps": tuple(hit["lastSeen"] for hit in hits),
+                    "age": age,
+                    "fresh_for": SEARCH_INDEX_FRESH_S - age,
+                },
+                memo_key=("search-index", canonicalize_query(query)[0], platform, limit, page)
+            )
         
-        if products:
-            products = products[:limit]
-        else:
-            products = []
+        # Index miss: live search (cache first), revalidated against the cache version
+        memo_key = ("search", canonicalize_query(query)[0], platform, limit, page)
+        early = _revalidate_early(request, memo_key, await orchestrator.data_version(query, [platform]))
+        if early is not None:
+            return early
         
-        return {
+        # Scrapes via the shared thread pool so admission control sees this
+        # work as executor load
+        products = await orchestrator.search_platform(platform, query)
+        
+        if products is None:
+            return {
+                "success": False,
+                "query": query,
+                "platform": platform,
+                "results": [],
+                "count": 0,
+                "error": f"Scraping {platform} failed or timed out"
+            }
+        
+        version = await orchestrator.data_version(query, [platform])
+        last_seen = time.time() - (version["age"] if version else 0)
+        page_products = [
+            {**product, "platform": platform, "lastSeen": last_seen}
+            for product in products[offset:offset + limit]
+        ]
+        
+        result = {
             "success": True,
             "query": query,
             "platform": platform,
-            "results": products,
-            "count": len(products),
+            "results": page_products,
+            "count": len(page_products),
+            "total": len(products),
+            "page": page,
+            "source": "live",
             "error": None
         }
-        
+        return _conditional_response(
+            request,
+            result,
+            content=[display, platform, page, products[offset:offset + limit]],
+            version=version,
+            memo_key=memo_key
+        )
+    
     except Exception as e:
         logger.error(f"Search failed: {e}")
         return {
@@ -186,4 +694,277 @@ async def search_products(
         }
 
 
+@router.get("/suggest")
+async def suggest(
+    request: Request,
+    q: str = Query(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="What the user has typed so far"
+    ),
+    limit: int = Query(
+        SUGGEST_MAX_RESULTS,
+        ge=1,
+        le=20,
+        description="Maximum suggestions to return"
+    ),
+    prefetch: bool = Query(
+        True,
+        description="Allow a speculative cache warm-up of the top suggestion"
+    )
+) -> dict:
+    """
+    Search-as-you-type suggestions
+    
+    Served from an in-memory prefix index of served queries and the
+    titles of scraped products, ranked by popularity; no scraping or
+    database access on this path.
+    
+    When the top suggestion is a popular query that clearly dominates,
+    its platform results may be scraped into the cache in the background
+    (low priority, rate-limited per client) so the /api/compare that
+    usually follows is answered from warm data.
+    
+    Query Parameters:
+    - q: Text typed so far (required); matches the start of a
+      suggestion or of one of its first few words
+    - limit: Max suggestions (default: 8, max: 20)
+    - prefetch: Allow the speculative warm-up (default: true)
+    
+    Returns:
+    - success: Always true
+    - query: Text the suggestions are for
+    - suggestions: [{text, kind ("query" or "product"), weight}]
+    - count: Number of suggestions
+    - prefetching: Suggestion being warmed up, or null
+    
+    Example:
+    ```
+    GET /api/suggest?q=iphone+15+p
+    ```
+    """
+    logger.debug(f"Suggest endpoint called: q='{q}'")
+    # Confidence is judged against the default-size list, whatever the client shows
+    suggestions = orchestrator.suggestions.suggest(q, max(limit, SUGGEST_MAX_RESULTS))
+    prefetching = None
+    if PREFETCH_ENABLED and prefetch:
+        client = request.client.host if request.client else "unknown"
+        prefetching = orchestrator.prefetcher.consider(client, q, suggestions)
+    
+    suggestions = suggestions[:limit]
+    return {
+        "success": True,
+        "query": q,
+        "suggestions": suggestions,
+        "count": len(suggestions),
+        "prefetching": prefetching
+    }
+
+
+@router.get("/product")
+async def product_details(
+    request: Request,
+    query: str = Query(
+        ...,
+        min_length=2,
+        max_length=100,
+        description="Search query the comparison was returned for"
+    ),
+    index: int = Query(
+        0,
+        ge=0,
+        le=49,
+        description="Position of the comparison in the /api/compare results"
+    ),
+    validate_prices: bool = Query(
+        True,
+        description="Same value the comparison was requested with"
+    ),
+    deadline_ms: int | None = Query(
+        None,
+        ge=MIN_DEADLINE_MS,
+        le=MAX_DEADLINE_MS,
+        description="Answer within this many milliseconds"
+    ),
+    deadline_header: int | None = Header(
+        None,
+        alias=DEADLINE_HEADER,
+        description="Same as deadline_ms, for clients that prefer a header"
+    )
+) -> dict:
+    """
+    Refresh one known comparison from the products' detail pages
+    
+    Looks the comparison up like /api/compare (cached when warm), then
+    re-reads price, MRP, availability and rating of each of its products
+    from the product page alone - one page load per platform instead of
+    four full searches.
+    
+    Query Parameters:
+    - query: Search term the comparison came from (required)
+    - index: Which comparison of that search (default: 0)
+    - validate_prices: As passed to /api/compare (default: true)
+    - deadline_ms: Time budget in ms (or X-Deadline-Ms header)
+    
+    Returns:
+    - success: Whether the comparison was found
+    - query: Original search query
+    - product: The comparison, each product carrying refreshed
+      currentPrice, maxRetailPrice, rating, inStock and refreshedAt
+    - refresh_status: Per-platform outcome (ok, failed, no_link)
+    - error: Error message if failed
+    
+    Example:
+    ```
+    GET /api/product?query=MacBook+Pro+M2&index=0
+    ```
+    """
+    logger.info(f"Product endpoint called: query='{query}', index={index}")
+    return await orchestrator.get_product_details(
+        query,
+        index=index,
+        validate_prices=validate_prices,
+        deadline=_deadline(request, deadline_ms, deadline_header)[0]
+    )
+
+
+@router.get("/product/refresh")
+async def refresh_product(
+    request: Request,
+    url: str = Query(
+        ...,
+        min_length=10,
+        max_length=2000,
+        description="Product link as returned by /api/compare or /api/search"
+    ),
+    platform: str = Query(
+        ...,
+        description="Platform of the product (flipkart, amazon, croma, reliancedigital)"
+    ),
+    deadline_ms: int | None = Query(
+        None,
+        ge=MIN_DEADLINE_MS,
+        le=MAX_DEADLINE_MS,
+        description="Answer within this many milliseconds"
+    ),
+    deadline_header: int | None = Header(
+        None,
+        alias=DEADLINE_HEADER,
+        description="Same as deadline_ms, for clients that prefer a header"
+    )
+) -> dict:
+    """
+    Current price data of a single product, read from its detail page
+    
+    Only links on the platform's own site are followed.
+    
+    Query Parameters:
+    - url: Product link (required)
+    - platform: Platform the link belongs to (required)
+    - deadline_ms: Time budget in ms (or X-Deadline-Ms header)
+    
+    Returns:
+    - success: Whether the page was read
+    - platform: Platform of the product
+    - product: {link, title, currentPrice, maxRetailPrice, inStock, rating}
+    - error: Error message if failed
+    
+    Example:
+    ```
+    GET /api/product/refresh?platform=amazon&url=https://www.amazon.in/dp/B0CHX1W1XY
+    ```
+    """
+    logger.info(f"Product refresh called: platform='{platform}', url='{url}'")
+    try:
+        details = await orchestrator.refresh_product(
+            platform, url, deadline=_deadline(request, deadline_ms, deadline_header)[0]
+        )
+    except ValueError as e:
+        return {"success": False, "platform": platform, "product": None, "error": str(e)}
+    
+    if details is None:
+        return {
+            "success": False,
+            "platform": platform,
+            "product": None,
+            "error": f"Refreshing the {platform} product page failed or timed out"
+        }
+    return {"success": True, "platform": platform, "product": details, "error": None}
+
+
+@router.get("/history")
+async def price_history(
+    platform: str = Query(
+        ...,
+        description="Platform of the product (flipkart, amazon, croma, reliancedigital)"
+    ),
+    product: str = Query(
+        ...,
+        min_length=2,
+        max_length=2000,
+        description="Platform product ID (ASIN, Flipkart pid, ...) or product link"
+    ),
+    days: int = Query(
+        30,
+        ge=1,
+        le=HISTORY_MAX_DAYS,
+        description="How many days back to return"
+    ),
+    resolution: str | None = Query(
+        None,
+        pattern="^(raw|hourly|daily)$",
+        description="raw, hourly or daily (default: finest kept for the range)"
+    )
+) -> dict:
+    """
+    Price history of one product on one platform
+    
+    Read from the product's own columnar series files only; no scraping.
+    Older ranges come at coarser resolution: raw points are kept for a
+    week, hourly close/low/high for 90 days, daily for two years.
+    
+    Query Parameters:
+    - platform: Platform of the product (required)
+    - product: Product ID or link (required)
+    - days: Range to return, ending now (default: 30, max: 730)
+    - resolution: Force a tier (default: finest retained for the range)
+    
+    Returns:
+    - success: Whether history could be read
+    - platform: Platform of the product
+    - product_id: Platform product ID
+    - resolution: Tier the points come from
+    - series: {t: [epoch s], price: [...], low: [...], high: [...]}, aligned by index
+    - count: Number of points
+    - summary: {current, lowest, lowest_at, highest, is_lowest, window_days}
+      over the last 30 days, or null without history
+    - error: Error message if failed
+    
+    Example:
+    ```
+    GET /api/history?platform=amazon&product=B0CHX1W1XY&days=90
+    ```
+    """
+    logger.info(f"History endpoint called: platform='{platform}', product='{product}', days={days}")
+    if platform not in orchestrator.scrapers:
+        return {"success": False, "platform": platform, "series": None, "error": f"Platform '{platform}' not supported"}
+    
+    found = await orchestrator.price_history(platform, product, time.time() - days * 86400, resolution)
+    if found is None:
+        return {
+            "success": False,
+            "platform": platform,
+            "series": None,
+            "error": "Price history is disabled or the product is not recognized"
+        }
+    return {
+        "success": True,
+        "platform": platform,
+        **found,
+        "count": len(found["series"]["t"]),
+        "error": None
+    }
+
+
 __all__ = ["router"]
\ No newline at end of file
@@ -4,7 +4,8 @@ Health check and status routes
 Monitor API health and readiness
 """
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
 from datetime import datetime
 from app.config import logger
 
@@ -45,7 +46,7 @@ async def health_check() -> dict:
 
 
 @router.get("/status")
-async def get_status() -> dict:
+async def get_status(request: Request) -> dict:
     """
     Detailed API status endpoint
     
@@ -56,6 +57,22 @@ async def get_status() -> dict:
     - online: Whether API is online
     - platforms: List of supported platforms
     - features: Available features
+    - admission: Per-route admission counters and scraper capacity
+    - autoscaler: Capacity bounds, last load sample and recent scaling events
+    - cache: Result cache hit/miss/stale counters and memory usage
+    - comparison_memo: Comparisons reused because platform results were unchanged
+    - catalog: Product catalog answers and sizes (products, match links, comparisons)
+    - suggest: Suggestion index size and lookup latency
+    - matcher: Hit rates of the memoized title features and pair scores
+    - prewarm: Pre-warm cycles, refresh counters and the hot query list
+    - prefetch: Speculative prefetch counters, hit rate and wasted rate
+    - price_history: Price history writes, roll-ups and open segments
+    - watch: Price-watch cycles, page loads spent, notifications and watch list size
+    - live: Live update subscribers, topics, price changes pushed and refresh cycles
+    - warmup: Startup warm-up readiness and progress
+    - query_log: Served-query log counters and size
+    - product_refresh: Product detail page refreshes (done, failed, shared)
+    - http_cache: ETag revalidation counters (304s decided early / after work, 200s)
     - timestamp: Current server time
     
     Example:
@@ -71,12 +88,56 @@ async def get_status() -> dict:
     }
     ```
     """
+    admission = getattr(request.app.state, "admission", None)
+    orchestrator = getattr(request.app.state, "orchestrator", None)
+    validators = getattr(request.app.state, "http_validators", None)
+    
     return {
         "online": True,
         "platforms": ["flipkart", "amazon", "croma", "reliancedigital"],
         "features": ["compare", "search"],
+        "admission": admission.stats() if admission else None,
+        **(await orchestrator.stats() if orchestrator else {}),
+        "http_cache": validators.stats() if validators else None,
         "timestamp": datetime.now().isoformat()
     }
 
 
+@router.get("/ready")
+async def readiness(request: Request):
+    """
+    Readiness probe for load balancers
+    
+    Reports startup warm-up progress. Answers 503 while the recently
+    served queries are still being replayed into the cache, 200 once
+    enough of them are warm (or warm-up has run long enough).
+    
+    Returns:
+    - ready: Whether the server should take its full share of traffic
+    - progress: Share of warm-up work done (0.0 - 1.0)
+    - warmup: Detailed warm-up counters
+    
+    Example:
+    ```
+    GET /ready
+    
+    Response (503 while warming):
+    {
+        "ready": false,
+        "progress": 0.35,
+        "warmup": {...}
+    }
+    ```
+    """
+    orchestrator = getattr(request.app.state, "orchestrator", None)
+    if orchestrator is None:
+        return {"ready": True, "progress": 1.0, "warmup": None}
+    
+    warmup = orchestrator.warmup.stats()
+    return JSONResponse(
+        status_code=200 if warmup["ready"] else 503,
+        content={"ready": warmup["ready"], "progress": warmup["progress"], "warmup": warmup}
+    )
+
+
 __all__ = ["router"]
\ No newline at end of file
@@ -0,0 +1,134 @@
+# app/routes/live.py
+"""
+Live price update routes
+WebSocket subscriptions to comparisons and products
+"""
+
+import asyncio
+import json
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from app.config import logger
+
+# Create router
+router = APIRouter(prefix="/api", tags=["live"])
+
+
+async def _handle(hub, subscriber, message: dict) -> dict:
+    """Apply one client message to the hub and build the reply"""
+    action = message.get("action")
+    if action not in ("subscribe", "unsubscribe"):
+        return {"type": "error", "error": f"Unknown action '{action}'"}
+    try:
+        if message.get("query"):
+            if action == "subscribe":
+                return {"type": "subscribed", **await hub.subscribe_query(subscriber, message["query"])}
+            topic = ("query", hub.query_key(message["query"]))
+        elif message.get("platform") and message.get("product"):
+            if action == "subscribe":
+                return {
+                    "type": "subscribed",
+                    **await hub.subscribe_product(subscriber, message["platform"], message["product"])
+                }
+            topic = ("product", message["platform"], hub.product_key(message["platform"], message["product"]))
+        else:
+            return {"type": "error", "error": "Give a query, or a platform and a product"}
+    except ValueError as e:
+        return {"type": "error", "error": str(e)}
+    
+    hub.unsubscribe(subscriber, topic)
+    return {"type": "unsubscribed", "topic": topic[0]}
+
+
+async def _send_updates(websocket: WebSocket, hub, subscriber):
+    """Single writer: replies and price updates in the order they were queued"""
+    try:
+        while True:
+            message = await subscriber.queue.get()
+            await websocket.send_text(json.dumps(message, ensure_ascii=False, separators=(",", ":")))
+    except (WebSocketDisconnect, RuntimeError):
+        pass  # client gone; the receive loop cleans up
+    except Exception as e:
+        # Nothing would drain the queue any more: stop publishing to this client
+        logger.error(f"Live update send failed: {e}", exc_info=True)
+        hub.disconnect(subscriber)
+        try:
+            await websocket.close(code=1011)
+        except (WebSocketDisconnect, RuntimeError):
+            pass
+
+
+@router.websocket("/live")
+async def live_updates(websocket: WebSocket, query: str | None = None):
+    """
+    Live price updates for comparisons and products
+    
+    Subscribe to a comparison (its canonical query) or to single products
+    and receive only the prices that change. Background refreshes keep
+    subscribed topics fresh at low priority; one scrape serves every
+    client subscribed to the same topic.
+    
+    Query Parameters:
+    - query: Subscribe to this comparison right away (optional)
+    
+    Client messages (JSON):
+    - {"action": "subscribe", "query": "iphone 15"}
+    - {"action": "subscribe", "platform": "amazon", "product": "B0CHX1W1XY"}
+      (product ID or product link)
+    - {"action": "unsubscribe", ...same fields...}
+    
+    Server messages (JSON):
+    - {"type": "subscribed", "topic": "query", "query", "tracked"} or
+      {"type": "subscribed", "topic": "product", "platform", "product_id", "price"}
+    - {"type": "unsubscribed", "topic"}
+    - {"type": "prices", "query", "at", "changes": [{platform, product_id,
+      title, link, old_price, new_price, in_stock}]}
+    - {"type": "error", "error"}
+    
+    At most 20 subscriptions per connection. A client that stops reading
+    loses its oldest queued messages. Connections beyond the server's
+    limit are closed with code 1013 (try again later).
+    
+    Example:
+    ```
+    ws://localhost:8000/api/live?query=iphone+15
+    
+    <- {"type":"subscribed","topic":"query","query":"iphone 15","tracked":62}
+    <- {"type":"prices","query":"iphone 15","changes":[{"platform":"amazon",
+        "product_id":"B0CHX1W1XY","old_price":69900,"new_price":65999,...}],...}
+    ```
+    """
+    hub = websocket.app.state.orchestrator.live
+    await websocket.accept()
+    if hub is None:
+        await websocket.close(code=1008, reason="Live updates are disabled")
+        return
+    subscriber = hub.connect()
+    if subscriber is None:
+        await websocket.close(code=1013, reason="Too many live subscribers")
+        return
+    
+    logger.info(f"Live subscriber connected (query='{query}')")
+    sender = asyncio.create_task(_send_updates(websocket, hub, subscriber))
+    try:
+        if query:
+            subscriber.push(await _handle(hub, subscriber, {"action": "subscribe", "query": query}))
+        while True:
+            text = await websocket.receive_text()
+            try:
+                message = json.loads(text)
+            except ValueError:
+                subscriber.push({"type": "error", "error": "Messages must be JSON"})
+                continue
+            if not isinstance(message, dict):
+                subscriber.push({"type": "error", "error": "Messages must be JSON objects"})
+                continue
+            subscriber.push(await _handle(hub, subscriber, message))
+    except WebSocketDisconnect:
+        pass
+    finally:
+        sender.cancel()
+        hub.disconnect(subscriber)
+        logger.info("Live subscriber disconnected")
+
+
+__all__ = ["router"]
@@ -0,0 +1,141 @@
+# app/routes/watch.py
+"""
+Price-watch routes
+Register products to re-check and read what the scheduler last saw
+"""
+
+import asyncio
+from fastapi import APIRouter, Query, Request
+from app.config import (
+    logger,
+    WATCH_DEFAULT_INTERVAL_S,
+    WATCH_MIN_INTERVAL_S,
+)
+
+# Create router
+router = APIRouter(prefix="/api", tags=["watch"])
+
+WATCHES_DISABLED = "Price watches are disabled"
+
+
+@router.post("/watch")
+async def add_watch(
+    request: Request,
+    platform: str = Query(
+        ...,
+        description="Platform of the product (flipkart, amazon, croma, reliancedigital)"
+    ),
+    url: str = Query(
+        ...,
+        min_length=10,
+        max_length=2000,
+        description="Product link as returned by /api/compare or /api/search"
+    ),
+    target_price: int | None = Query(
+        None,
+        ge=1,
+        description="Also notify once the price reaches this (rupees)"
+    ),
+    interval_hours: float = Query(
+        WATCH_DEFAULT_INTERVAL_S / 3600,
+        ge=WATCH_MIN_INTERVAL_S / 3600,
+        le=7 * 24,
+        description="Re-check cadence in hours"
+    )
+) -> dict:
+    """
+    Watch a product for price drops
+    
+    Registering the same product with the same target again returns the
+    existing watch, re-checked on the new cadence.
+    
+    The product is re-checked in the background on the given cadence
+    (jittered) and every price drop, target reached or return to stock
+    is written to the notification sink (local file or webhook).
+    
+    Query Parameters:
+    - platform: Platform the link belongs to (required)
+    - url: Product link (required)
+    - target_price: Price to be notified at (optional)
+    - interval_hours: Re-check cadence (default: 6, min: 1, max: 168)
+    
+    Returns:
+    - success: Whether the watch was registered
+    - watch: {id, platform, url, product_id, target_price, interval_s,
+      last_price, in_stock, title, last_checked, next_check, failures, created_at}
+    - error: Error message if failed
+    
+    Example:
+    ```
+    POST /api/watch?platform=amazon&url=https://www.amazon.in/dp/B0CHX1W1XY&target_price=60000
+    ```
+    """
+    logger.info(f"Watch requested: platform='{platform}', url='{url}', target={target_price}")
+    orchestrator = request.app.state.orchestrator
+    try:
+        watch = await orchestrator.add_watch(platform, url, target_price, interval_hours * 3600)
+    except ValueError as e:
+        return {"success": False, "watch": None, "error": str(e)}
+    if watch is None:
+        return {"success": False, "watch": None, "error": WATCHES_DISABLED}
+    return {"success": True, "watch": watch, "error": None}
+
+
+@router.get("/watch")
+async def list_watches(
+    request: Request,
+    limit: int = Query(50, ge=1, le=200, description="Watches per page"),
+    page: int = Query(1, ge=1, le=1000, description="Page number")
+) -> dict:
+    """
+    Registered watches, newest first
+    
+    Returns:
+    - success: Whether the list could be read
+    - watches: Page of watches
+    - count: Watches on this page
+    - total: Number of watches
+    - page: Page returned
+    - error: Error message if failed
+    """
+    watches = request.app.state.orchestrator.watches
+    if watches is None:
+        return {"success": False, "watches": [], "count": 0, "total": 0, "page": page, "error": WATCHES_DISABLED}
+    rows, total = await asyncio.to_thread(watches.page, limit, (page - 1) * limit)
+    return {"success": True, "watches": rows, "count": len(rows), "total": total, "page": page, "error": None}
+
+
+@router.get("/watch/{watch_id}")
+async def get_watch(request: Request, watch_id: int) -> dict:
+    """
+    One watch with the last price the scheduler saw
+    
+    Returns:
+    - success: Whether the watch exists
+    - watch: The watch (see POST /api/watch)
+    - error: Error message if failed
+    """
+    watches = request.app.state.orchestrator.watches
+    watch = await asyncio.to_thread(watches.get, watch_id) if watches is not None else None
+    if watch is None:
+        return {"success": False, "watch": None, "error": f"Watch {watch_id} not found"}
+    return {"success": True, "watch": watch, "error": None}
+
+
+@router.delete("/watch/{watch_id}")
+async def remove_watch(request: Request, watch_id: int) -> dict:
+    """
+    Stop watching a product
+    
+    Returns:
+    - success: Whether the watch existed and was removed
+    - error: Error message if failed
+    """
+    watches = request.app.state.orchestrator.watches
+    if watches is None or not await asyncio.to_thread(watches.remove, watch_id):
+        return {"success": False, "error": f"Watch {watch_id} not found"}
+    logger.info(f"Watch {watch_id} removed")
+    return {"success": True, "error": None}
+
+
+__all__ = ["router"]
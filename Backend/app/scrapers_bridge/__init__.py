@@ -1,10 +1,25 @@
 # app/scrapers_bridge/__init__.py
 """Scrapers bridge - executor and orchestration layer"""
 
+from app.scrapers_bridge.scheduler import PriorityScheduler, INTERACTIVE, BATCH, BACKGROUND
 from app.scrapers_bridge.executor import ScraperExecutor
+from app.scrapers_bridge.prewarm import TrendingPrewarmer
+from app.scrapers_bridge.prefetch import SpeculativePrefetcher
+from app.scrapers_bridge.watch import PriceWatchScheduler
+from app.scrapers_bridge.live import LiveUpdateHub
+from app.scrapers_bridge.warmup import StartupWarmup
 from app.scrapers_bridge.orchestrator import ScrapingOrchestrator
 
 __all__ = [
+    "PriorityScheduler",
+    "INTERACTIVE",
+    "BATCH",
+    "BACKGROUND",
     "ScraperExecutor",
+    "TrendingPrewarmer",
+    "SpeculativePrefetcher",
+    "PriceWatchScheduler",
+    "LiveUpdateHub",
+    "StartupWarmup",
     "ScrapingOrchestrator",
 ]
\ No newline at end of file
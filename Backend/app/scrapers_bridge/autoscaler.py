@@ -0,0 +1,205 @@
+# app/scrapers_bridge/autoscaler.py
+"""
+Queue-latency driven autoscaling of scraper capacity
+Grows and shrinks concurrent scraper slots (one browser each) within bounds
+"""
+
+import asyncio
+import time
+from collections import deque
+from app.config import (
+    logger,
+    AUTOSCALE_MIN_WORKERS,
+    AUTOSCALE_MAX_WORKERS,
+    AUTOSCALE_INTERVAL_S,
+    AUTOSCALE_UP_WAIT_S,
+    AUTOSCALE_UP_UTILIZATION,
+    AUTOSCALE_DOWN_UTILIZATION,
+    AUTOSCALE_UP_TICKS,
+    AUTOSCALE_DOWN_TICKS,
+    AUTOSCALE_COOLDOWN_S,
+    AUTOSCALE_STEP_UP,
+    AUTOSCALE_BROWSER_MEMORY_MB,
+    AUTOSCALE_MIN_FREE_MEMORY_MB,
+)
+
+try:
+    import psutil  # Optional: more accurate memory readings
+except ImportError:
+    psutil = None
+
+
+def available_memory_mb() -> float | None:
+    """
+    Read available host memory in MB
+    
+    Uses psutil if installed, otherwise /proc/meminfo (Linux).
+    
+    Returns:
+        float: Available memory in MB, or None if it cannot be determined
+    """
+    if psutil is not None:
+        return psutil.virtual_memory().available / (1024 * 1024)
+    
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+class CapacityAutoscaler:
+    """
+    Periodically resizes the executor's scheduler capacity
+    
+    Signals:
+    - Queue wait: head-of-line wait of any queued job
+    - Utilization: running slots / capacity
+    - Memory headroom: each extra slot costs about one browser
+    
+    Hysteresis: a direction must be signalled for several consecutive
+    ticks, and no change happens within the cooldown after the last one.
+    Memory pressure scales down immediately.
+    """
+    
+    def __init__(
+        self,
+        executor,
+        min_workers: int = AUTOSCALE_MIN_WORKERS,
+        max_workers: int = AUTOSCALE_MAX_WORKERS
+    ):
+        """Initialize autoscaler for a ScraperExecutor"""
+        self.executor = executor
+        self.min_workers = min_workers
+        self.max_workers = max_workers
+        
+        self._up_ticks = 0
+        self._down_ticks = 0
+        self._last_change = 0.0
+        self._task: asyncio.Task | None = None
+        self._events: deque = deque(maxlen=50)
+        self._counters = {"scale_ups": 0, "scale_downs": 0, "memory_pressure": 0}
+        self._last_sample: dict = {}
+    
+    def _sample(self) -> dict:
+        """Collect the current load signals"""
+        scheduler = self.executor.scheduler
+        return {
+            "capacity": scheduler.capacity,
+            "running": scheduler.running,
+            "queued": scheduler.queued(),
+            "utilization": scheduler.running / scheduler.capacity,
+            "queue_wait_s": max(
+                (scheduler.oldest_wait(name) for name in scheduler.weights), default=0.0
+            ),
+            "available_memory_mb": available_memory_mb(),
+        }
+    
+    def _resize(self, target: int, reason: str):
+        """Apply a new capacity and record the change"""
+        current = self.executor.scheduler.capacity
+        target = min(max(target, self.min_workers), self.max_workers)
+        if target == current:
+            return
+        
+        self.executor.scheduler.set_capacity(target)
+        self._last_change = time.monotonic()
+        self._up_ticks = self._down_ticks = 0
+        self._counters["scale_ups" if target > current else "scale_downs"] += 1
+        self._events.append({
+            "at": time.time(),
+            "from": current,
+            "to": target,
+            "reason": reason,
+        })
+        logger.info(f"Autoscaler: capacity {current} -> {target} ({reason})")
+    
+    def evaluate(self):
+        """Run one scaling decision (called every AUTOSCALE_INTERVAL_S)"""
+        sample = self._sample()
+        self._last_sample = sample
+        capacity = sample["capacity"]
+        memory = sample["available_memory_mb"]
+        
+        # Memory pressure overrides hysteresis and cooldown
+        if memory is not None and memory < AUTOSCALE_MIN_FREE_MEMORY_MB:
+            self._counters["memory_pressure"] += 1
+            self._resize(capacity - 1, f"memory pressure ({memory:.0f} MB free)")
+            return
+        
+        wants_up = (
+            (sample["queued"] > 0 and sample["queue_wait_s"] >= AUTOSCALE_UP_WAIT_S)
+            or sample["utilization"] >= AUTOSCALE_UP_UTILIZATION
+        )
+        wants_down = sample["queued"] == 0 and sample["utilization"] <= AUTOSCALE_DOWN_UTILIZATION
+        
+        self._up_ticks = self._up_ticks + 1 if wants_up else 0
+        self._down_ticks = self._down_ticks + 1 if wants_down else 0
+        
+        if time.monotonic() - self._last_change < AUTOSCALE_COOLDOWN_S:
+            return
+        
+        if self._up_ticks >= AUTOSCALE_UP_TICKS and capacity < self.max_workers:
+            # Only add browsers the host can actually hold
+            step = AUTOSCALE_STEP_UP
+            if memory is not None:
+                affordable = int((memory - AUTOSCALE_MIN_FREE_MEMORY_MB) // AUTOSCALE_BROWSER_MEMORY_MB)
+                step = min(step, affordable)
+            if step > 0:
+                self._resize(
+                    capacity + step,
+                    f"queue wait {sample['queue_wait_s']:.1f}s, utilization {sample['utilization']:.0%}"
+                )
+        elif self._down_ticks >= AUTOSCALE_DOWN_TICKS and capacity > self.min_workers:
+            self._resize(capacity - 1, f"utilization {sample['utilization']:.0%}")
+    
+    async def _run(self):
+        """Evaluation loop"""
+        while True:
+            await asyncio.sleep(AUTOSCALE_INTERVAL_S)
+            try:
+                self.evaluate()
+            except Exception as e:
+                logger.error(f"Autoscaler evaluation failed: {e}")
+    
+    def start(self):
+        """Start the background evaluation loop"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info(
+                f"Autoscaler started (bounds {self.min_workers}-{self.max_workers}, "
+                f"every {AUTOSCALE_INTERVAL_S}s)"
+            )
+    
+    async def stop(self):
+        """Stop the background evaluation loop"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    def stats(self) -> dict:
+        """Capacity bounds, last sample and recent scaling events"""
+        sample = dict(self._last_sample)
+        if "utilization" in sample:
+            sample["utilization"] = round(sample["utilization"], 2)
+            sample["queue_wait_s"] = round(sample["queue_wait_s"], 2)
+        if sample.get("available_memory_mb") is not None:
+            sample["available_memory_mb"] = round(sample["available_memory_mb"])
+        return {
+            "capacity": self.executor.scheduler.capacity,
+            "min_workers": self.min_workers,
+            "max_workers": self.max_workers,
+            **self._counters,
+            "last_sample": sample,
+            "recent_changes": list(self._events),
+        }
+
+
+__all__ = ["CapacityAutoscaler", "available_memory_mb"]
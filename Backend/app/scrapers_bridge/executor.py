@@ -5,8 +5,20 @@ Manages parallel scraping across platforms
 """
 
 from concurrent.futures import ThreadPoolExecutor
-from app.config import logger, MAX_WORKERS
+from app.config import (
+    logger,
+    MAX_WORKERS,
+    AUTOSCALE_MAX_WORKERS,
+    SCRAPER_TIMEOUT_S,
+    SCRAPER_DURATION_SEED_S,
+)
+from app.scrapers_bridge.scheduler import PriorityScheduler, INTERACTIVE
 import asyncio
+import threading
+import time
+
+# Smoothing factor for the moving average of scrape duration
+EWMA_ALPHA = 0.2
 
 
 class ScraperExecutor:
@@ -15,19 +27,154 @@ class ScraperExecutor:
     
     Wraps concurrent.futures.ThreadPoolExecutor for easy scraper management.
     Allows async code to call sync scrapers without blocking.
+    Jobs pass through a PriorityScheduler so interactive requests are not
+    stuck behind batch/background work, and the average scrape duration is
+    tracked so callers (e.g. admission control) can estimate queue wait.
     """
     
-    def __init__(self, max_workers: int = MAX_WORKERS):
-        """Initialize executor with thread pool"""
-        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+    def __init__(
+        self,
+        max_workers: int = MAX_WORKERS,
+        pool_size: int = AUTOSCALE_MAX_WORKERS
+    ):
+        """
+        Initialize executor with thread pool and priority scheduler
+        
+        Args:
+            max_workers: Initial number of concurrent scrapers
+            pool_size: Thread pool size, the most capacity can ever grow to
+        """
+        # Threads are created lazily, so sizing the pool at the autoscaling
+        # bound costs nothing until capacity actually grows
+        self.pool_size = max(pool_size, max_workers)
+        self.executor = ThreadPoolExecutor(max_workers=self.pool_size)
         self.max_workers = max_workers
+        
+        # Jobs wait for a slot here, so the thread pool itself never queues
+        self.scheduler = PriorityScheduler(capacity=max_workers)
+        
+        # Duration accounting (guarded by _lock, updated from worker threads)
+        self._lock = threading.Lock()
+        self._completed = 0
+        self._avg_duration = float(SCRAPER_DURATION_SEED_S)
+        
         logger.info(f"ScraperExecutor initialized with {max_workers} workers")
     
+    def _instrumented(
+        self,
+        scraper_func,
+        query: str,
+        deadline: float | None = None,
+        kwargs: dict | None = None
+    ):
+        """Run scraper in a worker thread while recording its duration"""
+        started_at = time.monotonic()
+        
+        # Hand the scraper whatever is left of the caller's deadline as its
+        # navigation/readiness budget; skip the browser entirely if none is left
+        kwargs = dict(kwargs or {})
+        if deadline is not None:
+            budget_ms = int((deadline - started_at) * 1000)
+            if budget_ms <= 0:
+                logger.warning(f"{scraper_func.__name__} skipped: deadline passed while queued")
+                return None
+            kwargs["budget_ms"] = budget_ms
+        
+        try:
+            return scraper_func(query, **kwargs)
+        finally:
+            duration = time.monotonic() - started_at
+            with self._lock:
+                self._completed += 1
+                self._avg_duration += EWMA_ALPHA * (duration - self._avg_duration)
+    
+    def estimate_queue_wait(self, new_jobs: int = 1, priority: str = INTERACTIVE) -> float:
+        """
+        Estimate seconds the last of `new_jobs` would wait before starting
+        
+        Jobs ahead of it beyond the available slots drain in waves,
+        each wave taking roughly the average scrape duration.
+        Interactive work only queues behind other interactive work;
+        other classes are limited to the non-reserved slots.
+        
+        Args:
+            new_jobs: Number of jobs the caller is about to submit
+            priority: Priority class the jobs would run under
+            
+        Returns:
+            float: Estimated queue wait in seconds (0 if a slot is free)
+        """
+        scheduler = self.scheduler
+        if priority == INTERACTIVE:
+            slots = scheduler.capacity
+            ahead = scheduler.running + scheduler.queued(INTERACTIVE)
+        else:
+            slots = max(scheduler.capacity - scheduler.reserved, 1)
+            ahead = scheduler.running + scheduler.queued()
+        
+        backlog = ahead + new_jobs - slots
+        if backlog <= 0:
+            return 0.0
+        
+        waves = -(-backlog // slots)  # ceil division
+        with self._lock:
+            return waves * self._avg_duration
+    
+    def stats(self) -> dict:
+        """Snapshot of executor load for monitoring"""
+        scheduler = self.scheduler.stats()
+        with self._lock:
+            return {
+                "pool_size": self.pool_size,
+                "capacity": scheduler["capacity"],
+                "queued": scheduler["queued"],
+                "running": scheduler["running"],
+                "completed": self._completed,
+                "utilization": round(scheduler["running"] / scheduler["capacity"], 2),
+                "avg_duration_s": round(self._avg_duration, 2),
+                "priorities": scheduler["classes"],
+            }
+    
+    async def _run_with_slot(
+        self,
+        scraper_func,
+        query: str,
+        priority: str,
+        deadline: float | None = None,
+        kwargs: dict | None = None
+    ):
+        """Wait for a scheduler slot, then run the scraper on a worker thread"""
+        loop = asyncio.get_running_loop()
+        await self.scheduler.acquire(priority)
+        
+        try:
+            future = self.executor.submit(
+                self._instrumented, scraper_func, query, deadline, kwargs
+            )
+        except Exception:
+            self.scheduler.release(priority)
+            raise
+        
+        # The slot is held until the thread really finishes, even if the
+        # caller stops waiting, so browsers are never oversubscribed
+        future.add_done_callback(lambda _: self._release_from_thread(loop, priority))
+        return await asyncio.wrap_future(future)
+    
+    def _release_from_thread(self, loop, priority: str):
+        """Return a scheduler slot from a worker thread"""
+        try:
+            loop.call_soon_threadsafe(self.scheduler.release, priority)
+        except RuntimeError:
+            logger.debug("Event loop closed before scraper finished; slot not returned")
+    
     async def run_scraper(
         self,
         scraper_func,
         query: str,
-        timeout: int = 30
+        timeout: float = SCRAPER_TIMEOUT_S,
+        priority: str = INTERACTIVE,
+        deadline: float | None = None,
+        max_products: int | None = None
     ) -> dict | None:
         """
         Run a sync scraper in thread pool (non-blocking in async context)
@@ -35,17 +182,24 @@ class ScraperExecutor:
         Args:
             scraper_func: Scraper function (from scrapers module)
             query: Search query
-            timeout: Max seconds to wait for scraper
+            timeout: Max seconds to wait for scraper (including queueing)
+            priority: Scheduler class (interactive, batch, background)
+            deadline: Absolute time.monotonic() deadline; also passed to the
+                      scraper as its remaining budget_ms
+            max_products: Products to request (scraper default if None)
             
         Returns:
             dict: Scraper results or None if failed
         """
-        loop = asyncio.get_event_loop()
+        if deadline is not None:
+            timeout = max(min(timeout, deadline - time.monotonic()), 0)
+        
+        kwargs = {"max_products": max_products} if max_products is not None else None
         
         try:
-            logger.debug(f"Running {scraper_func.__name__} with query: {query}")
+            logger.debug(f"Running {scraper_func.__name__} ({priority}) with query: {query}")
             result = await asyncio.wait_for(
-                loop.run_in_executor(self.executor, scraper_func, query),
+                self._run_with_slot(scraper_func, query, priority, deadline, kwargs),
                 timeout=timeout
             )
             logger.debug(f"{scraper_func.__name__} completed")
@@ -61,7 +215,10 @@ class ScraperExecutor:
     async def run_all_scrapers(
         self,
         scrapers: dict,
-        query: str
+        query: str,
+        timeout: float = SCRAPER_TIMEOUT_S,
+        priority: str = INTERACTIVE,
+        deadline: float | None = None
     ) -> dict:
         """
         Run all scrapers in parallel
@@ -69,20 +226,23 @@ class ScraperExecutor:
         Args:
             scrapers: Dict of {platform: scraper_func}
             query: Search query
-            
+            timeout: Max seconds to wait for each scraper
+            priority: Scheduler class for all scrapers
+            deadline: Absolute time.monotonic() deadline for all scrapers
+        
         Returns:
             dict: {platform: results or None}
         """
         logger.info(f"Starting parallel scraping for: {query}")
         
-        tasks = {
-            platform: self.run_scraper(func, query)
-            for platform, func in scrapers.items()
-        }
-        
-        results = {}
-        for platform, task in tasks.items():
-            results[platform] = await task
+        platforms = list(scrapers)
+        outputs = await asyncio.gather(*(
+            self.run_scraper(
+                scrapers[platform], query, timeout=timeout, priority=priority, deadline=deadline
+            )
+            for platform in platforms
+        ))
+        results = dict(zip(platforms, outputs))
         
         logger.info(f"Parallel scraping completed")
         return results
@@ -93,4 +253,4 @@ class ScraperExecutor:
         self.executor.shutdown(wait=True)
 
 
-__all__ = ["ScraperExecutor"]
\ No newline at end of file
+__all__ = ["ScraperExecutor"]
@@ -0,0 +1,375 @@
+# app/scrapers_bridge/live.py
+"""
+Live price updates
+Fans price changes seen by any scrape out to WebSocket subscribers
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from app.config import (
+    logger,
+    LIVE_REFRESH_S,
+    LIVE_PRODUCT_FRESH_S,
+    LIVE_PAGE_LOADS_PER_CYCLE,
+    LIVE_MAX_SUBSCRIBERS,
+    LIVE_MAX_TOPICS,
+    LIVE_QUEUE_SIZE,
+    LIVE_MAX_TRACKED_PRICES,
+    WATCH_BATCH_SIZE,
+)
+from app.cache.catalog import product_id, normalize_product_id
+from app.core.price_utils import extract_price
+from app.core.text_utils import clean_query, canonicalize_query
+from app.scrapers_bridge.prewarm import jittered
+
+
+class LiveSubscriber:
+    """One connected client: its topics and the messages waiting to be sent to it"""
+    
+    def __init__(self, queue_size: int = LIVE_QUEUE_SIZE):
+        self.topics: set[tuple] = set()
+        self.queue: asyncio.Queue = asyncio.Queue(queue_size)
+        self.dropped = 0
+    
+    def push(self, message: dict):
+        """Queue a message; a client that stops reading loses its oldest ones"""
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(message)
+
+
+class LiveUpdateHub:
+    """
+    Price change fan-out to subscribed clients
+    
+    Topics are a comparison ("query", canonical query) or one product
+    ("product", platform, product ID). Every scrape that completes -
+    searches, comparisons, stale-while-revalidate refreshes, pre-warms,
+    product page reads - is published here; products of a subscribed
+    topic whose price or availability differs from the last one seen are
+    sent to every subscriber of that topic, one message per subscriber
+    per scrape. N clients watching the same comparison cost one scrape.
+    
+    While a topic has subscribers it is kept fresh every LIVE_REFRESH_S:
+    - queries through the pre-warmer (BACKGROUND priority, only platforms
+      whose cache entry is missing or near expiry)
+    - products not seen for LIVE_PRODUCT_FRESH_S by a page load, at most
+      LIVE_PAGE_LOADS_PER_CYCLE per cycle
+    """
+    
+    def __init__(self, orchestrator):
+        """Initialize hub for a ScrapingOrchestrator"""
+        self.orchestrator = orchestrator
+        
+        self._subscribers: set[LiveSubscriber] = set()
+        self._topics: dict[tuple, set[LiveSubscriber]] = {}
+        self._queries: dict[str, str] = {}  # canonical key -> query to refresh (as first typed)
+        self._links: dict[tuple, str] = {}  # (platform, product ID) -> product link
+        self._prices: OrderedDict = OrderedDict()  # (platform, product ID) -> (price, in stock)
+        self._task: asyncio.Task | None = None
+        self._counters = {
+            "connected": 0,
+            "refused": 0,
+            "published": 0,
+            "changes": 0,
+            "messages": 0,
+            "cycles": 0,
+            "queries_refreshed": 0,
+            "page_loads": 0,
+        }
+    
+    # ---- subscribers ----
+    
+    def connect(self) -> LiveSubscriber | None:
+        """New subscriber, or None at LIVE_MAX_SUBSCRIBERS"""
+        if len(self._subscribers) >= LIVE_MAX_SUBSCRIBERS:
+            self._counters["refused"] += 1
+            return None
+        subscriber = LiveSubscriber()
+        self._subscribers.add(subscriber)
+        self._counters["connected"] += 1
+        return subscriber
+    
+    def disconnect(self, subscriber: LiveSubscriber):
+        """Drop a subscriber and every topic only it was subscribed to"""
+        for topic in list(subscriber.topics):
+            self.unsubscribe(subscriber, topic)
+        self._subscribers.discard(subscriber)
+    
+    @staticmethod
+    def query_key(query: str) -> str:
+        """Canonical query a comparison subscription is keyed by"""
+        return canonicalize_query(query)[0]
+    
+    def product_key(self, platform: str, product: str) -> str:
+        """
+        Product ID a product subscription is keyed by
+        
+        Args:
+            platform: Platform of the product
+            product: Platform product ID or product link
+        
+        Raises:
+            ValueError: If the platform or product is not recognized
+        """
+        if platform not in self.orchestrator.scrapers:
+            raise ValueError(f"Platform '{platform}' not supported")
+        if "/" in product:
+            if not self.orchestrator.is_product_link(platform, product):
+                raise ValueError(f"Not a product link on {platform}: {product}")
+            pid = product_id(platform, product)
+            if not pid:
+                raise ValueError(f"No product ID in {product}")
+            return pid
+        pid = normalize_product_id(platform, product)
+        if not pid:
+            raise ValueError("Give a product ID or product link")
+        return pid
+    
+    def _add_topic(self, subscriber: LiveSubscriber, topic: tuple):
+        if topic not in subscriber.topics and len(subscriber.topics) >= LIVE_MAX_TOPICS:
+            raise ValueError(f"At most {LIVE_MAX_TOPICS} subscriptions per connection")
+        subscriber.topics.add(topic)
+        self._topics.setdefault(topic, set()).add(subscriber)
+    
+    def _remember_price(self, platform: str, product: dict):
+        """Seed the price a later change is diffed against (keeps an existing one)"""
+        pid = product_id(platform, product.get("link"))
+        price = extract_price(product.get("currentPrice"))
+        if pid and price and (platform, pid) not in self._prices:
+            self._prices[(platform, pid)] = (price, product.get("inStock"))
+            while len(self._prices) > LIVE_MAX_TRACKED_PRICES:
+                self._prices.popitem(last=False)
+    
+    async def subscribe_query(self, subscriber: LiveSubscriber, query: str) -> dict:
+        """
+        Subscribe to every product a comparison's platforms return
+        
+        Args:
+            subscriber: Connected subscriber
+            query: Search query (any spelling; subscriptions are per canonical query)
+        
+        Returns:
+            dict: {"topic": "query", "query": canonical display form, "tracked": products
+                   whose current price is known}
+        
+        Raises:
+            ValueError: If the query is empty or the subscriber has too many topics
+        """
+        key, display = canonicalize_query(query)
+        if not key:
+            raise ValueError("Empty query")
+        self._add_topic(subscriber, ("query", key))
+        self._queries.setdefault(key, clean_query(query))
+        
+        # Baseline from the cache, so the first refresh reports real changes
+        # (peeked: subscriptions are not cache traffic)
+        cache = self.orchestrator.cache
+        tracked = 0
+        for platform in self.orchestrator.scrapers:
+            products = await asyncio.to_thread(
+                cache.peek, platform, display, self.orchestrator.max_products
+            )
+            for product in products or []:
+                self._remember_price(platform, product)
+                tracked += 1
+        return {"topic": "query", "query": display, "tracked": tracked}
+    
+    async def subscribe_product(self, subscriber: LiveSubscriber, platform: str, product: str) -> dict:
+        """
+        Subscribe to one product
+        
+        Args:
+            subscriber: Connected subscriber
+            platform: Platform of the product
+            product: Platform product ID or product link
+        
+        Returns:
+            dict: {"topic": "product", "platform", "product_id", "price": last known
+                   price or None}
+        
+        Raises:
+            ValueError: If the product is not recognized or the subscriber has too many topics
+        """
+        pid = self.product_key(platform, product)
+        link = product if "/" in product else None
+        
+        catalog = self.orchestrator.catalog
+        if catalog is not None:
+            known = await asyncio.to_thread(catalog.lookup, platform, [pid])
+            if pid in known:
+                known_product = known[pid][0]
+                link = link or known_product.get("link")
+                self._remember_price(platform, known_product)
+        
+        self._add_topic(subscriber, ("product", platform, pid))
+        if link:
+            # Without a link the product is only updated when a search returns it
+            self._links[(platform, pid)] = link
+        known_price = self._prices.get((platform, pid))
+        return {
+            "topic": "product",
+            "platform": platform,
+            "product_id": pid,
+            "price": known_price[0] if known_price else None,
+        }
+    
+    def unsubscribe(self, subscriber: LiveSubscriber, topic: tuple):
+        """Remove one subscription; a topic nobody follows stops being refreshed"""
+        subscriber.topics.discard(topic)
+        followers = self._topics.get(topic)
+        if followers is None:
+            return
+        followers.discard(subscriber)
+        if not followers:
+            del self._topics[topic]
+            if topic[0] == "query":
+                self._queries.pop(topic[1], None)
+            else:
+                self._links.pop(topic[1:], None)
+    
+    # ---- publishing ----
+    
+    def publish(self, platform: str, products: list[dict], query: str | None = None):
+        """
+        Send the price changes in a platform's fresh products to their subscribers
+        
+        Call from the event loop whenever a scrape or page read completes.
+        
+        Args:
+            platform: Platform the products come from
+            products: Freshly scraped products (or product page readings)
+            query: Search query the products were scraped for, if any
+        """
+        if not self._topics or not products:
+            return
+        self._counters["published"] += 1
+        query_followers = set()
+        if query:
+            query_followers = self._topics.get(("query", canonicalize_query(query)[0]), set())
+        
+        outgoing: dict[LiveSubscriber, list[dict]] = {}
+        for product in products:
+            pid = product_id(platform, product.get("link"))
+            price = extract_price(product.get("currentPrice"))
+            if not pid or not price:
+                continue
+            followers = query_followers | self._topics.get(("product", platform, pid), set())
+            if not followers:
+                continue
+            
+            previous = self._prices.pop((platform, pid), None)
+            in_stock = product.get("inStock")
+            if in_stock is None and previous is not None:
+                in_stock = previous[1]  # search results do not say
+            self._prices[(platform, pid)] = (price, in_stock)
+            while len(self._prices) > LIVE_MAX_TRACKED_PRICES:
+                self._prices.popitem(last=False)
+            if previous is None:
+                continue
+            stock_changed = None not in (previous[1], in_stock) and previous[1] != in_stock
+            if previous[0] == price and not stock_changed:
+                continue
+            
+            change = {
+                "platform": platform,
+                "product_id": pid,
+                "title": product.get("title"),
+                "link": product.get("link"),
+                "old_price": previous[0],
+                "new_price": price,
+                "in_stock": in_stock,
+            }
+            self._counters["changes"] += 1
+            for subscriber in followers:
+                outgoing.setdefault(subscriber, []).append(change)
+        
+        for subscriber, changes in outgoing.items():
+            subscriber.push({"type": "prices", "query": query, "changes": changes, "at": time.time()})
+            self._counters["messages"] += 1
+        if outgoing:
+            logger.info(f"Live update: {platform} price changes sent to {len(outgoing)} subscribers")
+    
+    # ---- refreshing ----
+    
+    async def run_cycle(self) -> dict:
+        """
+        Refresh every subscribed topic that is due
+        
+        Returns:
+            dict: {"queries", "refreshed", "products", "page_loads"}
+        """
+        queries = list(self._queries.values())
+        refreshed = 0
+        if queries:
+            outcome = await self.orchestrator.prewarmer.warm(queries)
+            refreshed = outcome["refreshed"]
+        
+        # Products: a page load only for ones no scrape has seen lately
+        catalog = self.orchestrator.catalog
+        by_platform: dict[str, list[str]] = {}
+        for platform, pid in self._links:
+            by_platform.setdefault(platform, []).append(pid)
+        now = time.time()
+        budget = LIVE_PAGE_LOADS_PER_CYCLE
+        stale: dict[str, list[str]] = {}
+        for platform, pids in by_platform.items():
+            known = await asyncio.to_thread(catalog.lookup, platform, pids) if catalog is not None else {}
+            for pid in pids:
+                if budget and (pid not in known or now - known[pid][1] > LIVE_PRODUCT_FRESH_S):
+                    stale.setdefault(platform, []).append(self._links[(platform, pid)])
+                    budget -= 1
+        
+        jobs = []
+        for platform, urls in stale.items():
+            for i in range(0, len(urls), WATCH_BATCH_SIZE):
+                jobs.append(self.orchestrator.load_product_pages(platform, urls[i:i + WATCH_BATCH_SIZE]))
+        await asyncio.gather(*jobs, return_exceptions=True)
+        page_loads = LIVE_PAGE_LOADS_PER_CYCLE - budget
+        
+        self._counters["cycles"] += 1
+        self._counters["queries_refreshed"] += refreshed
+        self._counters["page_loads"] += page_loads
+        return {"queries": len(queries), "refreshed": refreshed, "products": len(self._links), "page_loads": page_loads}
+    
+    async def _run(self):
+        """Cycle loop"""
+        while True:
+            await asyncio.sleep(jittered(LIVE_REFRESH_S))
+            if not self._topics:
+                continue
+            try:
+                await self.run_cycle()
+            except Exception as e:
+                logger.error(f"Live refresh cycle failed: {e}")
+    
+    def start(self):
+        """Start the background refresh loop"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        """Stop the background refresh loop"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    def stats(self) -> dict:
+        """Subscribers, topics, counters and messages dropped for slow clients"""
+        return {
+            **self._counters,
+            "subscribers": len(self._subscribers),
+            "queries": len(self._queries),
+            "products": sum(1 for topic in self._topics if topic[0] == "product"),
+            "tracked_prices": len(self._prices),
+            "dropped": sum(subscriber.dropped for subscriber in self._subscribers),
+        }
+
+
+__all__ = ["LiveSubscriber", "LiveUpdateHub"]
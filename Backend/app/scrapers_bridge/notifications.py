@@ -0,0 +1,93 @@
+# app/scrapers_bridge/notifications.py
+"""
+Price-watch notification sinks
+Where price-drop, target and back-in-stock events are delivered
+"""
+
+import json
+import os
+import threading
+import urllib.request
+from app.config import (
+    logger,
+    WATCH_NOTIFY_PATH,
+    WATCH_WEBHOOK_URL,
+    WATCH_WEBHOOK_TIMEOUT_S,
+)
+
+
+class FileNotificationSink:
+    """Appends each event as a JSON line to a local file"""
+    
+    def __init__(self, path: str = WATCH_NOTIFY_PATH):
+        """Initialize sink at `path` (created on first event)"""
+        self.path = path
+        self._lock = threading.Lock()
+        self._counters = {"sent": 0, "errors": 0}
+    
+    def send(self, events: list[dict]):
+        """Deliver a batch of events"""
+        if not events:
+            return
+        lines = "".join(json.dumps(event, ensure_ascii=False) + "\n" for event in events)
+        with self._lock:
+            try:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(lines)
+                self._counters["sent"] += len(events)
+            except OSError as e:
+                logger.warning(f"Writing notifications failed: {e}")
+                self._counters["errors"] += 1
+    
+    def stats(self) -> dict:
+        with self._lock:
+            return {**self._counters, "sink": "file", "path": self.path}
+
+
+class WebhookNotificationSink:
+    """POSTs each batch of events as JSON ({"events": [...]}) to a URL"""
+    
+    def __init__(self, url: str, timeout: float = WATCH_WEBHOOK_TIMEOUT_S):
+        """Initialize sink posting to `url`"""
+        self.url = url
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._counters = {"sent": 0, "errors": 0}
+    
+    def send(self, events: list[dict]):
+        """Deliver a batch of events (failures are logged, not retried)"""
+        if not events:
+            return
+        request = urllib.request.Request(
+            self.url,
+            data=json.dumps({"events": events}, ensure_ascii=False).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST"
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout):
+                pass
+        except OSError as e:
+            logger.warning(f"Notification webhook failed: {e}")
+            with self._lock:
+                self._counters["errors"] += 1
+            return
+        with self._lock:
+            self._counters["sent"] += len(events)
+    
+    def stats(self) -> dict:
+        with self._lock:
+            return {**self._counters, "sink": "webhook", "url": self.url}
+
+
+def make_sink():
+    """Webhook sink if WATCH_WEBHOOK_URL is set, else the local file sink"""
+    if WATCH_WEBHOOK_URL:
+        return WebhookNotificationSink(WATCH_WEBHOOK_URL)
+    return FileNotificationSink()
+
+
+__all__ = ["FileNotificationSink", "WebhookNotificationSink", "make_sink"]
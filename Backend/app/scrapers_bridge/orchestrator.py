@@ -5,16 +5,75 @@ Scraping orchestration and result aggregation
 Coordinates parallel scraping and result compilation
 """
 
-from app.config import logger
+import asyncio
+import time
+from urllib.parse import urlsplit
+from app.config import (
+    logger,
+    SCRAPER_TIMEOUT_S,
+    PRODUCT_REFRESH_TIMEOUT_S,
+    PRODUCT_HOSTS,
+    SCRAPER_MAX_PRODUCTS,
+    QUORUM_ANCHOR_PLATFORM,
+    QUORUM_SOFT_DEADLINE_S,
+    COMPARE_BATCH_CONCURRENCY,
+    COMPARE_BATCH_QUERY_CHARS,
+    L2_CACHE_ENABLED,
+    CATALOG_ENABLED,
+    HISTORY_ENABLED,
+    WATCH_ENABLED,
+    WATCH_DEFAULT_INTERVAL_S,
+    LIVE_ENABLED,
+    PREWARM_ENABLED,
+    PREFETCH_ENABLED,
+    QUERY_LOG_ENABLED,
+    SUGGEST_MAX_PRODUCTS,
+    SUGGEST_QUERY_WINDOW_S,
+)
+from app.cache.result_cache import PlatformResultCache, FRESH, STALE, MISS, EMPTY, FAILED
+from app.cache.sqlite_store import SQLiteCacheStore
+from app.cache.query_log import QueryLog
+from app.cache.comparison_memo import ComparisonMemo, fingerprint_products
+from app.cache.catalog import ProductCatalog, product_id
+from app.cache.price_history import PriceHistory
+from app.cache.watch_list import WatchList
+from app.cache.suggest_index import SuggestIndex
 from app.scrapers_bridge.executor import ScraperExecutor
-from app.core.matcher import match_products_across_platforms
+from app.scrapers_bridge.scheduler import INTERACTIVE, BATCH, BACKGROUND
+from app.scrapers_bridge.autoscaler import CapacityAutoscaler
+from app.scrapers_bridge.prewarm import TrendingPrewarmer
+from app.scrapers_bridge.prefetch import SpeculativePrefetcher
+from app.scrapers_bridge.watch import PriceWatchScheduler
+from app.scrapers_bridge.notifications import make_sink
+from app.scrapers_bridge.live import LiveUpdateHub
+from app.scrapers_bridge.warmup import StartupWarmup
+from app.core.matcher import MatchSession, match_products_across_platforms, match_cache_stats
 from app.core.formatter import build_bulk_comparison
-from app.core.text_utils import soft_filter_by_query
-from app.core.price_utils import is_price_valid_for_match
+from app.core.text_utils import soft_filter_by_query, clean_query, canonicalize_query
+from app.core.price_utils import extract_price, is_price_valid_for_match
 from scrapers.flipkart_sync import scrape_flipkart
 from scrapers.amazon_sync import scrape_amazon
 from scrapers.croma_sync import scrape_croma
 from scrapers.reliancedigital_sync import scrape_reliancedigital
+from scrapers.product_page import (
+    refresh_flipkart,
+    refresh_amazon,
+    refresh_croma,
+    refresh_reliancedigital,
+    refresh_flipkart_batch,
+    refresh_amazon_batch,
+    refresh_croma_batch,
+    refresh_reliancedigital_batch,
+)
+
+# Product fields a detail page refresh can update
+REFRESHED_FIELDS = ("currentPrice", "maxRetailPrice", "rating")
+
+# Platform outcomes after which a comparison reflects everything each platform offers
+CATALOG_RECORDABLE = {"ok", "empty", "cached", "stale", "cached_empty"}
+
+# Platform outcomes that count as the platform having answered (failed and cut-off ones did not)
+ANSWERED_STATUSES = CATALOG_RECORDABLE | {"catalog"}
 
 
 class ScrapingOrchestrator:
@@ -28,69 +87,871 @@ class ScrapingOrchestrator:
     """
 
     def __init__(self):
-        """Initialize orchestrator with executor"""
+        """Initialize orchestrator with executor and result cache"""
         self.executor = ScraperExecutor()
+        self.autoscaler = CapacityAutoscaler(self.executor)
+        l2 = SQLiteCacheStore() if L2_CACHE_ENABLED else None
+        self.cache = PlatformResultCache(l2=l2)
+        self.comparisons = ComparisonMemo(l2=l2)
+        self.catalog = ProductCatalog() if CATALOG_ENABLED else None
+        self.history = PriceHistory() if HISTORY_ENABLED else None
+        self.suggestions = SuggestIndex()
+        self.prewarmer = TrendingPrewarmer(self)
+        self.prefetcher = SpeculativePrefetcher(self)
+        self.query_log = QueryLog()
+        self.warmup = StartupWarmup(self, self.query_log)
+        self.max_products = SCRAPER_MAX_PRODUCTS
+        self._background: set[asyncio.Task] = set()  # stragglers/refreshes finishing into the cache
         self.scrapers = {
             "flipkart": scrape_flipkart,
             "amazon": scrape_amazon,
             "croma": scrape_croma,
             "reliancedigital": scrape_reliancedigital,
         }
+        self.refreshers = {
+            "flipkart": refresh_flipkart,
+            "amazon": refresh_amazon,
+            "croma": refresh_croma,
+            "reliancedigital": refresh_reliancedigital,
+        }
+        self.batch_refreshers = {
+            "flipkart": refresh_flipkart_batch,
+            "amazon": refresh_amazon_batch,
+            "croma": refresh_croma_batch,
+            "reliancedigital": refresh_reliancedigital_batch,
+        }
+        self.watches = WatchList() if WATCH_ENABLED else None
+        self.watcher = PriceWatchScheduler(self, self.watches, make_sink()) if WATCH_ENABLED else None
+        self.live = LiveUpdateHub(self) if LIVE_ENABLED else None
+        self._product_refreshes: dict[tuple, tuple] = {}  # (platform, url) -> (in-flight refresh, its deadline)
+        self._refresh_counters = {"refreshed": 0, "failed": 0, "coalesced": 0}
+        self._batch_slots: asyncio.Semaphore | None = None  # created on the serving event loop
 
-    async def scrape_all_platforms(self, query: str) -> dict:
+    async def scrape_all_platforms(
+        self,
+        query: str,
+        timeout: float = SCRAPER_TIMEOUT_S,
+        deadline: float | None = None
+    ) -> dict:
         """
-        Scrape all platforms in parallel
+        Scrape all platforms in parallel (cached platforms are not re-scraped)
         
         Args:
             query: User search query
-            
+            timeout: Max seconds to wait for each platform
+            deadline: Absolute time.monotonic() deadline for the whole scrape
+        
         Returns:
             dict: {platform: products_list or None}
         """
+        results, _ = await self.scrape_platforms(query, timeout=timeout, deadline=deadline)
+        return results
+
+    async def _scrape_platform(
+        self,
+        platform: str,
+        scraper_func,
+        query: str,
+        timeout: float,
+        deadline: float | None,
+        priority: str = INTERACTIVE
+    ) -> list[dict] | None:
+        """Scrape one platform and cache the outcome (products, empty or failed)"""
+        products = await self.executor.run_scraper(
+            scraper_func,
+            query,
+            timeout=timeout,
+            priority=priority,
+            deadline=deadline,
+            max_products=self.max_products
+        )
+        # A client's deadline running out says nothing about the platform,
+        # and an empty page read with the budget spent may just be unfinished
+        finished_in_time = deadline is None or time.monotonic() < deadline
+        # Off the event loop: cache writes may wait on the L2 file lock
+        if products:
+            await asyncio.to_thread(self.cache.set, platform, query, products, self.max_products)
+            if self.catalog is not None:
+                await asyncio.to_thread(self.catalog.record_products, platform, products)
+            if self.history is not None:
+                await asyncio.to_thread(self.history.record, platform, products)
+            self.suggestions.add_products(products)
+            if self.live is not None:
+                self.live.publish(platform, products, query)
+        elif finished_in_time:
+            outcome = EMPTY if products is not None else FAILED
+            await asyncio.to_thread(self.cache.set_negative, platform, query, outcome, self.max_products)
+        return products
+
+    def _track_background(self, task: asyncio.Task):
+        """Keep a reference to a background task until it finishes"""
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _revalidate(self, platform: str, scraper_func, query: str):
+        """Background refresh of a stale cache entry"""
+        try:
+            await self._scrape_platform(
+                platform, scraper_func, query, SCRAPER_TIMEOUT_S, None, priority=BACKGROUND
+            )
+        finally:
+            self.cache.end_refresh(platform, query, self.max_products)
+
+    def _refresh_in_background(self, platform: str, scraper_func, query: str):
+        """Start a single background refresh for a stale platform/query"""
+        if self.cache.begin_refresh(platform, query, self.max_products):
+            logger.info(f"Serving stale {platform} results for '{query}', refreshing in background")
+            self._track_background(asyncio.create_task(
+                self._revalidate(platform, scraper_func, query)
+            ))
+
+    def _quorum_met(self, answered: set, quorum: int | None) -> bool:
+        """Whether enough platforms (including the anchor) have answered"""
+        if quorum is None:
+            return False
+        anchor_ready = QUORUM_ANCHOR_PLATFORM in answered or QUORUM_ANCHOR_PLATFORM not in self.scrapers
+        return anchor_ready and len(answered) >= quorum
+
+    async def _start_platforms(
+        self,
+        query: str,
+        timeout: float,
+        deadline: float | None,
+        max_age: float | None,
+        fresh: bool,
+        priority: str = INTERACTIVE
+    ) -> tuple[dict, dict, dict]:
+        """
+        Answer cached platforms and start a scrape for every other one
+        
+        Args:
+            query: Search query as sent to the scrapers (clean_query)
+            timeout, deadline, max_age, fresh, priority: As for scrape_platforms
+        
+        Returns:
+            tuple: ({platform: products_list or None} of answered platforms,
+                    {platform: status} of answered platforms,
+                    {platform: scrape task} of the rest)
+        """
         logger.info(f"Starting parallel scraping for query: {query}")
-        results = await self.executor.run_all_scrapers(self.scrapers, query)
+        results = {}
+        statuses = {}
+        tasks = {}
+        for platform, func in self.scrapers.items():
+            if not fresh:
+                cached, state, _ = await asyncio.to_thread(
+                    self.cache.lookup, platform, query, self.max_products, max_age
+                )
+                if state == EMPTY or state == FAILED:
+                    # Known miss: answer in microseconds instead of re-running the scraper
+                    results[platform] = cached
+                    statuses[platform] = f"cached_{state}"
+                    continue
+                if cached is not None:
+                    results[platform] = cached
+                    statuses[platform] = "cached" if state == FRESH else "stale"
+                    if state == STALE:
+                        self._refresh_in_background(platform, func, query)
+                    continue
+            tasks[platform] = asyncio.create_task(
+                self._scrape_platform(platform, func, query, timeout, deadline, priority)
+            )
+        return results, statuses, tasks
+
+    @staticmethod
+    def _scrape_status(products: list[dict] | None, finished_at: float, deadline: float | None) -> str:
+        """Status of a finished scrape: ok, empty, failed or cut_off"""
+        if products is None:
+            # run_scraper also returns None when its deadline-clamped timeout fires
+            past_deadline = deadline is not None and finished_at >= deadline
+            return "cut_off" if past_deadline else "failed"
+        return "ok" if products else "empty"
+
+    async def scrape_platforms(
+        self,
+        query: str,
+        timeout: float = SCRAPER_TIMEOUT_S,
+        deadline: float | None = None,
+        quorum: int | None = None,
+        max_age: float | None = None,
+        fresh: bool = False,
+        priority: str = INTERACTIVE
+    ) -> tuple[dict, dict]:
+        """
+        Scrape all platforms in parallel and report how each one ended
+        
+        Platforms with a cached result are answered without scraping; a
+        stale one is served as-is while a single background refresh runs.
+        Platforms still running when the deadline passes, or once a quorum
+        has answered, are cut off from this response but keep running in
+        the background; their results land in the cache for the next
+        identical request.
+        
+        Args:
+            query: User search query
+            timeout: Max seconds to wait for each platform
+            deadline: Absolute time.monotonic() deadline for the whole scrape
+            quorum: Return once this many platforms, including the anchor
+                    platform, have answered or the soft deadline passes
+                    (None waits for all platforms)
+            max_age: Only accept cached results younger than this (seconds)
+            fresh: Bypass the cache and scrape every platform
+            priority: Scheduling class of the scrapes (INTERACTIVE or BATCH)
+        
+        Returns:
+            tuple: ({platform: products_list or None},
+                    {platform: "ok" | "empty" | "cached" | "stale" | "cached_empty" |
+                               "cached_failed" | "failed" | "cut_off"})
+        """
+        # Scrapers get the user's wording; equivalent spellings still share
+        # one cache entry and one refresh (the cache keys on the canonical query)
+        query = clean_query(query)
+        results, statuses, tasks = await self._start_platforms(
+            query, timeout, deadline, max_age, fresh, priority
+        )
+
+        finished_at = {}
+        for platform, task in tasks.items():
+            task.add_done_callback(
+                lambda _, platform=platform: finished_at.setdefault(platform, time.monotonic())
+            )
+
+        # Quorum mode answers by a soft deadline even if the quorum is never met
+        wait_until = deadline
+        if quorum is not None:
+            soft_deadline = time.monotonic() + QUORUM_SOFT_DEADLINE_S
+            wait_until = soft_deadline if deadline is None else min(deadline, soft_deadline)
+
+        pending = set(tasks.values())
+        while pending and not self._quorum_met(set(results) | set(finished_at), quorum):
+            wait_for = None if wait_until is None else max(wait_until - time.monotonic(), 0)
+            done, pending = await asyncio.wait(
+                pending,
+                timeout=wait_for,
+                return_when=asyncio.FIRST_COMPLETED if quorum is not None else asyncio.ALL_COMPLETED
+            )
+            if not done:
+                break
+
+        for platform, task in tasks.items():
+            if not task.done():
+                # Let the straggler finish into the cache instead of wasting it
+                results[platform] = None
+                statuses[platform] = "cut_off"
+                self._track_background(task)
+                continue
+            results[platform] = task.result()
+            statuses[platform] = self._scrape_status(task.result(), finished_at[platform], deadline)
 
         # Log results with count
         for platform, products in results.items():
             count = len(products) if products else 0
             status = "✓" if count > 0 else "✗"
-            logger.info(f"{status} {platform}: {count} products scraped")
+            logger.info(f"{status} {platform}: {count} products scraped ({statuses[platform]})")
 
-        return results
+        return results, statuses
+
+    async def data_version(
+        self,
+        query: str,
+        platforms: list[str] | None = None,
+        validate_prices: bool | None = None
+    ) -> dict | None:
+        """
+        Version of the cached data a request for `query` would be answered from
+        
+        Lets HTTP routes validate a client's copy without scraping or matching.
+        
+        Args:
+            query: User search query
+            platforms: Platforms the answer depends on (default: all)
+            validate_prices: For comparisons: also cover the catalog's
+                             recorded comparison, which compare_prices()
+                             answers from ahead of the platform caches
+        
+        Returns:
+            dict: {'stamps': tuple, 'fresh_for': seconds, 'age': seconds of the
+                   newest data}, or None unless every platform is fresh in memory
+        """
+        stamps = []
+        fresh_for = []
+        ages = []
+        for platform in platforms or self.scrapers:
+            validator = self.cache.validator(platform, query, self.max_products)
+            if validator is None:
+                return None
+            stamps.append(validator[0])
+            fresh_for.append(validator[1])
+            ages.append(validator[2])
+        if validate_prices is not None and self.catalog is not None:
+            # A product page refresh changes a catalog answer, not the platform stamps
+            key = canonicalize_query(query)[0]
+            stamps.append(await asyncio.to_thread(self.catalog.version, key, validate_prices))
+        return {"stamps": tuple(stamps), "fresh_for": min(fresh_for), "age": min(ages)}
+
+    async def search_platform(self, platform: str, query: str) -> list[dict] | None:
+        """
+        Products for a query from one platform, served from the cache when possible
+        
+        Args:
+            platform: Platform name
+            query: User search query
+        
+        Returns:
+            list: Products ([] if none found), or None if the platform failed
+        """
+        query = clean_query(query)
+        func = self.scrapers[platform]
+        cached, state, _ = await asyncio.to_thread(
+            self.cache.lookup, platform, query, self.max_products
+        )
+        if state == STALE:
+            self._refresh_in_background(platform, func, query)
+        if state != MISS:
+            return cached
+        return await self._scrape_platform(platform, func, query, SCRAPER_TIMEOUT_S, None)
+
+    async def search_catalog(
+        self,
+        query: str,
+        platform: str | None = None,
+        limit: int = 20,
+        offset: int = 0,
+        max_age: float | None = None
+    ) -> tuple[list[dict], int]:
+        """
+        Full-text search over the product catalog (see ProductCatalog.search)
+        
+        Returns:
+            tuple: (page of products, total fresh matches); ([], 0) without a catalog
+        """
+        if self.catalog is None:
+            return [], 0
+        return await asyncio.to_thread(self.catalog.search, query, platform, limit, offset, max_age)
+
+    async def price_history(
+        self,
+        platform: str,
+        product: str,
+        start: float,
+        resolution: str | None = None
+    ) -> dict | None:
+        """
+        Price series and 30-day summary of one product (see PriceHistory.history)
+        
+        Args:
+            platform: Platform of the product
+            product: Platform product ID, or a product link to take it from
+            start: Range start (epoch seconds); the range ends now
+            resolution: "raw", "hourly", "daily" or None for the finest retained
+        
+        Returns:
+            dict: {'product_id', 'resolution', 'series', 'summary'}, or None
+                  without history storage or a recognizable product
+        """
+        pid = product_id(platform, product) if "/" in product else product
+        if self.history is None or not pid:
+            return None
+        found = await asyncio.to_thread(self.history.history, platform, pid, start, None, resolution)
+        summary = await asyncio.to_thread(self.history.summary, platform, pid)
+        return {"product_id": pid, **found, "summary": summary}
 
     async def compare_prices(
         self,
         query: str,
-        validate_prices: bool = True
+        validate_prices: bool = True,
+        timeout: float = SCRAPER_TIMEOUT_S,
+        deadline: float | None = None,
+        quorum: int | None = None,
+        max_age: float | None = None,
+        fresh: bool = False,
+        priority: str = INTERACTIVE
     ) -> dict:
         """
         Full comparison pipeline: scrape → match → format
         Orchestrates complete price comparison workflow with resilience to platform failures.
         Returns final comparison results ready for API response.
-
+        
         Args:
             query: User search query
             validate_prices: Whether to check price variance validity
-
+            timeout: Max seconds to wait for each platform scraper
+            deadline: Absolute time.monotonic() deadline; platforms that have
+                      not finished by then are reported as cut off
+            quorum: Return once this many platforms (anchor included) have
+                    answered; stragglers complete into the cache
+            max_age: Only reuse cached platform results younger than this (seconds)
+            fresh: Ignore cached platform results and scrape everything
+            priority: Scheduling class of the scrapes; only INTERACTIVE
+                      comparisons count as demand (trending, suggestions,
+                      prefetch hits, warm-up log)
+        
         Returns:
             dict: {
                 'success': bool,
                 'query': str,
+                'canonical_query': str,
                 'results': list[dict],
                 'count': int,
-                'error': str or None
+                'error': str or None,
+                'platform_status': {platform: status},
+                'cut_off': list[str],
+                'complete': bool
+            }
+        
+        A comparison recorded in the product catalog whose products were
+        all seen recently is answered from the catalog (platform status
+        "catalog") without scraping or matching.
+        """
+        if priority == INTERACTIVE:
+            self.record_served(query)
+        statuses: dict = {}
+        scrape_options = {
+            "timeout": timeout,
+            "deadline": deadline,
+            "quorum": quorum,
+            "max_age": max_age,
+            "fresh": fresh,
+            "priority": priority,
+        }
+        key, display = canonicalize_query(query)
+        display = display or query
+
+        answered = None
+        if self.catalog is not None and not fresh:
+            answered = await asyncio.to_thread(self.catalog.answer, key, validate_prices, max_age)
+        if answered:
+            logger.info(f"Answering '{display}' from the product catalog")
+            statuses.update({platform: "catalog" for platform in self.scrapers})
+            result = {
+                "success": True,
+                "query": display,
+                "results": answered,
+                "count": len(answered),
+                "error": None
             }
+        else:
+            result = await self._compare(query, display, validate_prices, scrape_options, statuses)
+            recordable = statuses and all(status in CATALOG_RECORDABLE for status in statuses.values())
+            if self.catalog is not None and result["success"] and recordable:
+                await asyncio.to_thread(
+                    self.catalog.record_comparison, key, validate_prices, result["results"]
+                )
+
+        return self._finish_result(result, query, display, statuses)
+
+    async def compare_batch(
+        self,
+        queries: list[str],
+        validate_prices: bool = True,
+        max_age: float | None = None,
+        fresh: bool = False
+    ):
+        """
+        Compare many queries as one job, yielding each answer as it completes
+        
+        Queries are validated, canonicalized and deduplicated first:
+        spellings of the same query are compared once and answered
+        together; queries out of COMPARE_BATCH_QUERY_CHARS or empty once
+        normalized are answered "invalid" right away. Distinct
+        queries run through compare_prices() at BATCH priority, at most
+        COMPARE_BATCH_CONCURRENCY at a time across every batch job, so
+        interactive requests keep their share of the scraper slots.
+        Cached and catalog answers come back first, scraped ones as their
+        platforms finish.
+        
+        Args:
+            queries: Search queries, duplicates allowed
+            validate_prices: Whether to check price variance validity
+            max_age: Only reuse cached platform results younger than this (seconds)
+            fresh: Ignore cached platform results and scrape everything
+        
+        Yields:
+            dict: compare_prices() answer (same fields for every status) plus
+                  'inputs': positions in `queries` this answer is for,
+                  'status': "ok" (products matched), "no_results" (every
+                  platform answered, nothing matched), "failed" (nothing
+                  matched and some platform failed or was cut off) or
+                  "invalid"
+        
+        Raises:
+            RuntimeError: If start() has not run
+        
+        Example:
+            >>> async for item in orchestrator.compare_batch(["iPhone 15", "iphone  15", "pixel 8"]):
+            ...     print(item["inputs"], item["status"], item["count"])
+            [2] ok 6
+            [0, 1] ok 9
+        """
+        if self._batch_slots is None:
+            raise RuntimeError("Batch comparisons need ScrapingOrchestrator.start() to have run")
+        slots = self._batch_slots
+
+        def item(result: dict, query: str, display: str, statuses: dict, inputs: list[int], status: str) -> dict:
+            return {**self._finish_result(result, query, display, statuses), "inputs": inputs, "status": status}
+
+        shortest, longest = COMPARE_BATCH_QUERY_CHARS
+        groups: dict[str, dict] = {}
+        for position, query in enumerate(queries):
+            query = clean_query(query)
+            key, display = canonicalize_query(query)
+            if not shortest <= len(query) <= longest or not key:
+                error = (
+                    f"Query must be {shortest}-{longest} characters" if key
+                    else "Query is empty once normalized"
+                )
+                yield item(
+                    {"success": False, "results": [], "count": 0, "error": error},
+                    query, display, {}, [position], "invalid"
+                )
+                continue
+            group = groups.setdefault(key, {"query": query, "display": display, "inputs": []})
+            group["inputs"].append(position)
+        logger.info(f"Batch comparison: {len(queries)} queries, {len(groups)} distinct")
+
+        async def run(group: dict) -> dict:
+            async with slots:
+                group["started"] = True
+                try:
+                    result = await self.compare_prices(
+                        group["query"],
+                        validate_prices=validate_prices,
+                        max_age=max_age,
+                        fresh=fresh,
+                        priority=BATCH
+                    )
+                except Exception as e:
+                    logger.error(f"Batch comparison of '{group['query']}' failed: {e}")
+                    return item(
+                        {"success": False, "results": [], "count": 0, "error": str(e)},
+                        group["query"], group["display"], {}, group["inputs"], "failed"
+                    )
+            if result["success"]:
+                status = "ok"
+            else:
+                # Nothing matched: only a real answer if every platform gave one
+                status = "no_results" if result["complete"] else "failed"
+            return {**result, "inputs": group["inputs"], "status": status}
+
+        tasks = {asyncio.create_task(run(group)): group for group in groups.values()}
+        try:
+            for finished in asyncio.as_completed(tasks):
+                yield await finished
+        finally:
+            # Client gone: drop queued queries, let started ones finish into the cache
+            for task, group in tasks.items():
+                if task.done():
+                    continue
+                if group.get("started"):
+                    self._track_background(task)
+                else:
+                    task.cancel()
+
+    def record_served(self, query: str):
+        """Count a served comparison query for pre-warming, suggestions, prefetch and warm-up"""
+        self.prewarmer.record(query)
+        self.suggestions.record_query(query)
+        self.prefetcher.record_served(query)
+        if QUERY_LOG_ENABLED:
+            self.query_log.record(query)
+
+    @staticmethod
+    def _finish_result(result: dict, query: str, display: str, statuses: dict) -> dict:
+        """Add the query forms and per-platform outcomes to a comparison answer"""
+        result["query"] = query
+        result["canonical_query"] = display
+        result["platform_status"] = statuses
+        result["cut_off"] = [p for p, status in statuses.items() if status == "cut_off"]
+        result["complete"] = bool(statuses) and all(status in ANSWERED_STATUSES for status in statuses.values())
+        return result
+
+    async def compare_stream(
+        self,
+        query: str,
+        validate_prices: bool = True,
+        timeout: float = SCRAPER_TIMEOUT_S,
+        deadline: float | None = None,
+        max_age: float | None = None,
+        fresh: bool = False
+    ):
+        """
+        Progressive comparison: yields (event, data) pairs as platforms finish
+        
+        - ("platform", {platform, status, count, products}) once per platform;
+          cached platforms first, the rest in the order their scrapes finish
+        - ("matches", {results, count, platforms}) whenever a platform with
+          products arrives once the anchor platform's products are in: the
+          comparisons over every platform arrived so far
+        - ("done", {...}) last: the compare_prices() answer without results
+        
+        Same cache, catalog and memo behaviour as compare_prices(). Platforms
+        still scraping at the deadline are cut off, and a stream the client
+        stops reading leaves its scrapes running; either way they finish
+        into the cache in the background.
+        
+        Args:
+            query: User search query
+            validate_prices: Whether to check price variance validity
+            timeout: Max seconds to wait for each platform scraper
+            deadline: Absolute time.monotonic() deadline for the whole stream
+            max_age: Only reuse cached platform results younger than this (seconds)
+            fresh: Ignore cached platform results and scrape everything
+        
+        Example:
+            >>> async for event, data in orchestrator.compare_stream("iphone 15"):
+            ...     print(event, data.get("platform", data.get("count")))
+            platform croma
+            platform flipkart
+            matches 6
+            platform amazon
+            matches 8
+            ...
+            done 8
+        """
+        self.record_served(query)
+        key, display = canonicalize_query(query)
+        display = display or query
+        statuses: dict = {}
+
+        answered = None
+        if self.catalog is not None and not fresh:
+            answered = await asyncio.to_thread(self.catalog.answer, key, validate_prices, max_age)
+        if answered:
+            logger.info(f"Streaming '{display}' from the product catalog")
+            statuses.update({platform: "catalog" for platform in self.scrapers})
+            yield "matches", {"results": answered, "count": len(answered), "platforms": list(self.scrapers)}
+            result = {"success": True, "count": len(answered), "error": None}
+            yield "done", self._finish_result(result, query, display, statuses)
+            return
+
+        logger.info(f"=== STREAMED PRICE COMPARISON: {display} ===")
+        scraped, scrape_statuses, tasks = await self._start_platforms(
+            clean_query(query), timeout, deadline, max_age, fresh
+        )
+        statuses.update(scrape_statuses)
+        pending = {task: platform for platform, task in tasks.items()}
+        memo_key = (display, validate_prices)
+        arrived = list(scraped)
+        comparisons: list[dict] = []
+        reused = None
+
+        # Matched incrementally: each platform is matched once, when it
+        # arrives, and only the rows it changed are formatted again
+        session: MatchSession | None = None
+        formatted: list[dict | None] = []
+        try:
+            while True:
+                for platform in arrived:
+                    products = scraped[platform] or []
+                    yield "platform", {
+                        "platform": platform,
+                        "status": statuses[platform],
+                        "count": len(products),
+                        "products": products,
+                    }
+
+                # Nothing to match against until the anchor platform's products are in
+                anchor_ready = bool(scraped.get(QUORUM_ANCHOR_PLATFORM))
+                if anchor_ready and any(scraped[platform] for platform in arrived):
+                    if not pending:
+                        fingerprints = tuple(fingerprint_products(scraped.get(p)) for p in sorted(self.scrapers))
+                        reused = await asyncio.to_thread(self.comparisons.get, memo_key, fingerprints)
+                    if reused is not None:
+                        comparisons = reused["results"]
+                    else:
+                        if session is None:
+                            session = MatchSession(scraped[QUORUM_ANCHOR_PLATFORM], display)
+                            formatted = [None] * len(session)
+                            changed = set(range(len(session)))
+                            arrived = [p for p in scraped if p != QUORUM_ANCHOR_PLATFORM]
+                        else:
+                            changed = set()
+                        for platform in arrived:
+                            if scraped[platform]:
+                                changed.update(session.add_platform(platform, scraped[platform]))
+                        for idx in changed:
+                            formatted[idx] = self._format_match(session.row(idx), validate_prices)
+                        comparisons = self._unique_comparisons(formatted)
+                    yield "matches", {
+                        "results": comparisons,
+                        "count": len(comparisons),
+                        "platforms": [p for p in self.scrapers if scraped.get(p)],
+                    }
+
+                if not pending:
+                    break
+                wait_for = None if deadline is None else max(deadline - time.monotonic(), 0)
+                done, _ = await asyncio.wait(pending, timeout=wait_for, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    break
+                now = time.monotonic()
+                arrived = []
+                for task in done:
+                    platform = pending.pop(task)
+                    scraped[platform] = task.result()
+                    statuses[platform] = self._scrape_status(task.result(), now, deadline)
+                    arrived.append(platform)
+        finally:
+            for task in pending:
+                # Cut off, or the client went away: finish into the cache anyway
+                self._track_background(task)
+
+        for platform in pending.values():
+            scraped[platform] = None
+            statuses[platform] = "cut_off"
+            yield "platform", {"platform": platform, "status": "cut_off", "count": 0, "products": []}
+
+        if comparisons:
+            result = {"success": True, "results": comparisons, "count": len(comparisons), "error": None}
+        else:
+            result = {
+                "success": False,
+                "results": [],
+                "count": 0,
+                "error": "No products found across available platforms"
+            }
+        if not pending and reused is None:
+            fingerprints = tuple(fingerprint_products(scraped.get(p)) for p in sorted(self.scrapers))
+            await asyncio.to_thread(self.comparisons.put, memo_key, fingerprints, {**result, "query": display})
+        recordable = all(status in CATALOG_RECORDABLE for status in statuses.values())
+        if self.catalog is not None and result["success"] and recordable:
+            await asyncio.to_thread(self.catalog.record_comparison, key, validate_prices, comparisons)
+
+        logger.info(f"Streamed {len(comparisons)} comparisons for '{display}'")
+        del result["results"]
+        yield "done", self._finish_result(result, query, display, statuses)
+
+    def _build_comparisons(self, query: str, scraped: dict, validate_prices: bool) -> list[dict]:
+        """
+        Match the scraped products across platforms and format the comparisons
+        
+        Args:
+            query: Canonical display form of the search query
+            scraped: {platform: products_list or None}; missing platforms count as empty
+            validate_prices: Drop matches whose prices vary too much
+        
+        Returns:
+            list: Comparisons, one per distinct anchor product title
+        """
+        # STAGE 2: Match products across available platforms
+        logger.info("Matching products across platforms...")
+
+        # Build match_kwargs dynamically based on available platforms
+        match_kwargs = {
+            "user_query": query,
+            "flipkart_products": scraped.get("flipkart") or [],
+            "amazon_products": scraped.get("amazon") or [],
+            "croma_products": scraped.get("croma") or [],
+            "reliance_products": scraped.get("reliancedigital") or [],
+        }
+
+        matches = match_products_across_platforms(**match_kwargs)
+        logger.info(f"Found {len(matches)} potential matches")
+
+        # STAGE 3: Format and validate results
+        logger.info("Formatting results...")
+        return self._unique_comparisons(
+            [self._format_match(match, validate_prices) for match in matches]
+        )
+
+    @staticmethod
+    def _format_match(match: dict, validate_prices: bool) -> dict | None:
+        """Comparison for one match row, or None if its prices vary too much"""
+        fk = match.get("flipkart")
+        amz = match.get("amazon")
+        croma = match.get("croma")
+        reliance = match.get("reliance")
+
+        # Collect prices from available products only
+        price_list: list[int] = []
+        if fk:
+            price_list.append(extract_price(fk.get("currentPrice", "0")))
+        if amz:
+            price_list.append(extract_price(amz.get("currentPrice", "0")))
+        if croma:
+            price_list.append(extract_price(croma.get("currentPrice", "0")))
+        if reliance:
+            price_list.append(extract_price(reliance.get("currentPrice", "0")))
+
+        # Validate price variance only if at least 2 prices exist
+        if validate_prices and len(price_list) >= 2:
+            if not is_price_valid_for_match(price_list):
+                logger.debug(
+                    f"Skipping match due to price variance: "
+                    f"{fk.get('title') if fk else amz.get('title', 'N/A')}"
+                )
+                return None
+
+        # Build comparison with available platforms only
+        return {
+            "flipkart": fk,
+            "flipkart_score": 100 if fk else None,
+            "amazon": amz,
+            "amazon_score": match.get("amazon_score", 0) if amz else None,
+            "croma": croma,
+            "croma_score": match.get("croma_score", 0) if croma else None,
+            "reliancedigital": reliance,
+            "reliancedigital_score": match.get("reliance_score", 0) if reliance else None,
+        }
+
+    @staticmethod
+    def _unique_comparisons(comparisons: list[dict | None]) -> list[dict]:
+        """Formatted comparisons without rejected rows and duplicates by primary platform title"""
+        seen = set()
+        unique_results = []
+
+        for result in comparisons:
+            if result is None:
+                continue
+            # Use first available product as key
+            primary_product = (
+                result.get("flipkart") or
+                result.get("amazon") or
+                result.get("croma") or
+                result.get("reliancedigital")
+            )
+
+            if primary_product:
+                title = primary_product.get("title")
+                if title not in seen:
+                    seen.add(title)
+                    unique_results.append(result)
+
+        return unique_results
+
+    async def _compare(
+        self,
+        scrape_query: str,
+        query: str,
+        validate_prices: bool,
+        scrape_options: dict,
+        statuses: dict
+    ) -> dict:
+        """
+        Comparison pipeline body; fills `statuses` with per-platform outcomes
+        
+        The scrapers search for `scrape_query` (the user's wording); matching
+        and the comparison memo use `query` (canonical display form).
         """
         try:
             # STAGE 1: Scrape all platforms in parallel
             logger.info(f"=== PRICE COMPARISON: {query} ===" )
-            scraped = await self.scrape_all_platforms(query)
+            scraped, scrape_statuses = await self.scrape_platforms(scrape_query, **scrape_options)
+            statuses.update(scrape_statuses)
+
+            # Same products as last time: reuse that comparison, skip stages 2-3
+            memo_key = (query, validate_prices)
+            fingerprints = tuple(fingerprint_products(scraped.get(p)) for p in sorted(self.scrapers))
+            reused = await asyncio.to_thread(self.comparisons.get, memo_key, fingerprints)
+            if reused is not None:
+                logger.info(f"Platform results unchanged for '{query}', reusing comparison")
+                return reused
 
             # Check if ANY platform returned results
             available_platforms = {
                 k: v for k, v in scraped.items() if v
             }
-            
+
             if not available_platforms:
                 logger.warning(f"No products found across any platform for: {query}")
                 return {
@@ -104,95 +965,18 @@ class ScrapingOrchestrator:
             # Log platform availability
             logger.info(f"Available platforms: {list(available_platforms.keys())}")
 
-            # STAGE 2: Match products across available platforms
-            logger.info("Matching products across platforms...")
-            
             # Select primary platform (prefer Amazon, fallback to first available)
             primary_platform = "amazon" if available_platforms.get("amazon") else list(available_platforms.keys())[0]
             logger.info(f"Using {primary_platform} as primary platform for matching")
 
-            # Build match_kwargs dynamically based on available platforms
-            match_kwargs = {
-                "user_query": query,
-                "flipkart_products": scraped.get("flipkart", []),
-                "amazon_products": scraped.get("amazon", []),
-                "croma_products": scraped.get("croma", []),
-                "reliance_products": scraped.get("reliancedigital", []),
-            }
-
-            matches = match_products_across_platforms(**match_kwargs)
-            logger.info(f"Found {len(matches)} potential matches")
-
-            # STAGE 3: Format and validate results
-            logger.info("Formatting results...")
-            results = []
-
-            from app.core.price_utils import extract_price, is_price_valid_for_match
-
-            for match in matches:
-                fk = match.get("flipkart")
-                amz = match.get("amazon")
-                croma = match.get("croma")
-                reliance = match.get("reliance")
-
-                # Collect prices from available products only
-                price_list: list[int] = []
-                if fk:
-                    price_list.append(extract_price(fk.get("currentPrice", "0")))
-                if amz:
-                    price_list.append(extract_price(amz.get("currentPrice", "0")))
-                if croma:
-                    price_list.append(extract_price(croma.get("currentPrice", "0")))
-                if reliance:
-                    price_list.append(extract_price(reliance.get("currentPrice", "0")))
-
-                # Validate price variance only if at least 2 prices exist
-                if validate_prices and len(price_list) >= 2:
-                    if not is_price_valid_for_match(price_list):
-                        logger.debug(
-                            f"Skipping match due to price variance: "
-                            f"{fk.get('title') if fk else amz.get('title', 'N/A')}"
-                        )
-                        continue
-
-                # Build comparison with available platforms only
-                comparison = {
-                    "flipkart": fk,
-                    "flipkart_score": 100 if fk else None,
-                    "amazon": amz,
-                    "amazon_score": match.get("amazon_score", 0) if amz else None,
-                    "croma": croma,
-                    "croma_score": match.get("croma_score", 0) if croma else None,
-                    "reliancedigital": reliance,
-                    "reliancedigital_score": match.get("reliance_score", 0) if reliance else None,
-                }
-
-                results.append(comparison)
-
-            # Remove duplicates by primary platform title
-            seen = set()
-            unique_results = []
-            
-            for result in results:
-                # Use first available product as key
-                primary_product = (
-                    result.get("flipkart") or
-                    result.get("amazon") or
-                    result.get("croma") or
-                    result.get("reliancedigital")
-                )
-                
-                if primary_product:
-                    title = primary_product.get("title")
-                    if title not in seen:
-                        seen.add(title)
-                        unique_results.append(result)
+            # STAGES 2-3: Match products across available platforms, format and validate
+            unique_results = self._build_comparisons(query, scraped, validate_prices)
 
             logger.info(f"Returning {len(unique_results)} unique comparisons from {len(available_platforms)} platform(s)")
 
             # Success if we have any results
             if unique_results:
-                return {
+                result = {
                     "success": True,
                     "query": query,
                     "results": unique_results,
@@ -200,13 +984,15 @@ class ScrapingOrchestrator:
                     "error": None
                 }
             else:
-                return {
+                result = {
                     "success": False,
                     "query": query,
                     "results": [],
                     "count": 0,
                     "error": "No products found across available platforms"
                 }
+            await asyncio.to_thread(self.comparisons.put, memo_key, fingerprints, result)
+            return result
 
         except Exception as e:
             logger.error(f"Comparison failed: {e}", exc_info=True)
@@ -218,18 +1004,320 @@ class ScrapingOrchestrator:
                 "error": str(e)
             }
 
-    async def get_product_details(self, query: str) -> dict:
+    @staticmethod
+    def is_product_link(platform: str, url: str | None) -> bool:
+        """Whether `url` is a web page on `platform`'s own hosts"""
+        if not url or url == "N/A":
+            return False
+        try:
+            parts = urlsplit(url)
+        except ValueError:
+            return False
+        return parts.scheme in ("http", "https") and parts.hostname in PRODUCT_HOSTS.get(platform, ())
+
+    async def refresh_product(
+        self,
+        platform: str,
+        url: str,
+        deadline: float | None = None
+    ) -> dict | None:
         """
-        Get detailed information for a specific product
+        Re-read one product's price data from its detail page
+        
+        One page load instead of a full search scrape. Concurrent refreshes
+        of the same link share a single page load when it runs at least as
+        long as the caller's deadline allows; a caller with a later deadline
+        starts its own. A page without a readable price (bot wall, captcha,
+        changed layout) counts as unreadable.
         
         Args:
-            query: Product identifier/search term
-            
+            platform: Platform the product belongs to
+            url: Product link as returned by the platform's search scraper
+            deadline: Absolute time.monotonic() deadline
+        
         Returns:
-            dict: Detailed product information across platforms
+            dict: {link, title, currentPrice, maxRetailPrice, inStock, rating},
+                  or None if the page could not be read
+        
+        Raises:
+            ValueError: If `url` is not a product link on `platform`
+        """
+        if platform not in self.refreshers or not self.is_product_link(platform, url):
+            raise ValueError(f"Not a product link on {platform}: {url}")
+
+        key = (platform, url)
+        task, task_deadline = self._product_refreshes.get(key, (None, None))
+        if task is not None and (task_deadline is None or (deadline is not None and deadline <= task_deadline)):
+            self._refresh_counters["coalesced"] += 1
+        else:
+            task = asyncio.ensure_future(self._load_product_page(platform, url, deadline))
+            self._product_refreshes[key] = (task, deadline)
+            task.add_done_callback(lambda done: self._refresh_finished(key, done))
+
+        # Shielded so one caller giving up does not cancel the others' page load
+        return await asyncio.shield(task)
+
+    async def _load_product_page(self, platform: str, url: str, deadline: float | None) -> dict | None:
+        """Run a platform's page refresher and keep the catalog's copy of the product current"""
+        details = self._priced(await self.executor.run_scraper(
+            self.refreshers[platform],
+            url,
+            timeout=PRODUCT_REFRESH_TIMEOUT_S,
+            deadline=deadline
+        ))
+        if details is not None:
+            await asyncio.to_thread(self._record_product_page, platform, details)
+            if self.live is not None:
+                self.live.publish(platform, [details])
+        return details
+
+    @staticmethod
+    def _priced(details: dict | None) -> dict | None:
+        """A product page reading, or None if it shows no price (bot wall, captcha, changed layout)"""
+        if details is None or not extract_price(details.get("currentPrice")):
+            return None
+        return details
+
+    @staticmethod
+    def _read_fields(details: dict) -> dict:
+        """Fields of a product page reading that were actually read"""
+        fields = {
+            field: details[field] for field in REFRESHED_FIELDS
+            if details.get(field) not in (None, "N/A")
+        }
+        if details.get("inStock") is not None:
+            fields["inStock"] = details["inStock"]
+        return fields
+
+    def _record_product_page(self, platform: str, details: dict):
+        """Merge a detail page reading into the catalog and the price history"""
+        if self.catalog is not None:
+            self.catalog.update_product(platform, details["link"], self._read_fields(details))
+        if self.history is not None:
+            self.history.record(platform, [details])
+
+    async def add_watch(
+        self,
+        platform: str,
+        url: str,
+        target_price: int | None = None,
+        interval_s: float = WATCH_DEFAULT_INTERVAL_S
+    ) -> dict | None:
         """
-        logger.info(f"Getting product details for: {query}")
-        return await self.compare_prices(query, validate_prices=False)
+        Start watching a product's price (first check on the next scheduler cycle)
+        
+        Args:
+            platform: Platform the product belongs to
+            url: Product link as returned by /api/compare or /api/search
+            target_price: Also notify once the price reaches this
+            interval_s: Re-check cadence
+        
+        Returns:
+            dict: The stored watch, or None when watches are disabled
+        
+        Raises:
+            ValueError: If `url` is not a product link on `platform`
+        """
+        pid = product_id(platform, url) if self.is_product_link(platform, url) else None
+        if platform not in self.batch_refreshers or not pid:
+            raise ValueError(f"Not a product link on {platform}: {url}")
+        if self.watches is None:
+            return None
+        return await asyncio.to_thread(self.watches.add, platform, url, pid, interval_s, target_price)
+
+    async def load_product_pages(self, platform: str, urls: list[str]) -> list[dict | None]:
+        """
+        Read several product pages of one platform in one browser, at BACKGROUND priority
+        
+        Args:
+            platform: Platform of the products
+            urls: Product links (at most WATCH_BATCH_SIZE is a sensible batch)
+        
+        Returns:
+            list: Per URL, the page reading (see refresh_product) or None
+        """
+        pages = await self.executor.run_scraper(
+            self.batch_refreshers[platform],
+            urls,
+            timeout=PRODUCT_REFRESH_TIMEOUT_S * max(len(urls), 1),
+            priority=BACKGROUND
+        )
+        if pages is None:
+            return [None] * len(urls)
+        pages = [self._priced(details) for details in pages]
+        for details in pages:
+            if details is not None:
+                await asyncio.to_thread(self._record_product_page, platform, details)
+        if self.live is not None:
+            self.live.publish(platform, [details for details in pages if details is not None])
+        return pages
+
+    def _refresh_finished(self, key: tuple, task: asyncio.Future):
+        """Forget a finished product page refresh and count its outcome"""
+        if self._product_refreshes.get(key, (None,))[0] is task:
+            self._product_refreshes.pop(key)
+        # exception() first: result() would re-raise inside the callback
+        ok = not task.cancelled() and task.exception() is None and task.result() is not None
+        self._refresh_counters["refreshed" if ok else "failed"] += 1
+
+    async def get_product_details(
+        self,
+        query: str,
+        index: int = 0,
+        validate_prices: bool = True,
+        deadline: float | None = None
+    ) -> dict:
+        """
+        One comparison with every platform's product re-read from its detail page
+        
+        The comparison is looked up the way /api/compare answers it (from
+        cached platform results and comparisons when warm); only the
+        products in it are then refreshed, one detail page each, in parallel.
+        
+        Args:
+            query: Search query the comparison was returned for
+            index: Position of the comparison in that query's results
+            validate_prices: Same flag the comparison was requested with
+            deadline: Absolute time.monotonic() deadline
+        
+        Returns:
+            dict: {
+                'success': bool,
+                'query': str,
+                'canonical_query': str,
+                'product': dict or None (comparison with refreshed products),
+                'refresh_status': {platform: "ok" | "failed" | "no_link"}
+                                  ("failed" if the page showed no price),
+                'error': str or None
+            }
+        """
+        logger.info(f"Getting product details for: {query} (#{index})")
+        comparison = await self.compare_prices(query, validate_prices=validate_prices, deadline=deadline)
+        result = {
+            "success": False,
+            "query": query,
+            "canonical_query": comparison.get("canonical_query", query),
+            "product": None,
+            "refresh_status": {},
+            "error": comparison.get("error"),
+        }
+        if not comparison["success"]:
+            return result
+        if index >= len(comparison["results"]):
+            result["error"] = f"No comparison #{index} for '{query}' ({comparison['count']} found)"
+            return result
+
+        entry = dict(comparison["results"][index])
+        jobs = {}
+        for platform in self.scrapers:
+            product = entry.get(platform)
+            if not product:
+                continue
+            if not self.is_product_link(platform, product.get("link")):
+                result["refresh_status"][platform] = "no_link"
+                continue
+            jobs[platform] = self.refresh_product(platform, product["link"], deadline=deadline)
+
+        outcomes = await asyncio.gather(*jobs.values(), return_exceptions=True)
+        refreshed_at = time.time()
+        for platform, details in zip(jobs, outcomes):
+            if not isinstance(details, dict):
+                result["refresh_status"][platform] = "failed"
+                continue
+            product = {**entry[platform], **self._read_fields(details)}
+            product["refreshedAt"] = refreshed_at
+            entry[platform] = product
+            result["refresh_status"][platform] = "ok"
+
+        result["success"] = True
+        result["product"] = entry
+        result["error"] = None
+        return result
+
+    def _suggestion_snapshot(self) -> tuple[list[tuple[str, int]], list[str]]:
+        """Served queries and product titles to load the suggestion index from"""
+        queries = []
+        if QUERY_LOG_ENABLED:
+            # Hits still buffered in the log were recorded before the load began
+            self.query_log.flush()
+            queries = self.query_log.query_counts(SUGGEST_QUERY_WINDOW_S)
+        titles = self.catalog.titles(SUGGEST_MAX_PRODUCTS) if self.catalog is not None else []
+        return queries, titles
+
+    def _load_suggestions(self):
+        """Fill the suggestion index from the query log and the product catalog"""
+        self.suggestions.build(self._suggestion_snapshot)
+
+    def start(self):
+        """Start background components (call from the running event loop)"""
+        self.autoscaler.start()
+        self._batch_slots = asyncio.Semaphore(COMPARE_BATCH_CONCURRENCY)
+        self._track_background(asyncio.create_task(asyncio.to_thread(self._load_suggestions)))
+        if PREWARM_ENABLED:
+            self.prewarmer.start()
+        if QUERY_LOG_ENABLED:
+            self.query_log.start()
+        if self.history is not None:
+            self.history.start()
+        if self.watcher is not None:
+            self.watcher.start()
+        if self.live is not None:
+            self.live.start()
+        self.warmup.start()
+
+    async def stop(self):
+        """Stop background components"""
+        await self.autoscaler.stop()
+        await self.prewarmer.stop()
+        if self.watcher is not None:
+            await self.watcher.stop()
+        if self.live is not None:
+            await self.live.stop()
+        await self.warmup.stop()
+        if QUERY_LOG_ENABLED:
+            await self.query_log.stop()
+        if self.cache.l2 is not None:
+            self.cache.l2.close()
+        if self.catalog is not None:
+            self.catalog.close()
+        if self.history is not None:
+            await self.history.stop()
+        if self.watches is not None:
+            self.watches.close()
+
+    def _storage_stats(self) -> dict:
+        """Stats read from SQLite and disk (blocking; each component has its own lock)"""
+        return {
+            "cache": self.cache.stats(),
+            "catalog": self.catalog.stats() if self.catalog is not None else None,
+            "price_history": self.history.stats() if self.history is not None else None,
+            "watch_list": self.watches.stats() if self.watches is not None else None,
+            "query_log": self.query_log.stats(),
+        }
+
+    async def stats(self) -> dict:
+        """Monitoring snapshot of orchestrator components"""
+        storage = await asyncio.to_thread(self._storage_stats)
+        # The rest is owned by the event loop and read on it
+        return {
+            "autoscaler": self.autoscaler.stats(),
+            "cache": storage["cache"],
+            "comparison_memo": self.comparisons.stats(),
+            "catalog": storage["catalog"],
+            "suggest": self.suggestions.stats(),
+            "price_history": storage["price_history"],
+            "watch": (
+                {**self.watcher.stats(), "watch_list": storage["watch_list"]}
+                if self.watcher is not None else None
+            ),
+            "live": self.live.stats() if self.live is not None else None,
+            "matcher": match_cache_stats(),
+            "prewarm": self.prewarmer.stats(),
+            "prefetch": self.prefetcher.stats() if PREFETCH_ENABLED else None,
+            "warmup": self.warmup.stats(),
+            "query_log": storage["query_log"],
+            "product_refresh": {**self._refresh_counters, "in_flight": len(self._product_refreshes)},
+        }
 
     def shutdown(self):
         """Cleanup resources"""
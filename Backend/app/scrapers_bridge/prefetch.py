@@ -0,0 +1,198 @@
+# app/scrapers_bridge/prefetch.py
+"""
+Speculative prefetch while the user is typing
+Warms the cache for the top suggestion so the comparison that follows hits warm data
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from app.config import (
+    logger,
+    PREFETCH_MIN_PREFIX_LEN,
+    PREFETCH_MIN_CONFIDENCE,
+    PREFETCH_MIN_WEIGHT,
+    PREFETCH_CLIENT_RATE_PER_MIN,
+    PREFETCH_CLIENT_BURST,
+    PREFETCH_MAX_IN_FLIGHT,
+    PREFETCH_HIT_WINDOW_S,
+    PREFETCH_MAX_CLIENTS,
+)
+from app.core.text_utils import canonicalize_query
+from app.scrapers_bridge.scheduler import BACKGROUND
+
+
+class SpeculativePrefetcher:
+    """
+    Cache-only scrapes of the query a user is most likely about to compare
+    
+    - Fed by /api/suggest: the top query suggestion is prefetched when it
+      was served at least PREFETCH_MIN_WEIGHT times and holds at least
+      PREFETCH_MIN_CONFIDENCE of the query suggestions' total weight
+    - Scrapes go through the pre-warmer (BACKGROUND priority, only pairs
+      whose cache entry is missing or near expiry) and only start while
+      background work would not queue
+    - Each client has a token bucket (PREFETCH_CLIENT_BURST, refilled at
+      PREFETCH_CLIENT_RATE_PER_MIN); a query is prefetched once per
+      PREFETCH_HIT_WINDOW_S whoever types it
+    - A prefetch is a hit if the query is compared within
+      PREFETCH_HIT_WINDOW_S of it starting, wasted otherwise
+    """
+    
+    def __init__(self, orchestrator):
+        """Initialize prefetcher for a ScrapingOrchestrator"""
+        self.orchestrator = orchestrator
+        
+        self._lock = threading.Lock()
+        self._buckets: OrderedDict = OrderedDict()  # client -> [tokens, last refill]
+        self._pending: OrderedDict = OrderedDict()  # canonical key -> prefetch start time
+        self._in_flight = 0
+        self._counters = {
+            "considered": 0,
+            "low_confidence": 0,
+            "duplicate": 0,
+            "busy": 0,
+            "rate_limited": 0,
+            "started": 0,
+            "already_warm": 0,
+            "failed": 0,
+            "scrapes": 0,
+            "hits": 0,
+            "wasted": 0,
+            "compares": 0,
+        }
+    
+    @staticmethod
+    def _candidate(prefix: str, suggestions: list[dict]) -> str | None:
+        """Top query suggestion if it is confident enough to prefetch"""
+        # Product titles are context, not what users go on to compare
+        queries = [suggestion for suggestion in suggestions if suggestion["kind"] == "query"]
+        if len(prefix.strip()) < PREFETCH_MIN_PREFIX_LEN or not queries:
+            return None
+        top = queries[0]
+        total = sum(suggestion["weight"] for suggestion in queries)
+        if top["weight"] < PREFETCH_MIN_WEIGHT or top["weight"] / total < PREFETCH_MIN_CONFIDENCE:
+            return None
+        return top["text"]
+    
+    def _take_token_locked(self, client: str, now: float) -> bool:
+        """Spend one of the client's prefetch tokens if it has one"""
+        tokens, refilled = self._buckets.pop(client, (PREFETCH_CLIENT_BURST, now))
+        tokens = min(PREFETCH_CLIENT_BURST, tokens + (now - refilled) * PREFETCH_CLIENT_RATE_PER_MIN / 60)
+        allowed = tokens >= 1
+        self._buckets[client] = [tokens - 1 if allowed else tokens, now]
+        while len(self._buckets) > PREFETCH_MAX_CLIENTS:
+            self._buckets.popitem(last=False)
+        return allowed
+    
+    def _expire_locked(self, now: float):
+        """Count prefetches nobody compared within the hit window as wasted"""
+        while self._pending:
+            key, started = next(iter(self._pending.items()))
+            if now - started < PREFETCH_HIT_WINDOW_S:
+                break
+            del self._pending[key]
+            self._counters["wasted"] += 1
+    
+    def consider(self, client: str, prefix: str, suggestions: list[dict]) -> str | None:
+        """
+        Start a prefetch for the top suggestion if it qualifies
+        
+        Args:
+            client: Client identity for rate limiting (e.g. remote address)
+            prefix: What the user has typed so far
+            suggestions: SuggestIndex.suggest() results for `prefix`, best first
+        
+        Returns:
+            str: Query being prefetched, or None
+        
+        Example:
+            >>> prefetcher.consider("10.0.0.7", "iphone 1", suggestions)
+            'iphone 15'
+        """
+        query = self._candidate(prefix, suggestions)
+        key = canonicalize_query(query)[0] if query else ""
+        now = time.monotonic()
+        with self._lock:
+            self._counters["considered"] += 1
+            self._expire_locked(now)
+            if not key:
+                self._counters["low_confidence"] += 1
+                return None
+            if key in self._pending:
+                self._counters["duplicate"] += 1
+                return None
+            
+            executor = self.orchestrator.executor
+            jobs = len(self.orchestrator.scrapers)
+            if self._in_flight >= PREFETCH_MAX_IN_FLIGHT or executor.estimate_queue_wait(jobs, BACKGROUND) > 0:
+                self._counters["busy"] += 1
+                return None
+            if not self._take_token_locked(client, now):
+                self._counters["rate_limited"] += 1
+                return None
+            
+            self._pending[key] = now
+            self._in_flight += 1
+            self._counters["started"] += 1
+        
+        self.orchestrator._track_background(asyncio.create_task(self._prefetch(key, query)))
+        return query
+    
+    async def _prefetch(self, key: str, query: str):
+        """Warm every platform's cache entry for `query`"""
+        outcome = {}
+        try:
+            outcome = await self.orchestrator.prewarmer.warm([query], concurrency=len(self.orchestrator.scrapers))
+        except Exception as e:
+            logger.error(f"Prefetch of '{query}' failed: {e}")
+        finally:
+            refreshed = outcome.get("refreshed", 0)
+            with self._lock:
+                self._in_flight -= 1
+                self._counters["scrapes"] += refreshed + outcome.get("failed", 0)
+                if refreshed == 0:
+                    # Nothing new in the cache: neither a hit nor waste to account for
+                    skipped = outcome.get("skipped_warm", 0) == outcome.get("pairs", -1)
+                    self._counters["already_warm" if skipped else "failed"] += 1
+                    self._pending.pop(key, None)
+        if refreshed:
+            logger.info(f"Prefetched '{query}' ({refreshed} platforms)")
+    
+    def record_served(self, query: str):
+        """Count a comparison request; a hit if its query was prefetched"""
+        key = canonicalize_query(query)[0]
+        with self._lock:
+            self._counters["compares"] += 1
+            self._expire_locked(time.monotonic())
+            if self._pending.pop(key, None) is not None:
+                self._counters["hits"] += 1
+    
+    def stats(self) -> dict:
+        """
+        Counters and rates
+        
+        - hit_rate: Share of finished prefetches whose query was compared
+        - wasted_rate: Share of finished prefetches nobody compared
+        - compare_coverage: Share of comparisons that followed a prefetch
+        """
+        with self._lock:
+            self._expire_locked(time.monotonic())
+            counters = dict(self._counters)
+            pending = len(self._pending)
+            in_flight = self._in_flight
+            clients = len(self._buckets)
+        resolved = counters["hits"] + counters["wasted"]
+        return {
+            **counters,
+            "pending": pending,
+            "in_flight": in_flight,
+            "clients": clients,
+            "hit_rate": round(counters["hits"] / resolved, 3) if resolved else 0.0,
+            "wasted_rate": round(counters["wasted"] / resolved, 3) if resolved else 0.0,
+            "compare_coverage": round(counters["hits"] / counters["compares"], 3) if counters["compares"] else 0.0,
+        }
+
+
+__all__ = ["SpeculativePrefetcher"]
@@ -0,0 +1,247 @@
+# app/scrapers_bridge/prewarm.py
+"""
+Trending-query pre-warming
+Re-scrapes hot queries in the background before their cached results expire
+"""
+
+import asyncio
+import random
+import threading
+import time
+from app.config import (
+    logger,
+    SCRAPER_TIMEOUT_S,
+    PREWARM_SEED_QUERIES,
+    PREWARM_TOP_N,
+    PREWARM_MIN_HITS,
+    PREWARM_HIT_DECAY,
+    PREWARM_INTERVAL_S,
+    PREWARM_JITTER,
+    PREWARM_REFRESH_AT,
+    PREWARM_CONCURRENCY,
+)
+from app.core.text_utils import clean_query, canonicalize_query
+from app.scrapers_bridge.scheduler import BACKGROUND
+
+
+def jittered(value: float, jitter: float = PREWARM_JITTER) -> float:
+    """Spread `value` uniformly by +/- `jitter` (a fraction of it)"""
+    return value * random.uniform(1 - jitter, 1 + jitter)
+
+
+class TrendingPrewarmer:
+    """
+    Keeps the hottest queries answered from warm cache entries
+    
+    - Hot list: the frontend's trending seeds plus the top served queries
+      by hit count; counts decay every cycle so the list follows demand
+    - Each cycle re-scrapes (platform, query) pairs whose cache entry is
+      missing or past PREWARM_REFRESH_AT of its TTL, at BACKGROUND priority
+    - Jittered cycle intervals and refresh points keep refreshes from
+      lining up; a semaphore caps pre-warm scrapes in flight
+    """
+    
+    def __init__(
+        self,
+        orchestrator,
+        seeds: list[str] = PREWARM_SEED_QUERIES,
+        top_n: int = PREWARM_TOP_N,
+        concurrency: int = PREWARM_CONCURRENCY
+    ):
+        """Initialize pre-warmer for a ScrapingOrchestrator"""
+        self.orchestrator = orchestrator
+        self.seeds = seeds
+        self.top_n = top_n
+        self.concurrency = concurrency
+        
+        self._lock = threading.Lock()
+        self._hits: dict[str, list] = {}  # canonical key -> [query as first typed, decayed hits]
+        self._task: asyncio.Task | None = None
+        self._counters = {"cycles": 0, "refreshed": 0, "failed": 0, "skipped_warm": 0}
+        self._last_cycle: dict = {}
+    
+    def record(self, query: str):
+        """Count a served query towards the hot list"""
+        key = canonicalize_query(query)[0]
+        if not key:
+            return
+        with self._lock:
+            entry = self._hits.setdefault(key, [clean_query(query), 0.0])
+            entry[1] += 1
+    
+    def hot_queries(self) -> list[str]:
+        """Seeds followed by the hottest recorded queries (as the users typed them)"""
+        seeds = {canonicalize_query(q)[0]: clean_query(q) for q in self.seeds}
+        with self._lock:
+            ranked = sorted(self._hits.items(), key=lambda item: item[1][1], reverse=True)
+        hot = [
+            query for key, (query, hits) in ranked
+            if hits >= PREWARM_MIN_HITS and key not in seeds
+        ]
+        return list(seeds.values()) + hot[:self.top_n]
+    
+    def _decay(self):
+        """Age hit counts and forget queries that went cold"""
+        with self._lock:
+            for key in list(self._hits):
+                self._hits[key][1] *= PREWARM_HIT_DECAY
+                if self._hits[key][1] < 0.5:
+                    del self._hits[key]
+    
+    async def _due(self, platform: str, query: str) -> bool:
+        """Whether a platform/query entry is missing or close to expiry"""
+        cache = self.orchestrator.cache
+        # A platform that just found nothing or failed is left alone until that is forgotten
+        if cache.negative(platform, query, self.orchestrator.max_products) is not None:
+            return False
+        # Off the event loop: an L1 miss reads the entry's age from L2
+        age = await asyncio.to_thread(cache.age, platform, query, self.orchestrator.max_products)
+        if age is None:
+            return True
+        return age >= jittered(cache.ttl_for(platform) * PREWARM_REFRESH_AT)
+    
+    async def _refresh(
+        self,
+        semaphore: asyncio.Semaphore,
+        platform: str,
+        scraper_func,
+        query: str
+    ) -> bool | None:
+        """Re-scrape one platform/query into the cache (None if already being refreshed)"""
+        orchestrator = self.orchestrator
+        async with semaphore:
+            # Shares the claim with stale-while-revalidate so a pair is refreshed once
+            if not orchestrator.cache.begin_refresh(platform, query, orchestrator.max_products):
+                return None
+            try:
+                products = await orchestrator._scrape_platform(
+                    platform, scraper_func, query,
+                    timeout=SCRAPER_TIMEOUT_S,
+                    deadline=None,
+                    priority=BACKGROUND
+                )
+            finally:
+                orchestrator.cache.end_refresh(platform, query, orchestrator.max_products)
+        return products is not None
+    
+    async def warm(
+        self,
+        queries: list[str],
+        concurrency: int | None = None,
+        on_pair_done=None
+    ) -> dict:
+        """
+        Refresh every platform/query pair of `queries` that is due
+        
+        Args:
+            queries: Queries to keep warm
+            concurrency: Max scrapes in flight (default: self.concurrency)
+            on_pair_done: Optional callback, called once per pair when it is
+                          refreshed, failed or found already warm
+        
+        Returns:
+            dict: {"refreshed": int, "failed": int, "skipped_warm": int, "pairs": int}
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.concurrency)
+        jobs = []
+        skipped = 0
+        
+        async def tracked(job):
+            try:
+                return await job
+            finally:
+                if on_pair_done:
+                    on_pair_done()
+        
+        for query in queries:
+            for platform, func in self.orchestrator.scrapers.items():
+                if await self._due(platform, query):
+                    jobs.append(tracked(self._refresh(semaphore, platform, func, query)))
+                else:
+                    skipped += 1
+                    if on_pair_done:
+                        on_pair_done()
+        
+        outcomes = await asyncio.gather(*jobs, return_exceptions=True)
+        return {
+            "refreshed": sum(1 for ok in outcomes if ok is True),
+            "failed": sum(1 for ok in outcomes if ok is not True and ok is not None),
+            "skipped_warm": skipped,
+            "pairs": len(jobs) + skipped,
+        }
+    
+    async def run_cycle(self) -> dict:
+        """
+        Refresh every hot platform/query pair that is due
+        
+        Returns:
+            dict: Summary of the cycle (queries, refreshed, failed, skipped_warm)
+        """
+        queries = self.hot_queries()
+        started = time.monotonic()
+        outcome = await self.warm(queries)
+        refreshed, failed, skipped = outcome["refreshed"], outcome["failed"], outcome["skipped_warm"]
+        
+        self._decay()
+        self._counters["cycles"] += 1
+        self._counters["refreshed"] += refreshed
+        self._counters["failed"] += failed
+        self._counters["skipped_warm"] += skipped
+        self._last_cycle = {
+            "at": time.time(),
+            "queries": len(queries),
+            "refreshed": refreshed,
+            "failed": failed,
+            "skipped_warm": skipped,
+            "duration_s": round(time.monotonic() - started, 2),
+        }
+        if refreshed or failed:
+            logger.info(
+                f"Pre-warm cycle: refreshed {refreshed}, failed {failed}, "
+                f"already warm {skipped} across {len(queries)} hot queries"
+            )
+        return self._last_cycle
+    
+    async def _run(self):
+        """Cycle loop (first cycle shortly after startup)"""
+        delay = jittered(PREWARM_INTERVAL_S) * 0.1
+        while True:
+            await asyncio.sleep(delay)
+            try:
+                await self.run_cycle()
+            except Exception as e:
+                logger.error(f"Pre-warm cycle failed: {e}")
+            delay = jittered(PREWARM_INTERVAL_S)
+    
+    def start(self):
+        """Start the background pre-warm loop"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info(
+                f"Pre-warmer started ({len(self.seeds)} seed queries, top {self.top_n} by hits, "
+                f"concurrency {self.concurrency})"
+            )
+    
+    async def stop(self):
+        """Stop the background pre-warm loop"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    def stats(self) -> dict:
+        """Counters, last cycle and the current hot list"""
+        with self._lock:
+            tracked = len(self._hits)
+        return {
+            **self._counters,
+            "tracked_queries": tracked,
+            "hot_queries": self.hot_queries(),
+            "last_cycle": self._last_cycle,
+        }
+
+
+__all__ = ["TrendingPrewarmer"]
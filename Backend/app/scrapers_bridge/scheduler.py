@@ -0,0 +1,197 @@
+# app/scrapers_bridge/scheduler.py
+"""
+Priority-aware scheduling of scraper slots
+Shares executor threads between interactive, batch and background work
+"""
+
+import asyncio
+import time
+from collections import deque
+from app.config import (
+    logger,
+    PRIORITY_WEIGHTS,
+    SCHEDULER_RESERVED_INTERACTIVE_SLOTS,
+    SCHEDULER_STARVATION_AFTER_S,
+)
+
+# Priority classes
+INTERACTIVE = "interactive"
+BATCH = "batch"
+BACKGROUND = "background"
+
+# Number of recent wait samples kept per class for percentiles
+WAIT_SAMPLE_SIZE = 500
+
+
+class PriorityScheduler:
+    """
+    Grants scraper slots to waiting jobs by priority class
+    
+    - Weighted fair sharing: stride scheduling, each class advances its
+      pass by 1/weight per grant and the lowest pass wins
+    - Reservation: non-interactive classes never occupy the last
+      `reserved` slots, so interactive work always finds capacity
+    - Starvation protection: a waiter queued longer than `starvation_after`
+      is served next among the classes allowed to run
+    
+    Must be used from a single event loop; release() may be scheduled
+    from worker threads via loop.call_soon_threadsafe.
+    """
+    
+    def __init__(
+        self,
+        capacity: int,
+        weights: dict[str, int] = PRIORITY_WEIGHTS,
+        reserved: int = SCHEDULER_RESERVED_INTERACTIVE_SLOTS,
+        starvation_after: float = SCHEDULER_STARVATION_AFTER_S
+    ):
+        """Initialize scheduler with `capacity` concurrent slots"""
+        self.capacity = capacity
+        self.weights = weights
+        self.reserved = reserved
+        self.starvation_after = starvation_after
+        
+        self._waiters: dict[str, deque] = {name: deque() for name in weights}
+        self._pass: dict[str, float] = {name: 0.0 for name in weights}
+        self._running: dict[str, int] = {name: 0 for name in weights}
+        self._metrics: dict[str, dict] = {
+            name: {"granted": 0, "completed": 0, "cancelled": 0, "promoted": 0}
+            for name in weights
+        }
+        self._waits: dict[str, deque] = {
+            name: deque(maxlen=WAIT_SAMPLE_SIZE) for name in weights
+        }
+    
+    @property
+    def running(self) -> int:
+        """Total slots currently in use"""
+        return sum(self._running.values())
+    
+    def queued(self, priority: str | None = None) -> int:
+        """Number of waiting jobs, for one class or overall"""
+        if priority:
+            return len(self._waiters[priority])
+        return sum(len(q) for q in self._waiters.values())
+    
+    def _can_run(self, priority: str) -> bool:
+        """Whether a job of this class may take a slot right now"""
+        if self.running >= self.capacity:
+            return False
+        if priority == INTERACTIVE:
+            return True
+        non_interactive = self.running - self._running.get(INTERACTIVE, 0)
+        return non_interactive < max(self.capacity - self.reserved, 1)
+    
+    def _pick(self) -> str | None:
+        """Choose the class to serve next, or None if nothing can run"""
+        eligible = [
+            name for name, queue in self._waiters.items()
+            if queue and self._can_run(name)
+        ]
+        if not eligible:
+            return None
+        
+        # Starvation protection: oldest overdue head-of-line waiter first
+        now = time.monotonic()
+        overdue = [
+            name for name in eligible
+            if now - self._waiters[name][0][0] >= self.starvation_after
+        ]
+        if overdue:
+            chosen = min(overdue, key=lambda name: self._waiters[name][0][0])
+            if chosen != min(eligible, key=lambda name: self._pass[name]):
+                self._metrics[chosen]["promoted"] += 1
+            return chosen
+        
+        return min(eligible, key=lambda name: self._pass[name])
+    
+    def _dispatch(self):
+        """Hand free slots to waiters"""
+        while True:
+            priority = self._pick()
+            if priority is None:
+                return
+            
+            enqueued_at, future = self._waiters[priority].popleft()
+            if future.done():  # cancelled while waiting
+                continue
+            
+            # Keep idle classes from banking credit while they had no work
+            floor = min(
+                (self._pass[name] for name, queue in self._waiters.items() if queue),
+                default=self._pass[priority]
+            )
+            self._pass[priority] = max(self._pass[priority], floor) + 1 / self.weights[priority]
+            self._running[priority] += 1
+            self._metrics[priority]["granted"] += 1
+            self._waits[priority].append(time.monotonic() - enqueued_at)
+            future.set_result(None)
+    
+    async def acquire(self, priority: str = INTERACTIVE):
+        """
+        Wait for a slot of the given priority class
+        
+        Args:
+            priority: One of the configured classes (interactive, batch, background)
+        """
+        if priority not in self.weights:
+            raise ValueError(f"Unknown priority class '{priority}'")
+        
+        future = asyncio.get_running_loop().create_future()
+        entry = (time.monotonic(), future)
+        self._waiters[priority].append(entry)
+        self._dispatch()
+        
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Slot was granted just before cancellation: hand it back
+                self.release(priority)
+            else:
+                if entry in self._waiters[priority]:
+                    self._waiters[priority].remove(entry)
+                self._metrics[priority]["cancelled"] += 1
+            raise
+    
+    def release(self, priority: str = INTERACTIVE):
+        """Return a slot and wake the next waiter"""
+        self._running[priority] -= 1
+        self._metrics[priority]["completed"] += 1
+        self._dispatch()
+    
+    def set_capacity(self, capacity: int):
+        """Change the number of slots (excess running jobs drain naturally)"""
+        logger.info(f"Scheduler capacity {self.capacity} -> {capacity}")
+        self.capacity = capacity
+        self._dispatch()
+    
+    def oldest_wait(self, priority: str) -> float:
+        """Seconds the head-of-line waiter of a class has been queued"""
+        queue = self._waiters[priority]
+        return time.monotonic() - queue[0][0] if queue else 0.0
+    
+    def stats(self) -> dict:
+        """Per-class queue and wait metrics"""
+        classes = {}
+        for name in self.weights:
+            waits = sorted(self._waits[name])
+            classes[name] = {
+                "weight": self.weights[name],
+                "queued": len(self._waiters[name]),
+                "running": self._running[name],
+                **self._metrics[name],
+                "wait_p50_s": round(waits[len(waits) // 2], 3) if waits else 0.0,
+                "wait_p95_s": round(waits[int(len(waits) * 0.95)], 3) if waits else 0.0,
+                "oldest_wait_s": round(self.oldest_wait(name), 3),
+            }
+        return {
+            "capacity": self.capacity,
+            "reserved_interactive": self.reserved,
+            "running": self.running,
+            "queued": self.queued(),
+            "classes": classes,
+        }
+
+
+__all__ = ["PriorityScheduler", "INTERACTIVE", "BATCH", "BACKGROUND"]
@@ -0,0 +1,118 @@
+# app/scrapers_bridge/warmup.py
+"""
+Startup cache warm-up
+Replays the most served recent queries so the first users after a deploy hit warm data
+"""
+
+import asyncio
+import time
+from app.config import (
+    logger,
+    QUERY_LOG_ENABLED,
+    WARMUP_TOP_N,
+    WARMUP_WINDOW_S,
+    WARMUP_CONCURRENCY,
+    WARMUP_READY_FRACTION,
+    WARMUP_MAX_WAIT_S,
+)
+
+
+class StartupWarmup:
+    """
+    Background replay of the query log's top queries at BACKGROUND priority
+    
+    Pairs already warm (e.g. found in the L2 cache) count as done without
+    scraping. Readiness turns true once WARMUP_READY_FRACTION of the
+    platform/query pairs are done or WARMUP_MAX_WAIT_S has passed, so a
+    load balancer polling /ready shifts traffic over gradually.
+    """
+    
+    def __init__(self, orchestrator, query_log):
+        """Initialize warm-up for a ScrapingOrchestrator and QueryLog"""
+        self.orchestrator = orchestrator
+        self.query_log = query_log
+        
+        self._task: asyncio.Task | None = None
+        self._started_at: float | None = None
+        self._queries: list[str] = []
+        self._total = 0
+        self._done = 0
+        self._finished = False
+        self._outcome: dict = {}
+    
+    def _pair_done(self):
+        self._done += 1
+    
+    async def _run(self):
+        """Load the top queries and warm them"""
+        try:
+            self._queries = await asyncio.to_thread(
+                self.query_log.top_queries, WARMUP_TOP_N, WARMUP_WINDOW_S
+            )
+            self._total = len(self._queries) * len(self.orchestrator.scrapers)
+            logger.info(f"Startup warm-up: replaying {len(self._queries)} recent queries")
+            
+            self._outcome = await self.orchestrator.prewarmer.warm(
+                self._queries,
+                concurrency=WARMUP_CONCURRENCY,
+                on_pair_done=self._pair_done
+            )
+            logger.info(
+                f"Startup warm-up finished in {time.monotonic() - self._started_at:.0f}s: "
+                f"{self._outcome}"
+            )
+        except Exception as e:
+            logger.error(f"Startup warm-up failed: {e}")
+        finally:
+            self._finished = True
+    
+    def start(self):
+        """Start warm-up in the background (call once from the running event loop)"""
+        if self._started_at is not None:
+            return
+        self._started_at = time.monotonic()
+        if not QUERY_LOG_ENABLED:
+            self._finished = True  # nothing recorded, nothing to replay
+            return
+        self._task = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        """Abandon a warm-up that is still running"""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+    
+    @property
+    def progress(self) -> float:
+        """Share of platform/query pairs warmed so far (0.0 - 1.0)"""
+        if self._finished or not self._total:
+            return 1.0 if self._finished else 0.0
+        return min(self._done / self._total, 1.0)
+    
+    @property
+    def ready(self) -> bool:
+        """Whether the server should take its full share of traffic"""
+        if self._started_at is None:
+            return False
+        if self._finished or self.progress >= WARMUP_READY_FRACTION:
+            return True
+        return time.monotonic() - self._started_at >= WARMUP_MAX_WAIT_S
+    
+    def stats(self) -> dict:
+        """Readiness flag and warm-up progress"""
+        return {
+            "ready": self.ready,
+            "finished": self._finished,
+            "progress": round(self.progress, 3),
+            "queries": len(self._queries),
+            "pairs_total": self._total,
+            "pairs_done": self._done,
+            "elapsed_s": round(time.monotonic() - self._started_at, 1) if self._started_at else 0.0,
+            "outcome": self._outcome,
+        }
+
+
+__all__ = ["StartupWarmup"]
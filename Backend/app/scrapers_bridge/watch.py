@@ -0,0 +1,257 @@
+# app/scrapers_bridge/watch.py
+"""
+Price-watch scheduler
+Re-checks watched products on a jittered cadence within a page-load budget
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from app.config import (
+    logger,
+    WATCH_TICK_S,
+    WATCH_JITTER,
+    WATCH_RETRY_S,
+    WATCH_MAX_DUE_PER_CYCLE,
+    WATCH_CATALOG_FRESH_S,
+    WATCH_PAGE_LOADS_PER_HOUR,
+    WATCH_PAGE_LOAD_BURST,
+    WATCH_BATCH_SIZE,
+    WATCH_CONCURRENCY,
+    WATCH_MIN_DROP_PERCENT,
+)
+from app.core.price_utils import extract_price
+from app.scrapers_bridge.prewarm import jittered
+
+
+def price_events(watch: dict, price: int, in_stock: bool | None) -> list[dict]:
+    """
+    Notifications a fresh reading of a watched product triggers
+    
+    - price_drop: the price fell by at least WATCH_MIN_DROP_PERCENT
+    - target_reached: the price reached the watch's target (once per crossing)
+    - back_in_stock: the product was out of stock and no longer is
+    
+    Args:
+        watch: Stored watch (last_price / in_stock are the previous reading)
+        price: Current price (0 if unknown)
+        in_stock: Current availability (None if unknown)
+    
+    Returns:
+        list: Event dicts, possibly empty
+    """
+    events = []
+    previous = watch["last_price"]
+    base = {
+        "watch_id": watch["id"],
+        "platform": watch["platform"],
+        "product_id": watch["product_id"],
+        "url": watch["url"],
+        "title": watch["title"],
+        "old_price": previous,
+        "new_price": price,
+        "target_price": watch["target_price"],
+        "at": time.time(),
+    }
+    if price and previous:
+        drop_percent = (previous - price) / previous * 100
+        if drop_percent >= WATCH_MIN_DROP_PERCENT:
+            events.append({**base, "type": "price_drop", "drop_percent": round(drop_percent, 1)})
+    
+    target = watch["target_price"]
+    if target and price and price <= target and not (previous and previous <= target):
+        events.append({**base, "type": "target_reached"})
+    
+    if watch["in_stock"] is False and in_stock is True:
+        events.append({**base, "type": "back_in_stock"})
+    return events
+
+
+class PriceWatchScheduler:
+    """
+    Re-checks due watches every WATCH_TICK_S
+    
+    - Watches of the same product share one reading
+    - Cheapest source first: a catalog copy seen within
+      WATCH_CATALOG_FRESH_S (e.g. from someone's search) costs nothing;
+      otherwise product detail pages are loaded in per-platform batches of
+      WATCH_BATCH_SIZE, one browser per batch, at BACKGROUND priority
+    - Page loads are drawn from a token bucket refilled at
+      WATCH_PAGE_LOADS_PER_HOUR; due watches beyond it wait for the next
+      cycle, most overdue first
+    - Each reading is diffed against the watch's last price (price_events)
+      and the events go to the notification sink; the next check is the
+      watch's interval spread by +/- WATCH_JITTER
+    """
+    
+    def __init__(self, orchestrator, watches, sink):
+        """Initialize scheduler for a ScrapingOrchestrator, WatchList and notification sink"""
+        self.orchestrator = orchestrator
+        self.watches = watches
+        self.sink = sink
+        
+        self._tokens = float(WATCH_PAGE_LOAD_BURST)
+        self._refilled = time.monotonic()
+        self._task: asyncio.Task | None = None
+        self._counters = {
+            "cycles": 0,
+            "checked": 0,
+            "from_catalog": 0,
+            "page_loads": 0,
+            "failed": 0,
+            "deferred": 0,
+            "notifications": 0,
+        }
+        self._last_cycle: dict = {}
+    
+    def _take_tokens(self, wanted: int) -> int:
+        """Page loads this cycle may spend (at most `wanted`)"""
+        now = time.monotonic()
+        self._tokens = min(
+            WATCH_PAGE_LOAD_BURST,
+            self._tokens + (now - self._refilled) * WATCH_PAGE_LOADS_PER_HOUR / 3600
+        )
+        self._refilled = now
+        granted = min(int(self._tokens), wanted)
+        self._tokens -= granted
+        return granted
+    
+    async def _load_batch(self, semaphore: asyncio.Semaphore, platform: str, urls: list[str]) -> list:
+        async with semaphore:
+            return await self.orchestrator.load_product_pages(platform, urls)
+    
+    async def run_cycle(self) -> dict:
+        """
+        Check every due watch the budget allows
+        
+        Returns:
+            dict: Summary of the cycle (due, checked, from_catalog, page_loads,
+                  failed, deferred, notifications)
+        """
+        started = time.monotonic()
+        now = time.time()
+        due = await asyncio.to_thread(self.watches.due, now, WATCH_MAX_DUE_PER_CYCLE)
+        
+        # One reading per product, most overdue product first
+        products: OrderedDict = OrderedDict()  # (platform, product id) -> [url, watches]
+        for watch in due:
+            entry = products.setdefault((watch["platform"], watch["product_id"]), [watch["url"], []])
+            entry[1].append(watch)
+        
+        readings: dict[tuple, dict] = {}
+        catalog = self.orchestrator.catalog
+        if catalog is not None:
+            for platform in {platform for platform, _ in products}:
+                pids = [pid for p, pid in products if p == platform]
+                known = await asyncio.to_thread(catalog.lookup, platform, pids)
+                for pid, (product, last_seen) in known.items():
+                    if now - last_seen <= WATCH_CATALOG_FRESH_S and extract_price(product.get("currentPrice")):
+                        readings[(platform, pid)] = product
+        from_catalog = len(readings)
+        
+        to_load = [key for key in products if key not in readings]
+        granted = self._take_tokens(len(to_load))
+        deferred = to_load[granted:]
+        batches = []
+        for platform in {platform for platform, _ in to_load[:granted]}:
+            keys = [key for key in to_load[:granted] if key[0] == platform]
+            for i in range(0, len(keys), WATCH_BATCH_SIZE):
+                batches.append(keys[i:i + WATCH_BATCH_SIZE])
+        
+        semaphore = asyncio.Semaphore(WATCH_CONCURRENCY)
+        outcomes = await asyncio.gather(
+            *(
+                self._load_batch(semaphore, batch[0][0], [products[key][0] for key in batch])
+                for batch in batches
+            ),
+            return_exceptions=True
+        )
+        for batch, outcome in zip(batches, outcomes):
+            pages = outcome if isinstance(outcome, list) else [None] * len(batch)
+            for key, details in zip(batch, pages):
+                if details is not None and extract_price(details.get("currentPrice")):
+                    readings[key] = details
+        
+        checked, failed, events = [], [], []
+        waiting = set(deferred)
+        for key, (_, watches) in products.items():
+            if key in waiting:
+                continue  # still due, checked first next cycle
+            reading = readings.get(key)
+            for watch in watches:
+                if reading is None:
+                    failed.append((watch["id"], now + jittered(WATCH_RETRY_S, WATCH_JITTER)))
+                    continue
+                price = extract_price(reading.get("currentPrice"))
+                in_stock = reading.get("inStock")
+                events.extend(price_events({**watch, "title": reading.get("title") or watch["title"]}, price, in_stock))
+                checked.append((
+                    watch["id"], price, in_stock, reading.get("title"),
+                    now, now + jittered(watch["interval_s"], WATCH_JITTER)
+                ))
+        
+        await asyncio.to_thread(self.watches.record_checks, checked, failed)
+        if events:
+            await asyncio.to_thread(self.sink.send, events)
+        
+        cycle = {
+            "due": len(due),
+            "products": len(products),
+            "checked": len(checked),
+            "from_catalog": from_catalog,
+            "page_loads": granted,
+            "failed": len(failed),
+            "deferred": sum(len(products[key][1]) for key in deferred),
+            "notifications": len(events),
+        }
+        self._counters["cycles"] += 1
+        for name in ("checked", "from_catalog", "page_loads", "failed", "deferred", "notifications"):
+            self._counters[name] += cycle[name]
+        self._last_cycle = {"at": time.time(), **cycle, "duration_s": round(time.monotonic() - started, 2)}
+        if due:
+            logger.info(
+                f"Watch cycle: {len(checked)} checked ({from_catalog} products from the catalog, "
+                f"{granted} page loads), {len(failed)} failed, {cycle['deferred']} deferred, "
+                f"{len(events)} notifications"
+            )
+        return self._last_cycle
+    
+    async def _run(self):
+        """Cycle loop"""
+        while True:
+            await asyncio.sleep(jittered(WATCH_TICK_S, WATCH_JITTER))
+            try:
+                await self.run_cycle()
+            except Exception as e:
+                logger.error(f"Watch cycle failed: {e}")
+    
+    def start(self):
+        """Start the background watch loop"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info(
+                f"Price-watch scheduler started (budget {WATCH_PAGE_LOADS_PER_HOUR} page loads/hour, "
+                f"batches of {WATCH_BATCH_SIZE})"
+            )
+    
+    async def stop(self):
+        """Stop the background watch loop"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    def stats(self) -> dict:
+        """Counters, last cycle and the sink's delivery counters (watch list size: WatchList.stats)"""
+        return {
+            **self._counters,
+            "tokens": round(self._tokens, 1),
+            "last_cycle": self._last_cycle,
+            "sink": self.sink.stats(),
+        }
+
+
+__all__ = ["PriceWatchScheduler", "price_events"]
@@ -0,0 +1,96 @@
+# Benchmark Script: L2 Cache Read Latency vs Scraping
+# Run from Backend/: python -m benchmarks.l2_cache_benchmark [--scrape]
+
+import os
+import sys
+import tempfile
+import time
+from app.cache.sqlite_store import SQLiteCacheStore
+
+
+def sample_products(count: int = 5) -> list[dict]:
+    """Product list shaped like real scraper output"""
+    return [
+        {
+            "title": f"Apple iPhone 15 (128 GB) - Black, variant {i}",
+            "currentPrice": "₹69,999",
+            "maxRetailPrice": "₹79,900",
+            "discount": "12% off",
+            "link": f"https://www.amazon.in/dp/B0CHX{i:05d}",
+            "image": f"https://m.media-amazon.com/images/I/{i:08d}.jpg",
+        }
+        for i in range(count)
+    ]
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def benchmark_l2(entries: int = 2000, reads: int = 5000) -> list[float]:
+    """Time L2 reads of scrape-sized entries (milliseconds per read)"""
+    print(f"\n{'='*70}")
+    print(f"🧪 L2 cache reads ({entries} entries, {reads} reads)")
+    print(f"{'='*70}")
+    
+    with tempfile.TemporaryDirectory() as directory:
+        store = SQLiteCacheStore(os.path.join(directory, "bench.sqlite3"))
+        products = sample_products()
+        for i in range(entries):
+            store.set(f"scrape:amazon:5:query {i}", products, ttl=3600)
+        
+        timings = []
+        for i in range(reads):
+            started = time.perf_counter()
+            store.get(f"scrape:amazon:5:query {i % entries}")
+            timings.append((time.perf_counter() - started) * 1000)
+        
+        stats = store.stats()
+        store.close()
+    
+    print(f"   Stored size:  {stats['bytes']} bytes ({stats['bytes'] // entries} per entry)")
+    print(f"   p50:          {percentile(timings, 0.5):.3f} ms")
+    print(f"   p95:          {percentile(timings, 0.95):.3f} ms")
+    print(f"   p99:          {percentile(timings, 0.99):.3f} ms")
+    return timings
+
+
+def benchmark_scrape(query: str = "iphone 15") -> float | None:
+    """Time one live scrape (the work an L2 hit replaces)"""
+    from scrapers.flipkart_sync import scrape_flipkart
+    
+    print(f"\n{'='*70}")
+    print(f"🧪 Live Flipkart scrape for '{query}'")
+    print(f"{'='*70}")
+    
+    started = time.perf_counter()
+    try:
+        scrape_flipkart(query, 5)
+    except Exception as e:
+        print(f"❌ Scrape failed: {e}")
+        return None
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    print(f"   Duration:     {elapsed_ms:.0f} ms")
+    return elapsed_ms
+
+
+def main():
+    timings = benchmark_l2()
+    
+    if "--scrape" in sys.argv:
+        scrape_ms = benchmark_scrape()
+    else:
+        # Same seed the executor uses before it has measured real scrapes
+        from app.config import SCRAPER_DURATION_SEED_S
+        scrape_ms = SCRAPER_DURATION_SEED_S * 1000
+        print(f"\nℹ️  Using typical scrape duration of {scrape_ms:.0f} ms (pass --scrape to measure)")
+    
+    if scrape_ms:
+        p95 = percentile(timings, 0.95)
+        print(f"\n📊 L2 p95 read is {scrape_ms / p95:,.0f}x faster than scraping")
+        print("   Live values: /status -> cache.l2.avg_read_ms vs admission.capacity.avg_duration_s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,11 @@
 import re
 import urllib.parse
 from playwright.sync_api import sync_playwright
+from scrapers.utils import Budget, no_products
 
 
 
-def scrape_amazon(query: str, max_products: int = 5) -> list[dict]:
+def scrape_amazon(query: str, max_products: int = 5, budget_ms: int | None = None) -> list[dict] | None:
     """
     FIXES APPLIED:
     ✅ Changed wait_until from "load" → "domcontentloaded" (faster)
@@ -14,6 +15,8 @@ def scrape_amazon(query: str, max_products: int = 5) -> list[dict]:
     ✅ Added fallback selectors
     ✅ Better price extraction
     """
+    budget = Budget(budget_ms)
+
     def to_int(price):
         if not price or price == "N/A":
             return None
@@ -35,31 +38,32 @@ def scrape_amazon(query: str, max_products: int = 5) -> list[dict]:
                 }
             )
             page = context.new_page()
-            page.set_default_timeout(10000)  # SPEED: 12000 → 10000
-            page.set_default_navigation_timeout(10000)  # SPEED: Add global timeout
+            page.set_default_timeout(budget(10000))  # SPEED: 12000 → 10000
+            page.set_default_navigation_timeout(budget(10000))  # SPEED: Add global timeout
             
             search_url = f"https://www.amazon.in/s?k={query.replace(' ', '+')}"
             
             # SPEED: Timeout reduced from 12000 → 10000
-            page.goto(search_url, wait_until="domcontentloaded", timeout=10000)
-            page.wait_for_timeout(1000)  # SPEED: 2000 → 1000
+            page.goto(search_url, wait_until="domcontentloaded", timeout=budget(10000))
+            page.wait_for_timeout(budget(1000))  # SPEED: 2000 → 1000
             
             # Scroll to trigger lazy loading
             page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            page.wait_for_timeout(800)  # SPEED: 1500 → 800
+            page.wait_for_timeout(budget(800))  # SPEED: 1500 → 800
             
             # Wait for products with retry logic
             try:
-                page.wait_for_selector('div[role="listitem"] div.sg-col-inner', timeout=5000)  # SPEED: 8000 → 5000
+                page.wait_for_selector('div[role="listitem"] div.sg-col-inner', timeout=budget(5000))  # SPEED: 8000 → 5000
             except:
                 print("⚠️  Primary selector failed, trying alternative...")
                 try:
-                    page.wait_for_selector('div.s-result-item', timeout=3000)  # SPEED: 5000 → 3000
+                    page.wait_for_selector('div.s-result-item', timeout=budget(3000))  # SPEED: 5000 → 3000
                 except:
                     print("❌ No products found on Amazon")
+                    products = no_products(page, budget)
                     context.close()
                     browser.close()
-                    return []
+                    return products
 
 
             product_elements = page.query_selector_all('div[role="listitem"] div.sg-col-inner')
@@ -137,6 +141,8 @@ def scrape_amazon(query: str, max_products: int = 5) -> list[dict]:
                     continue
 
 
+            if not products:
+                products = no_products(page, budget)
             context.close()
             browser.close()
             return products
@@ -144,4 +150,4 @@ def scrape_amazon(query: str, max_products: int = 5) -> list[dict]:
 
     except Exception as e:
         print(f"Error in Amazon scraper: {e}")
-        return []
\ No newline at end of file
+        raise  # let callers tell a failure apart from "no results"
\ No newline at end of file
@@ -1,9 +1,10 @@
 import re
 from playwright.sync_api import sync_playwright
+from scrapers.utils import Budget, no_products
 
 
 
-def scrape_croma(query: str, max_products: int = 5) -> list[dict]:
+def scrape_croma(query: str, max_products: int = 5, budget_ms: int | None = None) -> list[dict] | None:
     """
     FIXES APPLIED:
     ✅ Removed conflicting wait_for_load_state calls (major fix!)
@@ -14,6 +15,8 @@ def scrape_croma(query: str, max_products: int = 5) -> list[dict]:
     ✅ Added proper fallback handling
     ✅ Better selector queries with retry
     """
+    budget = Budget(budget_ms)
+
     try:
         with sync_playwright() as p:
             browser = p.chromium.launch(
@@ -62,8 +65,8 @@ def scrape_croma(query: str, max_products: int = 5) -> list[dict]:
             )
             
             page = context.new_page()
-            page.set_default_timeout(10000)  # SPEED: 12000 → 10000
-            page.set_default_navigation_timeout(10000)  # SPEED: Add global timeout
+            page.set_default_timeout(budget(10000))  # SPEED: 12000 → 10000
+            page.set_default_navigation_timeout(budget(10000))  # SPEED: Add global timeout
             
             # Stealth mode
             page.add_init_script("""
@@ -88,31 +91,32 @@ def scrape_croma(query: str, max_products: int = 5) -> list[dict]:
             print(f"🔍 Scraping Croma: {query}")
             
             # SPEED: Reduced timeout from 12000 → 10000
-            page.goto(search_url, wait_until="domcontentloaded", timeout=10000)
+            page.goto(search_url, wait_until="domcontentloaded", timeout=budget(10000))
             
             # SPEED: Reduced from 2000ms to 1200ms
-            page.wait_for_timeout(1200)
+            page.wait_for_timeout(budget(1200))
             
             # Scroll to trigger lazy loading
             page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            page.wait_for_timeout(2500)  # SPEED: 4000 → 2500 (lazy-loading still works)
+            page.wait_for_timeout(budget(2500))  # SPEED: 4000 → 2500 (lazy-loading still works)
             
             # Scroll again to load more
             page.evaluate("window.scrollTo(0, document.body.scrollHeight * 0.5)")
-            page.wait_for_timeout(800)  # SPEED: 1500 → 800
+            page.wait_for_timeout(budget(800))  # SPEED: 1500 → 800
             
             # Wait for products with fallback
             try:
-                page.wait_for_selector('li.product-item div.cp-product', timeout=5000)  # SPEED: 8000 → 5000
+                page.wait_for_selector('li.product-item div.cp-product', timeout=budget(5000))  # SPEED: 8000 → 5000
             except:
                 print("⚠️  Primary selector timeout, trying fallback...")
                 try:
-                    page.wait_for_selector('li.product-item', timeout=3000)  # SPEED: 5000 → 3000
+                    page.wait_for_selector('li.product-item', timeout=budget(3000))  # SPEED: 5000 → 3000
                 except:
                     print("❌ No product elements found on Croma")
+                    products = no_products(page, budget)
                     context.close()
                     browser.close()
-                    return []
+                    return products
             
             product_elements = page.query_selector_all('li.product-item div.cp-product')
             print(f"✅ Found {len(product_elements)} products on Croma")
@@ -165,10 +169,12 @@ def scrape_croma(query: str, max_products: int = 5) -> list[dict]:
                     print(f"  ⚠️  Error on product {i+1}: {str(e)[:80]}")
                     continue
             
+            if not products:
+                products = no_products(page, budget)
             context.close()
             browser.close()
             return products
     
     except Exception as e:
         print(f"💥 Croma scraper error: {e}")
-        return []
\ No newline at end of file
+        raise  # let callers tell a failure apart from "no results"
\ No newline at end of file
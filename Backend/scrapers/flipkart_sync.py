@@ -1,8 +1,11 @@
 import re
 from playwright.sync_api import sync_playwright
+from scrapers.utils import Budget, no_products
 
 
-def scrape_flipkart(query: str, max_products: int = 5) -> list[dict]:
+def scrape_flipkart(query: str, max_products: int = 5, budget_ms: int | None = None) -> list[dict] | None:
+    budget = Budget(budget_ms)
+
     try:
         with sync_playwright() as p:
             browser = p.chromium.launch(headless=True)
@@ -15,29 +18,30 @@ def scrape_flipkart(query: str, max_products: int = 5) -> list[dict]:
 
 
             page = context.new_page()
-            page.set_default_timeout(8000)  # SPEED: 10000 → 8000
-            page.set_default_navigation_timeout(8000)  # SPEED: 10000 → 8000
+            page.set_default_timeout(budget(8000))  # SPEED: 10000 → 8000
+            page.set_default_navigation_timeout(budget(8000))  # SPEED: 10000 → 8000
 
 
             search_url = f"https://www.flipkart.com/search?q={query.replace(' ', '+')}"
-            page.goto(search_url, wait_until="domcontentloaded", timeout=8000)  # SPEED: 10000 → 8000
+            page.goto(search_url, wait_until="domcontentloaded", timeout=budget(8000))  # SPEED: 10000 → 8000
             
-            page.wait_for_timeout(200)  # SPEED: 500 → 200
+            page.wait_for_timeout(budget(200))  # SPEED: 500 → 200
             
             page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            page.wait_for_timeout(200)  # SPEED: 500 → 200
+            page.wait_for_timeout(budget(200))  # SPEED: 500 → 200
 
 
             try:
-                page.wait_for_selector('a.k7wcnx', timeout=3000)  # SPEED: 5000 → 3000
+                page.wait_for_selector('a.k7wcnx', timeout=budget(3000))  # SPEED: 5000 → 3000
             except:
                 try:
-                    page.wait_for_selector('div._2kHmtP', timeout=2000)  # SPEED: 3000 → 2000
+                    page.wait_for_selector('div._2kHmtP', timeout=budget(2000))  # SPEED: 3000 → 2000
                 except:
                     print("❌ No products found on Flipkart")
+                    products = no_products(page, budget)
                     context.close()
                     browser.close()
-                    return []
+                    return products
 
 
             product_elements = page.query_selector_all('a.k7wcnx')
@@ -92,6 +96,8 @@ def scrape_flipkart(query: str, max_products: int = 5) -> list[dict]:
                     continue
 
 
+            if not products:
+                products = no_products(page, budget)
             context.close()
             browser.close()
             return products
@@ -99,4 +105,4 @@ def scrape_flipkart(query: str, max_products: int = 5) -> list[dict]:
 
     except Exception as e:
         print(f"Error in Flipkart scraper: {e}")
-        return []
\ No newline at end of file
+        raise  # let callers tell a failure apart from "no results"
\ No newline at end of file
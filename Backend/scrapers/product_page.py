@@ -0,0 +1,280 @@
+import json
+from playwright.sync_api import sync_playwright
+from scrapers.utils import Budget
+
+
+# Resources a detail-page refresh never reads; skipping them keeps a
+# refresh to a single light page load
+BLOCKED_RESOURCES = {"image", "media", "font"}
+
+OUT_OF_STOCK_MARKERS = ("out of stock", "sold out", "currently unavailable", "notify me")
+
+
+def _format_price(value) -> str:
+    """'₹51,999' style price from a structured-data number ("N/A" if unparseable)"""
+    try:
+        return f"₹{int(float(str(value).replace(',', ''))):,}"
+    except (TypeError, ValueError):
+        return "N/A"
+
+
+def _list_price(offers: dict):
+    """MRP from an offer's explicit list-price specification, or None"""
+    specs = offers.get("priceSpecification") or []
+    if isinstance(specs, dict):
+        specs = [specs]
+    for spec in specs:
+        if isinstance(spec, dict) and "ListPrice" in str(spec.get("priceType", "")):
+            return spec.get("price")
+    return None
+
+
+def _find_product_node(data):
+    """First schema.org Product object in a JSON-LD document"""
+    if isinstance(data, list):
+        for item in data:
+            found = _find_product_node(item)
+            if found:
+                return found
+        return None
+    if not isinstance(data, dict):
+        return None
+    node_type = data.get("@type")
+    types = node_type if isinstance(node_type, list) else [node_type]
+    if "Product" in types:
+        return data
+    return _find_product_node(data.get("@graph", []))
+
+
+def parse_structured_product(ld_blocks: list[str]) -> dict:
+    """
+    Price, availability and rating from a page's JSON-LD blocks
+
+    Args:
+        ld_blocks: Raw text of every <script type="application/ld+json">
+
+    Returns:
+        dict: Any of title, currentPrice, maxRetailPrice, inStock, rating found
+    """
+    for raw in ld_blocks:
+        try:
+            product = _find_product_node(json.loads(raw))
+        except ValueError:
+            continue
+        if not product:
+            continue
+
+        details = {}
+        if product.get("name"):
+            details["title"] = product["name"]
+
+        offers = product.get("offers") or {}
+        if isinstance(offers, list):
+            offers = offers[0] if offers else {}
+        price = offers.get("price", offers.get("lowPrice"))
+        if price is not None and _format_price(price) != "N/A":
+            details["currentPrice"] = _format_price(price)
+        # highPrice is the dearest seller's offer, not the MRP
+        list_price = _list_price(offers)
+        if list_price is not None and _format_price(list_price) != "N/A":
+            details["maxRetailPrice"] = _format_price(list_price)
+        availability = str(offers.get("availability", ""))
+        if availability:
+            details["inStock"] = "InStock" in availability or "LimitedAvailability" in availability
+
+        rating = product.get("aggregateRating") or {}
+        if rating.get("ratingValue") is not None:
+            details["rating"] = str(rating["ratingValue"])
+        return details
+    return {}
+
+
+def _read_product_page(page, url: str, selectors: dict, budget) -> dict:
+    """Navigate `page` to `url` and read its price data (see fetch_product_page)"""
+    def text_of(selector: str | None) -> str:
+        if not selector:
+            return "N/A"
+        element = page.query_selector(selector)
+        text = element.inner_text().strip() if element else ""
+        return text or "N/A"
+
+    page.set_default_timeout(budget(8000))
+    page.goto(url, wait_until="domcontentloaded", timeout=budget(10000))
+
+    if selectors.get("price"):
+        try:
+            page.wait_for_selector(selectors["price"], timeout=budget(4000))
+        except Exception:
+            pass  # structured data may still carry the price
+
+    ld_blocks = page.eval_on_selector_all(
+        'script[type="application/ld+json"]',
+        "nodes => nodes.map(node => node.textContent)"
+    )
+    details = parse_structured_product(ld_blocks)
+
+    if "inStock" not in details:
+        availability = text_of(selectors.get("availability")).lower()
+        if availability != "n/a":
+            details["inStock"] = not any(m in availability for m in OUT_OF_STOCK_MARKERS)
+
+    return {
+        "link": url,
+        "title": details.get("title") or text_of(selectors.get("title")),
+        "currentPrice": details.get("currentPrice") or text_of(selectors.get("price")),
+        "maxRetailPrice": details.get("maxRetailPrice") or text_of(selectors.get("mrp")),
+        "inStock": details.get("inStock"),
+        "rating": details.get("rating") or text_of(selectors.get("rating")),
+    }
+
+
+def fetch_product_pages(
+    urls: list[str],
+    selectors: dict,
+    budget_ms: int | None = None,
+    browser_type: str = "chromium"
+) -> list[dict | None]:
+    """
+    Load several product detail pages of one platform in a single browser
+
+    Structured data (JSON-LD) is read first; the platform's CSS selectors
+    fill in whatever it lacks. Images, media and fonts are not downloaded.
+    Pages are visited one after another in the same tab, so a batch pays
+    for one browser launch.
+
+    Args:
+        urls: Product page links, as stored by the search scraper
+        selectors: CSS selectors for "title", "price", "mrp", "rating" and
+                   "availability" (any may be missing)
+        budget_ms: Milliseconds left of the caller's deadline (whole batch)
+        browser_type: Playwright browser to launch ("chromium" or "firefox")
+
+    Returns:
+        list: Per URL, {link, title, currentPrice, maxRetailPrice, inStock, rating}
+              ("N/A" / None for fields the page does not show), or None if
+              that page could not be read
+    """
+    budget = Budget(budget_ms)
+
+    results = []
+    with sync_playwright() as p:
+        launcher = p.firefox if browser_type == "firefox" else p.chromium
+        browser = launcher.launch(headless=True)
+        context = browser.new_context(
+            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+            viewport={"width": 1366, "height": 768},
+            locale="en-IN",
+            extra_http_headers={"Accept-Language": "en-IN,en;q=0.9"}
+        )
+        context.route(
+            "**/*",
+            lambda route: route.abort()
+            if route.request.resource_type in BLOCKED_RESOURCES
+            else route.continue_()
+        )
+
+        try:
+            page = context.new_page()
+            for url in urls:
+                if budget.expired:
+                    results.append(None)
+                    continue
+                try:
+                    results.append(_read_product_page(page, url, selectors, budget))
+                except Exception as e:
+                    if len(urls) == 1:
+                        raise
+                    print(f"  ⚠️  Product page failed ({url}): {str(e)[:80]}")
+                    results.append(None)
+        finally:
+            context.close()
+            browser.close()
+    return results
+
+
+def fetch_product_page(
+    url: str,
+    selectors: dict,
+    budget_ms: int | None = None,
+    browser_type: str = "chromium"
+) -> dict:
+    """
+    Load one product detail page and read its current price data
+
+    Args:
+        url: Product page link, as stored by the search scraper
+        selectors: CSS selectors (see fetch_product_pages)
+        budget_ms: Milliseconds left of the caller's deadline
+        browser_type: Playwright browser to launch ("chromium" or "firefox")
+
+    Returns:
+        dict: {link, title, currentPrice, maxRetailPrice, inStock, rating}
+              ("N/A" / None for fields the page does not show)
+    """
+    return fetch_product_pages([url], selectors, budget_ms=budget_ms, browser_type=browser_type)[0]
+
+
+# Detail-page selectors per platform (fallbacks for fields missing from JSON-LD)
+FLIPKART_SELECTORS = {
+    "title": "h1 span",
+    "price": "div.Nx9bqj.CxhGGd",
+    "mrp": "div.yRaY8j.A6\\+E6v",
+    "rating": "div.XQDdHH",
+    "availability": "div.Z8JjpR",
+}
+
+AMAZON_SELECTORS = {
+    "title": "#productTitle",
+    "price": "#corePriceDisplay_desktop_feature_div span.a-price-whole",
+    "mrp": "#corePriceDisplay_desktop_feature_div span.a-price.a-text-price span.a-offscreen",
+    "rating": "#acrPopover span.a-size-base",
+    "availability": "#availability",
+}
+
+CROMA_SELECTORS = {
+    "title": "h1.pd-title",
+    "price": "span#pdp-product-price",
+    "mrp": "span#old-price",
+    "rating": "span.rating-text",
+    "availability": "div.pdp-out-of-stock",
+}
+
+RELIANCE_SELECTORS = {
+    "title": "h1.product-name",
+    "price": "div.product-price",
+    "mrp": "div.mrp-container div.mrp-amount",
+    "availability": "div.out-of-stock",
+}
+
+
+def refresh_flipkart(url: str, budget_ms: int | None = None) -> dict:
+    return fetch_product_page(url, FLIPKART_SELECTORS, budget_ms=budget_ms)
+
+
+def refresh_amazon(url: str, budget_ms: int | None = None) -> dict:
+    return fetch_product_page(url, AMAZON_SELECTORS, budget_ms=budget_ms)
+
+
+def refresh_croma(url: str, budget_ms: int | None = None) -> dict:
+    return fetch_product_page(url, CROMA_SELECTORS, budget_ms=budget_ms)
+
+
+def refresh_reliancedigital(url: str, budget_ms: int | None = None) -> dict:
+    # Same browser as the Reliance search scraper
+    return fetch_product_page(url, RELIANCE_SELECTORS, budget_ms=budget_ms, browser_type="firefox")
+
+
+def refresh_flipkart_batch(urls: list[str], budget_ms: int | None = None) -> list[dict | None]:
+    return fetch_product_pages(urls, FLIPKART_SELECTORS, budget_ms=budget_ms)
+
+
+def refresh_amazon_batch(urls: list[str], budget_ms: int | None = None) -> list[dict | None]:
+    return fetch_product_pages(urls, AMAZON_SELECTORS, budget_ms=budget_ms)
+
+
+def refresh_croma_batch(urls: list[str], budget_ms: int | None = None) -> list[dict | None]:
+    return fetch_product_pages(urls, CROMA_SELECTORS, budget_ms=budget_ms)
+
+
+def refresh_reliancedigital_batch(urls: list[str], budget_ms: int | None = None) -> list[dict | None]:
+    return fetch_product_pages(urls, RELIANCE_SELECTORS, budget_ms=budget_ms, browser_type="firefox")
@@ -1,8 +1,11 @@
 from playwright.sync_api import sync_playwright
+from scrapers.utils import Budget, no_products
 import time
 
 
-def scrape_reliancedigital(query: str, max_products: int = 5) -> list[dict]:
+def scrape_reliancedigital(query: str, max_products: int = 5, budget_ms: int | None = None) -> list[dict] | None:
+    budget = Budget(budget_ms)
+
     start_time = time.time()
     try:
         with sync_playwright() as p:
@@ -24,14 +27,14 @@ def scrape_reliancedigital(query: str, max_products: int = 5) -> list[dict]:
             )
 
             page = context.new_page()
-            page.set_default_timeout(15000)
+            page.set_default_timeout(budget(15000))
 
             search_url = f"https://www.reliancedigital.in/products?q={query.replace(' ', '%20')}"
-            page.goto(search_url, wait_until="domcontentloaded", timeout=15000)
+            page.goto(search_url, wait_until="domcontentloaded", timeout=budget(15000))
 
-            page.wait_for_timeout(3000)
+            page.wait_for_timeout(budget(3000))
             page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            page.wait_for_timeout(2000)
+            page.wait_for_timeout(budget(2000))
 
             product_elements = page.query_selector_all(
                 'div.product-card div.card-info-container'
@@ -61,10 +64,12 @@ def scrape_reliancedigital(query: str, max_products: int = 5) -> list[dict]:
                 except:
                     continue
 
+            if not products:
+                products = no_products(page, budget)
             context.close()
             browser.close()
             print(f"Reliance completed in {time.time() - start_time:.1f}s")
             return products
     except Exception as e:
         print(f"Reliance error: {e}")
-        return []
+        raise  # let callers tell a failure apart from "no results"
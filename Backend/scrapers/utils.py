@@ -0,0 +1,56 @@
+import time
+
+
+# Text a search page shows when the query genuinely matched nothing
+NO_RESULTS_MARKERS = (
+    "no results for",
+    "no results found",
+    "sorry, no results",
+    "did not match any products",
+    "no products found",
+)
+
+
+class Budget:
+    """
+    What is left of a caller's deadline, for clamping Playwright waits
+
+    Deadline propagation: every navigation/readiness wait is clamped to
+    what is left of the caller's budget. Playwright treats 0 as "no
+    timeout", so a clamped wait is never shorter than 1 ms.
+    """
+
+    def __init__(self, budget_ms: int | None = None):
+        """Start the budget now (None means no deadline)"""
+        self.deadline = time.monotonic() + budget_ms / 1000 if budget_ms else None
+
+    def __call__(self, ms: int) -> int:
+        """`ms`, or what is left of the budget if that is less (>= 1)"""
+        if self.deadline is None:
+            return ms
+        return max(int(min(ms, (self.deadline - time.monotonic()) * 1000)), 1)
+
+    @property
+    def expired(self) -> bool:
+        """True once the deadline has passed"""
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+
+def no_products(page, budget: Budget) -> list | None:
+    """
+    Outcome of a search page that shows no product cards
+
+    Only a page that says the query matched nothing is a real empty
+    result ([]). A selector timeout, captcha, block page or a budget that
+    ran out cannot tell "no results" from "not loaded yet", so it is a
+    failure (None) and is never cached as empty.
+    """
+    if budget.expired:
+        return None
+    try:
+        text = page.inner_text("body", timeout=budget(2000)).lower()
+    except Exception:
+        return None
+    if any(marker in text for marker in NO_RESULTS_MARKERS):
+        return []
+    return None
@@ -1,6 +1,7 @@
-import { useState } from 'react';
+import { useEffect, useRef, useState } from 'react';
 
 const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000';
+const SUGGEST_DEBOUNCE_MS = 150;
 
 const ALL_SUGGESTIONS = [
   'iPhone 15 Pro Max',
@@ -23,8 +24,20 @@ export const useSearch = (onSearch) => {
   const [showSuggestions, setShowSuggestions] = useState(false);
   const [selectedSuggestion, setSelectedSuggestion] = useState(-1);
   const [error, setError] = useState(null);
+  const suggestTimer = useRef(null);
+  const suggestRequest = useRef(null);
+
+  // Drop the pending lookup and abort the one in flight
+  const cancelSuggest = () => {
+    clearTimeout(suggestTimer.current);
+    suggestRequest.current?.abort();
+    suggestRequest.current = null;
+  };
+
+  useEffect(() => cancelSuggest, []);
 
   const handleSearchChange = (value) => {
+    cancelSuggest();
     setSearchValue(value);
     setSelectedSuggestion(-1);
     setError(null);
@@ -35,6 +48,23 @@ export const useSearch = (onSearch) => {
       );
       setSuggestions(filtered.slice(0, 5));
       setShowSuggestions(true);
+
+      // Replace the local list with the backend's popularity-ranked suggestions
+      // once typing pauses; a newer keystroke aborts the older request
+      suggestTimer.current = setTimeout(() => {
+        const controller = new AbortController();
+        suggestRequest.current = controller;
+        fetch(`${API_URL}/api/suggest?q=${encodeURIComponent(value)}&limit=5`, {
+          signal: controller.signal,
+        })
+          .then((response) => (response.ok ? response.json() : null))
+          .then((data) => {
+            if (data?.success && data.suggestions.length > 0 && !controller.signal.aborted) {
+              setSuggestions(data.suggestions.map((s) => s.text));
+            }
+          })
+          .catch(() => {});
+      }, SUGGEST_DEBOUNCE_MS);
     } else {
       setSuggestions([]);
       setShowSuggestions(false);
@@ -49,6 +79,7 @@ export const useSearch = (onSearch) => {
       return;
     }
 
+    cancelSuggest();
     setIsSearching(true);
     setShowSuggestions(false);
     setError(null);
@@ -122,6 +153,7 @@ export const useSearch = (onSearch) => {
   };
 
   const clearSearch = () => {
+    cancelSuggest();
     setSearchValue('');
     setSuggestions([]);
     setShowSuggestions(false);
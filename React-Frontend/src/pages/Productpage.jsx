@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import { useSearchParams } from 'react-router-dom';
 import { motion } from 'framer-motion';
 import Navbar from '../components/Navbar/Navbar';
@@ -18,6 +18,17 @@ const extractPrice = (priceStr) => {
   return isNaN(num) ? 0 : num;
 };
 
+// Backend returns {flipkart: {...}, amazon: {...}} structure; add the
+// numeric flipkart_price, amazon_price... fields the filters work on
+const toProducts = (results) =>
+  results.map((result) => ({
+    ...result, // Keep all original data (flipkart, amazon, croma, reliancedigital objects)
+    flipkart_price: extractPrice(result.flipkart?.currentPrice || result.flipkart?.price),
+    amazon_price: extractPrice(result.amazon?.currentPrice || result.amazon?.price),
+    croma_price: extractPrice(result.croma?.currentPrice || result.croma?.price),
+    reliancedigital_price: extractPrice(result.reliancedigital?.currentPrice || result.reliancedigital?.price),
+  }));
+
 const ProductPage = () => {
   const [searchParams] = useSearchParams();
   const query = searchParams.get('q') || '';
@@ -34,6 +45,10 @@ const ProductPage = () => {
   });
   const [selectedProduct, setSelectedProduct] = useState(null);
   const [sidebarOpen, setSidebarOpen] = useState(true);
+  const streamRef = useRef(null);
+  // Results arrive after the fetch started: filter them with the filters
+  // in effect now, not the ones captured when the request was made
+  const filtersRef = useRef(filters);
 
   // Fetch products from backend
   useEffect(() => {
@@ -45,8 +60,50 @@ const ProductPage = () => {
     }
 
     fetchProducts();
+    return () => streamRef.current?.close();
   }, [query]);
 
+  // Stream the comparison: results show up as soon as the fastest platforms
+  // are in and are replaced as slower ones arrive. Resolves false if the
+  // stream broke before any results, so the caller can fall back.
+  const streamProducts = (cleanQuery) =>
+    new Promise((resolve) => {
+      streamRef.current?.close();
+      const source = new EventSource(
+        `${import.meta.env.VITE_API_URL}/api/compare/stream?query=${encodeURIComponent(cleanQuery)}&limit=10`
+      );
+      streamRef.current = source;
+      let received = false;
+
+      source.addEventListener('matches', (event) => {
+        const data = JSON.parse(event.data);
+        console.log('✅ Streamed matches:', data.count, 'from', data.platforms);
+        received = true;
+        const transformedResults = toProducts(data.results);
+        setProducts(transformedResults);
+        applyFilters(transformedResults, filtersRef.current);
+        setLoading(false);
+      });
+
+      source.addEventListener('done', (event) => {
+        const data = JSON.parse(event.data);
+        console.log('✅ Stream done:', data.platform_status);
+        source.close();
+        if (!received) {
+          setProducts([]);
+          setFilteredProducts([]);
+        }
+        setLoading(false);
+        resolve(true);
+      });
+
+      // EventSource would reconnect and rerun the comparison: stop instead
+      source.onerror = () => {
+        source.close();
+        resolve(received);
+      };
+    });
+
   // ✅ FIXED: Call new /api/compare endpoint with correct params
   const fetchProducts = async () => {
     setLoading(true);
@@ -62,6 +119,10 @@ const ProductPage = () => {
       return;
     }
     
+    if (window.EventSource && (await streamProducts(cleanQuery))) {
+      return;
+    }
+
     try {
       console.log('🔍 Fetching from backend:', cleanQuery);
       
@@ -88,29 +149,10 @@ const ProductPage = () => {
         return;
       }
       
-      // ✅ TRANSFORM: Backend returns {flipkart: {...}, amazon: {...}} structure
-      // Frontend expects flipkart_price, amazon_price numeric fields
-      const transformedResults = data.results.map((result, idx) => {
-        const flipkart_price = extractPrice(result.flipkart?.currentPrice || result.flipkart?.price);
-        const amazon_price = extractPrice(result.amazon?.currentPrice || result.amazon?.price);
-        const croma_price = extractPrice(result.croma?.currentPrice || result.croma?.price);
-        const reliancedigital_price = extractPrice(result.reliancedigital?.currentPrice || result.reliancedigital?.price);
-        
-        console.log(`Product ${idx}:`, { flipkart_price, amazon_price, croma_price, reliancedigital_price });
-        
-        return {
-          ...result, // Keep all original data (flipkart, amazon, croma, reliancedigital objects)
-          // Add numeric price fields for filtering
-          flipkart_price,
-          amazon_price,
-          croma_price,
-          reliancedigital_price,
-        };
-      });
-      
+      const transformedResults = toProducts(data.results);
       console.log('✅ Transformed products:', transformedResults.length);
       setProducts(transformedResults);
-      applyFilters(transformedResults, filters);
+      applyFilters(transformedResults, filtersRef.current);
     } catch (err) {
       console.error('❌ Search error:', err);
       setError(err.message);
@@ -195,6 +237,7 @@ const ProductPage = () => {
   };
 
   const handleFilterChange = (newFilters) => {
+    filtersRef.current = newFilters;
     setFilters(newFilters);
     applyFilters(products, newFilters);
   };